@@ -3,6 +3,8 @@
 import logging
 import json
 import hashlib
+import threading
+from contextlib import contextmanager
 from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime, timezone
 from pathlib import Path
@@ -14,12 +16,29 @@ from local.config.config import AppConfig
 
 logger = logging.getLogger(__name__)
 
+# Buffered Bronze rows that trigger a flush inside batch()
+_BATCH_FLUSH_EVERY = 100
+
 
 class AdapterManager:
     """Manages adapters for data ingestion with structured logging and DB integration."""
 
     def __init__(self, db_core: Optional[DatabaseCore] = None):
         self.db_core = db_core or DatabaseCore(AppConfig.DB_PATH)
+        # ingest_asset may run on several threads at once: SQLite takes one
+        # writer at a time, and the stats counters are shared
+        self._write_lock = threading.RLock()
+        self._stats_lock = threading.Lock()
+        # Writes buffered while batch() is active
+        self._batching = False
+        self._pending_entries: List[str] = []
+        # Bronze rows with the result dicts ingest_asset returned for them,
+        # which flush() settles once the rows commit
+        self._pending_rows: List[Tuple[str, str, str, str, Dict[str, Any]]] = []
+        self._pending_hashes: set = set()
+        # Adapters keep their HTTP session between calls, so reuse one per
+        # source; per thread, as requests.Session isn't documented thread-safe
+        self._adapters = threading.local()
         self.ingestion_stats = {
             'total_processed': 0,
             'successful': 0,
@@ -28,12 +47,17 @@ class AdapterManager:
             'errors': []
         }
 
-    def ingest_asset(self, catalog_key: str, dry_run: bool = False) -> Dict[str, Any]:
+    def ingest_asset(self, catalog_key: str, dry_run: bool = False,
+                     catalog_entry: Optional[Any] = None,
+                     watermarks: Optional[Dict[str, datetime]] = None) -> Dict[str, Any]:
         """Ingest a single asset by catalog_key with full error handling.
 
         Args:
             catalog_key: The catalog key to ingest
             dry_run: If True, only test connectivity without storing
+            catalog_entry: The asset's data_catalog row, if the caller already loaded it
+            watermarks: Last ingested timestamps prefetched for the batch
+                (see get_last_ingested_many); keys missing were never ingested
 
         Returns:
             Dictionary with ingestion results
@@ -50,16 +74,21 @@ class AdapterManager:
 
         try:
             # Get catalog entry
-            catalog_entry = self.db_core.catalog.get_by_key(catalog_key)
+            if catalog_entry is None:
+                catalog_entry = self.db_core.catalog.get_by_key(catalog_key)
             if not catalog_entry:
                 result['status'] = 'failed'
                 result['error'] = f"Catalog key not found: {catalog_key}"
-                self.ingestion_stats['failed'] += 1
-                logger.error(f"[{catalog_key}] Catalog entry not found")
+                self._count('failed')
+                logger.error("[%s] Catalog entry not found", catalog_key)
                 return result
 
             # Ensure watermark entry exists
-            self.db_core.watermarks.ensure_entry(catalog_key)
+            with self._write_lock:
+                if self._batching:
+                    self._pending_entries.append(catalog_key)
+                else:
+                    self.db_core.watermarks.ensure_entry(catalog_key)
 
             # Build ingestion context
             config_params = json.loads(catalog_entry['config_params']) if isinstance(catalog_entry['config_params'], str) else catalog_entry['config_params']
@@ -80,7 +109,10 @@ class AdapterManager:
                 # Parse comma-separated keywords into list
                 config_params['keywords'] = [k.strip() for k in search_keywords.split(',') if k.strip()]
             
-            last_ingested = self.db_core.watermarks.get_last_ingested(catalog_key)
+            if watermarks is None:
+                last_ingested = self.db_core.watermarks.get_last_ingested(catalog_key)
+            else:
+                last_ingested = watermarks.get(catalog_key)
 
             context = IngestionContext(
                 catalog_key=catalog_key,
@@ -92,14 +124,14 @@ class AdapterManager:
             )
 
             # Create adapter
-            adapter = create_adapter(context.source_api)
+            adapter = self._get_adapter(context.source_api)
 
             # Validate configuration
             if not adapter.validate_config(context.config_params):
                 result['status'] = 'failed'
                 result['error'] = f"Invalid config for {context.source_api}: {context.config_params}"
-                self.ingestion_stats['failed'] += 1
-                logger.error(f"[{catalog_key}] Invalid adapter config")
+                self._count('failed')
+                logger.error("[%s] Invalid adapter config", catalog_key)
                 return result
 
             # Dry run test
@@ -107,11 +139,11 @@ class AdapterManager:
                 can_fetch = adapter.dry_run(context)
                 result['status'] = 'dry_run_passed' if can_fetch else 'dry_run_failed'
                 if not can_fetch:
-                    self.ingestion_stats['skipped'] += 1
-                    logger.info(f"[{catalog_key}] Dry run failed - no data available")
+                    self._count('skipped')
+                    logger.info("[%s] Dry run failed - no data available", catalog_key)
                 else:
-                    self.ingestion_stats['successful'] += 1
-                    logger.info(f"[{catalog_key}] Dry run passed")
+                    self._count('successful')
+                    logger.info("[%s] Dry run passed", catalog_key)
                 return result
 
             # Fetch raw data
@@ -121,43 +153,133 @@ class AdapterManager:
             result['raw_payload'] = raw_payload
             result['request_hash'] = request_hash
 
-            # Check if already ingested (idempotency)
-            if self.db_core.raw_ingestion.exists(request_hash):
-                result['status'] = 'skipped'
-                result['stored'] = False
-                self.ingestion_stats['skipped'] += 1
-                logger.info(f"[{catalog_key}] Already ingested (idempotent skip)")
-                return result
+            with self._write_lock:
+                # Check if already ingested (idempotency), including rows
+                # still buffered by batch()
+                if request_hash in self._pending_hashes or self.db_core.raw_ingestion.exists(request_hash):
+                    result['status'] = 'skipped'
+                    result['stored'] = False
+                    self._count('skipped')
+                    logger.info("[%s] Already ingested (idempotent skip)", catalog_key)
+                    return result
+
+                if self._batching:
+                    # Stored (with its watermark update) by the next flush();
+                    # the result stays 'pending' until then
+                    self._pending_rows.append((request_hash, catalog_key, context.source_api, raw_payload, result))
+                    self._pending_hashes.add(request_hash)
+                    if len(self._pending_rows) >= _BATCH_FLUSH_EVERY:
+                        self.flush()
+                else:
+                    # Store raw payload in Bronze layer
+                    self.db_core.raw_ingestion.insert_or_ignore(
+                        request_hash,
+                        catalog_key,
+                        context.source_api,
+                        raw_payload
+                    )
+
+                    # Update watermark
+                    self.db_core.watermarks.update_ingested(catalog_key)
+
+                    result['status'] = 'success'
+                    result['stored'] = True
+                    self._count('successful')
+                    logger.info("[%s] Successfully ingested and stored", catalog_key)
 
-            # Store raw payload in Bronze layer
-            self.db_core.raw_ingestion.insert_or_ignore(
-                request_hash,
-                catalog_key,
-                context.source_api,
-                raw_payload
-            )
+        except Exception as e:
+            self._fail(result, catalog_key, e)
+            logger.error("[%s] Ingestion failed: %s", catalog_key, e, exc_info=True)
 
-            # Update watermark
-            self.db_core.watermarks.update_ingested(catalog_key)
+        self._count('total_processed')
+        return result
 
-            result['status'] = 'success'
-            result['stored'] = True
-            self.ingestion_stats['successful'] += 1
-            logger.info(f"[{catalog_key}] Successfully ingested and stored")
+    @contextmanager
+    def batch(self):
+        """Buffer watermark and Bronze writes and commit them in one transaction.
 
-        except Exception as e:
-            result['status'] = 'failed'
-            result['error'] = str(e)
-            self.ingestion_stats['failed'] += 1
+        Flushes every _BATCH_FLUSH_EVERY buffered Bronze rows and on exit. The
+        results of buffered assets stay 'pending' until their rows commit; if
+        an exception escapes the block, writes not yet flushed are discarded
+        and their results marked failed.
+        """
+        self._batching = True
+        try:
+            yield self
+            self.flush()
+        finally:
+            with self._write_lock:
+                self._batching = False
+                for _, catalog_key, _, _, result in self._pending_rows:
+                    self._fail(result, catalog_key, 'Batch aborted before its rows were stored')
+                self._pending_entries.clear()
+                self._pending_rows.clear()
+                self._pending_hashes.clear()
+
+    def flush(self):
+        """Write buffered watermark entries, Bronze rows and watermark updates.
+
+        Settles the results of the buffered assets: success once the
+        transaction commits, failed if it rolls back. The error is not raised,
+        so an asset whose ingest_asset call triggers the flush is not blamed
+        for the whole batch.
+        """
+        with self._write_lock:
+            if not self._pending_entries and not self._pending_rows:
+                return
+
+            pending_rows = list(self._pending_rows)
+            try:
+                with self.db_core.session.transaction():
+                    for catalog_key in self._pending_entries:
+                        self.db_core.watermarks.ensure_entry(catalog_key)
+                    for request_hash, catalog_key, source_api, raw_payload, _ in pending_rows:
+                        self.db_core.raw_ingestion.insert_or_ignore(
+                            request_hash, catalog_key, source_api, raw_payload
+                        )
+                        self.db_core.watermarks.update_ingested(catalog_key)
+            except Exception as e:
+                logger.error("Batch flush of %d rows failed: %s", len(pending_rows), e, exc_info=True)
+                for _, catalog_key, _, _, result in pending_rows:
+                    self._fail(result, catalog_key, e)
+            else:
+                for _, catalog_key, _, _, result in pending_rows:
+                    result['status'] = 'success'
+                    result['stored'] = True
+                    self._count('successful')
+                    logger.info("[%s] Successfully ingested and stored", catalog_key)
+            finally:
+                self._pending_entries.clear()
+                self._pending_rows.clear()
+                self._pending_hashes.clear()
+
+    def _fail(self, result: Dict[str, Any], catalog_key: str, error: Any):
+        """Mark result failed and record the error in ingestion_stats."""
+        result['status'] = 'failed'
+        result['stored'] = False
+        result['error'] = str(error)
+        self._count('failed')
+        with self._stats_lock:
             self.ingestion_stats['errors'].append({
                 'catalog_key': catalog_key,
-                'error': str(e),
+                'error': str(error),
                 'timestamp': datetime.now(timezone.utc).isoformat()
             })
-            logger.error(f"[{catalog_key}] Ingestion failed: {e}", exc_info=True)
 
-        self.ingestion_stats['total_processed'] += 1
-        return result
+    def _get_adapter(self, source_api: str):
+        """Return this thread's cached adapter for source_api, creating it on first use."""
+        cache = getattr(self._adapters, 'cache', None)
+        if cache is None:
+            cache = self._adapters.cache = {}
+        adapter = cache.get(source_api)
+        if adapter is None:
+            adapter = cache[source_api] = create_adapter(source_api)
+        return adapter
+
+    def _count(self, stat: str):
+        """Increment an ingestion_stats counter."""
+        with self._stats_lock:
+            self.ingestion_stats[stat] += 1
 
     def ingest_batch(self, catalog_keys: Optional[List[str]] = None, dry_run: bool = False, limit: Optional[int] = None) -> Dict[str, Any]:
         """Ingest multiple assets with batch orchestration.
@@ -204,7 +326,8 @@ class AdapterManager:
             'errors': self.ingestion_stats['errors']
         }
 
-        logger.info(f"Batch ingestion complete: {self.ingestion_stats['successful']}/{self.ingestion_stats['total_processed']} successful")
+        logger.info("Batch ingestion complete: %d/%d successful",
+                    self.ingestion_stats['successful'], self.ingestion_stats['total_processed'])
         return summary
 
     def get_statistics(self) -> Dict[str, Any]:
@@ -2,6 +2,7 @@
 from .database_core import (
     DatabaseCore,
     DatabaseSession,
+    SQLiteConnectionPool,
     DataCatalogOperations,
     SyncWatermarkOperations,
     RawIngestionOperations,
@@ -12,6 +13,7 @@ from .database_core import (
 __all__ = [
     'DatabaseCore',
     'DatabaseSession',
+    'SQLiteConnectionPool',
     'DataCatalogOperations',
     'SyncWatermarkOperations',
     'RawIngestionOperations',
@@ -2,14 +2,31 @@
 
 import sqlite3
 import logging
+import queue
 import threading
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
 
+# Bound parameters per IN (...) query, under SQLite's default 999-variable limit
+MAX_SQL_PARAMS = 900
+
+
+def parse_utc_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO timestamp from sync_watermarks, treating naive timestamps as UTC."""
+    if not value:
+        return None
+    try:
+        dt = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
 
 class DatabaseSession:
     """Manages SQLite database connections with context manager support."""
@@ -55,14 +72,65 @@ class DatabaseSession:
 
     @contextmanager
     def transaction(self):
-        """Context manager for database transactions."""
+        """Context manager for database transactions.
+
+        Nested blocks join the outermost one, which alone commits or rolls back.
+        """
+        depth = getattr(self._local, 'depth', 0)
+        self._local.depth = depth + 1
         try:
             yield self
-            self.commit()
+            if depth == 0:
+                self.commit()
         except Exception as e:
-            self.rollback()
-            logger.error(f"Transaction failed: {e}")
+            if depth == 0:
+                self.rollback()
+                logger.error(f"Transaction failed: {e}")
             raise
+        finally:
+            self._local.depth = depth
+
+
+class SQLiteConnectionPool:
+    """Bounded pool of reusable SQLite connections, tuned once when opened."""
+
+    def __init__(self, db_path: Path, max_size: int = 4):
+        self.db_path = str(db_path)
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=max_size)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+
+    @contextmanager
+    def acquire(self):
+        """Borrow a connection; uncommitted work is rolled back on error."""
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+
+        try:
+            yield conn
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            try:
+                self._idle.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+
+    def close(self):
+        """Close all idle connections."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
 
 
 class DataCatalogOperations:
@@ -102,6 +170,29 @@ class DataCatalogOperations:
         """)
         return cursor.fetchall()
 
+    def get_active_filtered(self, scope: Optional[str] = None, role: Optional[str] = None,
+                            limit: Optional[int] = None):
+        """Get active catalog entries matching scope and/or role, in get_active() order.
+
+        Rows carry every data_catalog column, like get_by_key(); limit caps
+        the number returned.
+        """
+        query = "SELECT * FROM data_catalog WHERE is_active = 1"
+        params = []
+        if scope is not None:
+            query += " AND scope = ?"
+            params.append(scope)
+        if role is not None:
+            query += " AND role = ?"
+            params.append(role)
+        query += " ORDER BY source_api, catalog_key"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        cursor = self.session.execute(query, tuple(params))
+        return cursor.fetchall()
+
     def get_inactive(self):
         """Get all inactive catalog entries."""
         cursor = self.session.execute("""
@@ -194,15 +285,26 @@ class SyncWatermarkOperations:
             SELECT last_ingested_at FROM sync_watermarks WHERE catalog_key = ?
         """, (catalog_key,))
         result = cursor.fetchone()
-        if result and result[0]:
-            try:
-                dt = datetime.fromisoformat(result[0])
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=timezone.utc)
-                return dt
-            except ValueError:
-                return None
-        return None
+        return parse_utc_timestamp(result[0]) if result else None
+
+    def get_last_ingested_many(self, catalog_keys: List[str]) -> Dict[str, datetime]:
+        """Get last ingested timestamps for many keys in a few queries.
+
+        Keys that were never ingested (or have no watermark) are left out, so
+        .get() on the result matches get_last_ingested().
+        """
+        last_ingested = {}
+        for start in range(0, len(catalog_keys), MAX_SQL_PARAMS):
+            chunk = catalog_keys[start:start + MAX_SQL_PARAMS]
+            cursor = self.session.execute(f"""
+                SELECT catalog_key, last_ingested_at FROM sync_watermarks
+                WHERE catalog_key IN ({', '.join('?' * len(chunk))})
+            """, tuple(chunk))
+            for catalog_key, value in cursor:
+                dt = parse_utc_timestamp(value)
+                if dt is not None:
+                    last_ingested[catalog_key] = dt
+        return last_ingested
 
 
 class RawIngestionOperations:
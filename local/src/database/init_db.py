@@ -8,110 +8,173 @@ then creates tables and populates data_catalog with asset definitions.
 import os
 import re
 import json
+import mmap
 import sqlite3
 import logging
-from typing import List, Dict, Any
+import zlib
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Dict, Any, Optional
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# File locations, resolved once at import time
+_HERE = Path(__file__).resolve().parent
+_DOC_PATH = _HERE.parent.parent.parent / 'docs' / 'Phase4_DataModel.md'
+_DATA_DIR = _HERE.parent.parent / 'local' / 'data'
+_DB_PATH = _DATA_DIR / 'heimdall.db'
+_DOC_CACHE_PATH = _DATA_DIR / '.datamodel_cache.json'
+
+# Bump when the parser's output changes to invalidate old caches
+_DOC_CACHE_VERSION = 3
+
+# Patterns used by parse_datamodel_doc, compiled once at import time.
+# The section patterns are bytes so they can scan the mmap'd file directly.
+_DDL_SECTION_RE = re.compile(r'3\. 物理 Schema 定义.*?(?=4\.|5\.|$)'.encode('utf-8'), re.DOTALL)
+_CREATE_TABLE_RE = re.compile(r'CREATE TABLE.*?;', re.DOTALL)
+_REGISTRY_RE = re.compile(r'5\. 全量资产定义矩阵.*?(?=6\.|$)'.encode('utf-8'), re.DOTALL)
+_REGISTRY_HEADER_RE = re.compile(r'^.*\| Catalog Key \|.*$', re.MULTILINE)
+_REGISTRY_ROW_RE = re.compile(r'^[ \t]*\|(.*)\|[ \t\r]*$', re.MULTILINE)
+_TABLE_NAME_RE = re.compile(r'CREATE TABLE(?: IF NOT EXISTS)? (\w+)', re.IGNORECASE)
+
+# Small natural-key tables stored directly in their primary-key B-tree.
+# raw_ingestion_cache and news_intel_pool keep a rowid: their rows carry
+# large payloads, which SQLite advises against for WITHOUT ROWID tables.
+_WITHOUT_ROWID_TABLES = frozenset({'data_catalog', 'sync_watermarks'})
+
+# Registry role column accepts short forms
+_ROLE_MAP = {'J': 'JUDGMENT', 'V': 'VALIDATION', 'JUDGMENT': 'JUDGMENT', 'VALIDATION': 'VALIDATION'}
+
+# Create a watermark row for every catalog entry directly inside SQLite
+_SEED_WATERMARKS_SQL = '''
+INSERT OR IGNORE INTO sync_watermarks (catalog_key)
+SELECT catalog_key FROM data_catalog
+'''
+
+# Indexes behind the pipelines' hot queries. get_active_catalog_tasks: a
+# partial index returning the active catalog already in (source_api,
+# catalog_key) order, and a narrow covering index so the watermark read
+# skips the wide table rows. CleaningPipeline: per-source Bronze scans
+# ordered by inserted_at, and the last_cleaned_at watermark join.
+_INDEX_STATEMENTS = (
+    ('data_catalog', '''CREATE INDEX IF NOT EXISTS idx_dc_active
+    ON data_catalog(source_api, catalog_key) WHERE is_active = 1'''),
+    ('sync_watermarks', '''CREATE INDEX IF NOT EXISTS idx_sw_ck
+    ON sync_watermarks(catalog_key, last_ingested_at)'''),
+    ('raw_ingestion_cache', '''CREATE INDEX IF NOT EXISTS idx_ric_source_inserted
+    ON raw_ingestion_cache(source_api, inserted_at, catalog_key)'''),
+    ('sync_watermarks', '''CREATE INDEX IF NOT EXISTS idx_sw_catalog_cleaned
+    ON sync_watermarks(catalog_key, last_cleaned_at)'''),
+)
+
 
 def parse_datamodel_doc() -> Dict[str, Any]:
-    """Parse docs/Phase4_DataModel.md to extract DDL and seed data."""
-    doc_path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'docs', 'Phase4_DataModel.md')
+    """Parse docs/Phase4_DataModel.md to extract DDL and seed data.
+
+    The result is cached on disk keyed by the document's size and mtime, so an
+    unchanged document costs a stat and a small JSON read, and in memory for
+    the rest of the process. Set HEIMDALL_NO_CACHE=1 to bypass the disk cache.
+    Callers must treat the returned structure as read-only.
+    """
+    return _parse_datamodel_for(datamodel_signature())
+
+
+@lru_cache(maxsize=1)
+def _parse_datamodel_for(signature: str) -> Dict[str, Any]:
+    """Parse the document version identified by signature, via the disk cache."""
+    use_disk_cache = os.getenv("HEIMDALL_NO_CACHE") != "1"
+
+    parsed_data = _load_doc_cache(signature) if use_disk_cache else None
+    if parsed_data is None:
+        parsed_data = _parse_datamodel_file()
+        if use_disk_cache:
+            _store_doc_cache(signature, parsed_data)
+    return parsed_data
+
 
+def datamodel_signature() -> str:
+    """Fingerprint Phase4_DataModel.md by size and mtime to key parse caches."""
+    try:
+        stat = _DOC_PATH.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Phase4_DataModel.md not found at {_DOC_PATH}")
+    return f"{_DOC_CACHE_VERSION}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _load_doc_cache(signature: str) -> Optional[Dict[str, Any]]:
+    """Return the cached parse result if it matches the document signature."""
+    try:
+        with open(_DOC_CACHE_PATH, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get('signature') != signature:
+            return None
+        parsed_data = cache['parsed']
+        return {
+            'ddl_statements': parsed_data['ddl_statements'],
+            'seed_data': [tuple(row) for row in parsed_data['seed_data']]
+        }
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _store_doc_cache(signature: str, parsed_data: Dict[str, Any]):
+    """Write the parse result to the on-disk cache (best effort, atomic replace)."""
+    tmp_path = _DOC_CACHE_PATH.with_suffix('.tmp')
     try:
-        with open(doc_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        _DATA_DIR.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'signature': signature, 'parsed': parsed_data}, f, ensure_ascii=False)
+        os.replace(tmp_path, _DOC_CACHE_PATH)
+    except OSError as e:
+        logger.debug(f"Could not write data model cache: {e}")
+
+
+def _parse_datamodel_file() -> Dict[str, Any]:
+    """Extract DDL and seed data from the document itself."""
+    # Scan the file's pages directly; only the matched sections get decoded
+    ddl_section = registry_section = None
+    try:
+        with open(_DOC_PATH, 'rb') as f:
+            if os.fstat(f.fileno()).st_size > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    ddl_match = _DDL_SECTION_RE.search(content)
+                    registry_match = _REGISTRY_RE.search(content)
+                    # Copy the matched bytes out before the mapping is closed
+                    ddl_section = ddl_match.group(0) if ddl_match else None
+                    registry_section = registry_match.group(0) if registry_match else None
     except FileNotFoundError:
-        raise FileNotFoundError(f"Phase4_DataModel.md not found at {doc_path}")
+        raise FileNotFoundError(f"Phase4_DataModel.md not found at {_DOC_PATH}")
 
     # Extract SQL DDL from section 3
-    ddl_section = re.search(r'3\. 物理 Schema 定义.*?(?=4\.|5\.|$)', content, re.DOTALL)
     if not ddl_section:
         raise ValueError("Could not find SQL DDL section in Phase4_DataModel.md")
 
-    ddl_content = ddl_section.group(0)
+    ddl_content = ddl_section.decode('utf-8')
 
     # Extract individual CREATE TABLE statements
     table_statements = []
-    create_matches = re.findall(r'CREATE TABLE.*?;', ddl_content, re.DOTALL)
+    create_matches = _CREATE_TABLE_RE.findall(ddl_content)
     for match in create_matches:
-        # Clean up the statement
-        statement = match.strip()
-        # Handle multi-line comments
-        statement = re.sub(r'--.*$', '', statement, flags=re.MULTILINE)
-        statement = ' '.join(statement.split())  # Normalize whitespace
+        # Drop -- comments line by line and normalize whitespace
+        statement = ' '.join(
+            word for line in match.splitlines()
+            for word in line.partition('--')[0].split()
+        )
+        # main() re-runs the DDL on an existing database when the document
+        # changes, which then creates only the tables added since
+        if not statement.upper().startswith('CREATE TABLE IF NOT EXISTS'):
+            statement = 'CREATE TABLE IF NOT EXISTS' + statement[len('CREATE TABLE'):]
+        table_match = _TABLE_NAME_RE.search(statement)
+        if (table_match and table_match.group(1) in _WITHOUT_ROWID_TABLES
+                and 'WITHOUT ROWID' not in statement.upper()):
+            statement = statement[:-1].rstrip() + ' WITHOUT ROWID;'
         table_statements.append(statement)
 
     # Extract seed data from section 5
     seed_data = []
-    registry_section = re.search(r'5\. 全量资产定义矩阵.*?(?=6\.|$)', content, re.DOTALL)
-
     if registry_section:
-        registry_content = registry_section.group(0)
-
-        # Simple line-by-line parsing for table rows
-        lines = registry_content.split('\n')
-        in_table = False
-
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith('$') or line.startswith('| ---'):
-                continue
-
-            # Check if this is a table header
-            if '| Catalog Key |' in line:
-                in_table = True
-                continue
-
-            # Parse data rows (lines starting and ending with |)
-            if in_table and line.startswith('|') and line.endswith('|') and '|' in line:
-                parts = [part.strip() for part in line.split('|')[1:-1]]  # Remove first and last empty parts
-
-                if len(parts) >= 9 and parts[0] and not parts[0].startswith('-'):
-                    catalog_key, country, scope, role, entity_name, source_api, frequency, config_params, search_keywords = parts[:9]
-
-                    # Clean and validate data
-                    catalog_key = catalog_key.strip()
-                    country = country.strip()
-                    scope = scope.strip().upper()
-                    role = role.strip().upper()
-                    entity_name = entity_name.strip()
-                    source_api = source_api.strip()
-                    frequency = frequency.strip()
-                    config_params = config_params.strip()
-                    search_keywords = search_keywords.strip()
-
-                    # Skip if any required field is empty or invalid
-                    if not all([catalog_key, country, scope, role, entity_name, source_api, frequency]):
-                        continue
-
-                    # Validate role enum (handle short forms)
-                    role_map = {'J': 'JUDGMENT', 'V': 'VALIDATION', 'JUDGMENT': 'JUDGMENT', 'VALIDATION': 'VALIDATION'}
-                    if role not in role_map:
-                        logger.warning(f"Invalid role '{role}' for {catalog_key}, skipping")
-                        continue
-                    role = role_map[role]
-
-                    # Parse config_params JSON
-                    try:
-                        config_params_json = json.loads(config_params)
-                    except json.JSONDecodeError:
-                        logger.warning(f"Invalid JSON in config_params for {catalog_key}: {config_params}, skipping")
-                        continue
-
-                    seed_data.append({
-                        'catalog_key': catalog_key,
-                        'country': country,
-                        'scope': scope,
-                        'role': role,
-                        'entity_name': entity_name,
-                        'source_api': source_api,
-                        'frequency': frequency,
-                        'config_params': json.dumps(config_params_json),
-                        'search_keywords': search_keywords
-                    })
+        seed_data = list(_iter_registry_rows(registry_section.decode('utf-8')))
 
     return {
         'ddl_statements': table_statements,
@@ -119,14 +182,73 @@ def parse_datamodel_doc() -> Dict[str, Any]:
     }
 
 
-def create_tables_from_doc(cursor):
-    """Create tables by parsing Phase4_DataModel.md document."""
+def _iter_registry_rows(registry_content: str):
+    """Yield data_catalog row tuples from the asset registry markdown table.
+
+    Each tuple is (catalog_key, country, scope, role, entity_name, source_api,
+    frequency, config_params, search_keywords), ready for executemany.
+    """
+    # Rows are only read after the table header
+    header = _REGISTRY_HEADER_RE.search(registry_content)
+    if not header:
+        return
+
+    json_loads = json.loads
+    pos = header.end()
+
+    for row in _REGISTRY_ROW_RE.finditer(registry_content, pos):
+        # Prose between rows means the table has ended; blank and '$' lines
+        # inside the table are tolerated
+        gap = registry_content[pos:row.start()]
+        if gap and not gap.isspace() and any(
+                line.strip()[:1] not in ('', '$') for line in gap.split('\n')):
+            break
+        pos = row.end()
+
+        parts = [part.strip() for part in row.group(1).split('|')]
+        # Skip separator rows, repeated headers and short rows
+        if len(parts) < 9 or parts[0][:1] == '-' or parts[0] == 'Catalog Key':
+            continue
+
+        catalog_key, country, scope, role, entity_name, source_api, frequency, config_params, search_keywords = parts[:9]
+
+        # Skip if any required field is empty
+        if not all(parts[:7]):
+            continue
+
+        # Validate role enum (handle short forms)
+        role = role.upper()
+        if role not in _ROLE_MAP:
+            logger.warning(f"Invalid role '{role}' for {catalog_key}, skipping")
+            continue
+
+        # Validate config_params JSON; the source text is stored as-is since
+        # every reader json.loads it again anyway
+        try:
+            json_loads(config_params)
+        except json.JSONDecodeError:
+            logger.warning(f"Invalid JSON in config_params for {catalog_key}: {config_params}, skipping")
+            continue
+
+        yield (
+            catalog_key, country, scope.upper(), _ROLE_MAP[role], entity_name,
+            source_api, frequency, config_params, search_keywords
+        )
+
+
+def create_tables_from_doc(cursor, parsed_data: Optional[Dict[str, Any]] = None):
+    """Create tables by parsing Phase4_DataModel.md document.
+
+    Pass an already parsed document to avoid reading the file again.
+    """
     try:
-        parsed_data = parse_datamodel_doc()
+        if parsed_data is None:
+            parsed_data = parse_datamodel_doc()
         ddl_statements = parsed_data['ddl_statements']
 
-        for ddl in ddl_statements:
-            cursor.execute(ddl)
+        # One script, one trip through SQLite's parser. Note executescript
+        # commits any open transaction before running.
+        cursor.executescript('\n'.join(ddl_statements))
 
         logger.info(f"Created {len(ddl_statements)} tables from document parsing")
         return True
@@ -196,7 +318,7 @@ def create_tables(cursor):
         config_params JSON DEFAULT '{}',
         search_keywords TEXT,
         is_active INTEGER DEFAULT 1
-    )
+    ) WITHOUT ROWID
     ''')
 
     # Create sync_watermarks table
@@ -209,14 +331,25 @@ def create_tables(cursor):
         last_meta_synced_at TIMESTAMP,
         checksum TEXT,
         FOREIGN KEY(catalog_key) REFERENCES data_catalog(catalog_key)
-    )
+    ) WITHOUT ROWID
     ''')
 
     logger.info("All database tables created successfully")
 
 
-def seed_catalog_from_doc(cursor):
-    """Seed the data_catalog and sync_watermarks tables from parsed document."""
+def create_indexes(cursor):
+    """Create the query indexes on whichever of their tables exist (idempotent)."""
+    existing = {row[0] for row in cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    for table_name, statement in _INDEX_STATEMENTS:
+        if table_name in existing:
+            cursor.execute(statement)
+
+
+def seed_catalog_from_doc(cursor, parsed_data: Optional[Dict[str, Any]] = None):
+    """Seed the data_catalog and sync_watermarks tables from parsed document.
+
+    Pass an already parsed document to avoid reading the file again.
+    """
     # Check if data already exists
     cursor.execute("SELECT COUNT(*) FROM data_catalog")
     count = cursor.fetchone()[0]
@@ -227,27 +360,20 @@ def seed_catalog_from_doc(cursor):
     logger.info("Seeding data_catalog and sync_watermarks from document parsing...")
 
     try:
-        parsed_data = parse_datamodel_doc()
+        if parsed_data is None:
+            parsed_data = parse_datamodel_doc()
         seed_data = parsed_data['seed_data']
 
         # Seed data_catalog with INSERT OR REPLACE for idempotency
-        for item in seed_data:
-            cursor.execute('''
-            INSERT OR REPLACE INTO data_catalog (
-                catalog_key, country, scope, role, entity_name, source_api,
-                update_frequency, config_params, search_keywords, is_active
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
-            ''', (
-                item['catalog_key'], item['country'], item['scope'], item['role'],
-                item['entity_name'], item['source_api'], item['frequency'],
-                item['config_params'], item['search_keywords']
-            ))
+        cursor.connection.executemany('''
+        INSERT OR REPLACE INTO data_catalog (
+            catalog_key, country, scope, role, entity_name, source_api,
+            update_frequency, config_params, search_keywords, is_active
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
+        ''', seed_data)
 
         # Seed sync_watermarks with catalog_keys (watermarks start as NULL)
-        catalog_keys = [(item['catalog_key'],) for item in seed_data]
-        cursor.executemany('''
-        INSERT INTO sync_watermarks (catalog_key) VALUES (?)
-        ''', catalog_keys)
+        cursor.execute(_SEED_WATERMARKS_SQL)
 
         logger.info(f"Successfully seeded {len(seed_data)} entries into data_catalog and sync_watermarks from document.")
 
@@ -256,6 +382,72 @@ def seed_catalog_from_doc(cursor):
         raise
 
 
+# Fallback catalog rows used when Phase4_DataModel.md cannot be parsed
+_HARDCODED_SEED_DATA = (
+    # 1. 宏观全景 (Macro Panorama) - US
+    ('METRIC_US_NET_LIQUIDITY', 'US', 'MACRO', 'J', 'US Net Liquidity', 'FRED', 'Monthly', '{"series": ["WALCL", "WTREGEN", "RRPONTSYD"]}', 'Fed, Liquidity, Balance Sheet'),
+    ('METRIC_US_ISM_PMI', 'US', 'MACRO', 'J', 'ISM Manufacturing PMI', 'FRED', 'Monthly', '{"series": "IPMAN"}', 'Industrial Production, Manufacturing, Economy'),
+    ('METRIC_US_CORE_PCE', 'US', 'MACRO', 'J', 'Core PCE (YoY)', 'FRED', 'Monthly', '{"series": "PCEPILFE"}', 'PCE, Inflation, Fed'),
+    ('METRIC_US_10Y_YIELD', 'US', 'MACRO', 'V', 'US 10Y Treasury Yield', 'FRED', 'Monthly', '{"series": "DGS10"}', 'Yield, Treasury, Bonds'),
+    ('METRIC_US_VIX', 'US', 'MACRO', 'V', 'VIX Index', 'yfinance', 'Daily', '{"ticker": "^VIX"}', 'VIX, Volatility, Fear'),
+
+    # 2. 宏观全景 (Macro Panorama) - JP
+    ('METRIC_JP_BOJ_ASSETS', 'JP', 'MACRO', 'J', 'BOJ Total Assets', 'FRED', 'Monthly', '{"series": "JPNASSETS"}', 'BOJ, Assets, QE'),
+    ('METRIC_JP_TANKAN', 'JP', 'MACRO', 'J', 'Tankan Mfg Index', 'FRED', 'Quarterly', '{"series": "JPNBS6000S"}', 'Tankan, Japan, Production'),
+    ('METRIC_JP_CORE_CPI', 'JP', 'MACRO', 'J', 'JP Core CPI (YoY)', 'FRED', 'Monthly', '{"series": "CPGRLE01JPM657N"}', 'CPI, Inflation, Japan'),
+    ('METRIC_JP_GDP_GROWTH', 'JP', 'MACRO', 'J', 'JP GDP Growth (QoQ)', 'FRED', 'Quarterly', '{"series": "JPNRGDPQDSNAQ"}', 'GDP, Growth, Japan'),
+    ('METRIC_JP_NIKKEI_VI', 'JP', 'MACRO', 'V', 'Nikkei Volatility Index', 'yfinance', 'Daily', '{"ticker": "^JNIV"}', 'Nikkei, Volatility, Japan'),
+
+    # 3. 核心资产与选筹矩阵 (Micro Assets)
+    ('INDEX_US_GSPC', 'US', 'MICRO', 'J', 'S&P 500 Index', 'yfinance', 'Daily', '{"ticker": "^GSPC"}', 'S&P 500, US Market Benchmark'),
+    ('INDEX_JP_N225', 'JP', 'MICRO', 'J', 'Nikkei 225 Index', 'yfinance', 'Daily', '{"ticker": "^N225"}', 'Nikkei 225, JP Market Benchmark'),
+
+    # 4. 商品和外汇 (Commodities & FX)
+    ('ASSET_GOLD_USD', 'Global', 'MICRO', 'J', 'Gold Spot (USD)', 'yfinance', 'Daily', '{"ticker": "GC=F"}', 'Gold, Safe Haven, Metals'),
+    ('ASSET_SILVER_USD', 'Global', 'MICRO', 'J', 'Silver Spot (USD)', 'yfinance', 'Daily', '{"ticker": "SI=F"}', 'Silver, Industrial Metals'),
+    ('ASSET_COPPER_USD', 'Global', 'MICRO', 'J', 'Copper High Grade', 'yfinance', 'Daily', '{"ticker": "HG=F"}', 'Copper, Dr. Copper, Economy'),
+    ('ASSET_PLATINUM_USD', 'Global', 'MICRO', 'J', 'Platinum Spot', 'yfinance', 'Daily', '{"ticker": "PL=F"}', 'Platinum, Precious Metal'),
+    ('ASSET_PALLADIUM_USD', 'Global', 'MICRO', 'J', 'Palladium Spot', 'yfinance', 'Daily', '{"ticker": "PA=F"}', 'Palladium, Auto Catalyst'),
+    ('ASSET_USDJPY', 'Global', 'MICRO', 'J', 'USD/JPY (Main Anchor)', 'yfinance', 'Daily', '{"ticker": "USDJPY=X"}', 'USD/JPY, Yen, Carry Trade'),
+    ('ASSET_EURUSD', 'Global', 'MICRO', 'J', 'EUR/USD', 'yfinance', 'Daily', '{"ticker": "EURUSD=X"}', 'EUR/USD, Euro, Dollar'),
+    ('ASSET_GBPUSD', 'Global', 'MICRO', 'J', 'GBP/USD', 'yfinance', 'Daily', '{"ticker": "GBPUSD=X"}', 'Pound, Sterling, Dollar'),
+    ('ASSET_AUDJPY', 'Global', 'MICRO', 'J', 'AUD/JPY (Risk Proxy)', 'yfinance', 'Daily', '{"ticker": "AUDJPY=X"}', 'AUD/JPY, Risk, Commodity'),
+    ('ASSET_NZDJPY', 'Global', 'MICRO', 'J', 'NZD/JPY (Carry Trade)', 'yfinance', 'Daily', '{"ticker": "NZDJPY=X"}', 'NZD/JPY, Carry, Kiwi'),
+    ('ASSET_USDCNY', 'Global', 'MICRO', 'J', 'USD/CNY (CNH)', 'yfinance', 'Daily', '{"ticker": "CNY=X"}', 'USD/CNY, Yuan, China'),
+
+    # 5. 个股 (Stocks)
+    ('STOCK_PRICE_NVDA', 'US', 'MICRO', 'J', 'NVIDIA (Price)', 'yfinance', 'Daily', '{"ticker": "NVDA"}', 'NVIDIA, AI, Semiconductor'),
+    ('STOCK_PRICE_MSFT', 'US', 'MICRO', 'J', 'Microsoft (Price)', 'yfinance', 'Daily', '{"ticker": "MSFT"}', 'Microsoft, Software, Cloud'),
+    ('STOCK_PRICE_TSLA', 'US', 'MICRO', 'J', 'Tesla Inc (Price)', 'yfinance', 'Daily', '{"ticker": "TSLA"}', 'Tesla, EV, Autonomous'),
+    ('STOCK_PRICE_8035', 'JP', 'MICRO', 'J', 'Tokyo Electron', 'yfinance', 'Daily', '{"ticker": "8035.T"}', 'TEL, Semi Equipment, Japan'),
+    ('STOCK_PRICE_4063', 'JP', 'MICRO', 'J', 'Shin-Etsu Chemical', 'yfinance', 'Daily', '{"ticker": "4063.T"}', 'Shin-Etsu, Chemical, Japan'),
+    ('STOCK_PRICE_4188', 'JP', 'MICRO', 'J', 'Mitsubishi Chemical', 'yfinance', 'Daily', '{"ticker": "4188.T"}', 'Mitsubishi, Materials, Japan'),
+    ('STOCK_PRICE_7203', 'JP', 'MICRO', 'J', 'Toyota Motor', 'yfinance', 'Daily', '{"ticker": "7203.T"}', 'Toyota, Automotive, Japan'),
+    ('STOCK_PRICE_7267', 'JP', 'MICRO', 'J', 'Honda Motor', 'yfinance', 'Daily', '{"ticker": "7267.T"}', 'Honda, Automotive, Japan'),
+
+    # 6. 情报流种子 (Validation News)
+    ('NEWS_MACRO_US_MARKETS', 'US', 'MACRO', 'V', 'US Markets News', 'RSS', 'Hourly', '{"url": "https://finance.yahoo.com/rss/markets"}', 'Fed, Powell, Yields, S&P 500'),
+    ('NEWS_MACRO_US_ECON', 'US', 'MACRO', 'V', 'US Economy News', 'RSS', 'Hourly', '{"url": "https://finance.yahoo.com/rss/economy"}', 'GDP, Inflation, PCE, Jobs'),
+    ('NEWS_MACRO_US_TECH', 'US', 'MACRO', 'V', 'US Tech Industry', 'RSS', 'Hourly', '{"url": "https://finance.yahoo.com/rss/category-tech"}', 'AI, Big Tech, Chips'),
+    ('NEWS_MACRO_US_POLICY', 'US', 'MACRO', 'V', 'US Policy/Politics', 'RSS', 'Hourly', '{"url": "https://finance.yahoo.com/rss/politics"}', 'Congress, Tax, Regulations'),
+    ('NEWS_MACRO_JP_MARKETS', 'JP', 'MACRO', 'V', 'JP Markets News', 'RSS', 'Hourly', '{"url": "https://finance.yahoo.com/rss/business"}', 'Nikkei 225, JGB, Yen, BOJ, Ueda'),
+
+    # YFINANCE ASSET NEWS
+    ('NEWS_ASSET_GOLD', 'Global', 'MICRO', 'V', 'Gold Intel', 'yfinance', 'Hourly', '{"ticker": "GC=F"}', 'Gold, Inflation Hedge, Safe Haven'),
+    ('NEWS_ASSET_COPPER', 'Global', 'MICRO', 'V', 'Copper Intel', 'yfinance', 'Hourly', '{"ticker": "HG=F"}', 'Dr. Copper, Economic Growth'),
+    ('NEWS_ASSET_USDJPY', 'Global', 'MICRO', 'V', 'USD/JPY Intel', 'yfinance', 'Hourly', '{"ticker": "USDJPY=X"}', 'Yen, Carry Trade, Intervention'),
+    ('NEWS_ASSET_AUDJPY', 'Global', 'MICRO', 'V', 'AUD/JPY Intel', 'yfinance', 'Hourly', '{"ticker": "AUDJPY=X"}', 'Risk-on, Commodity Currency'),
+    ('NEWS_STOCK_NVDA', 'US', 'MICRO', 'V', 'NVIDIA Intel', 'yfinance', 'Hourly', '{"ticker": "NVDA"}', 'GPU, Blackwell, AI'),
+    ('NEWS_STOCK_MSFT', 'US', 'MICRO', 'V', 'Microsoft Intel', 'yfinance', 'Hourly', '{"ticker": "MSFT"}', 'Azure, Copilot, Cloud'),
+    ('NEWS_STOCK_TSLA', 'US', 'MICRO', 'V', 'Tesla Intel', 'yfinance', 'Hourly', '{"ticker": "TSLA"}', 'EV, FSD, Elon Musk'),
+    ('NEWS_STOCK_8035', 'JP', 'MICRO', 'V', 'Tokyo Electron Intel', 'yfinance', 'Hourly', '{"ticker": "8035.T"}', 'Semi, SPE, Tokyo Electron'),
+    ('NEWS_STOCK_4063', 'JP', 'MICRO', 'V', 'Shin-Etsu Intel', 'yfinance', 'Hourly', '{"ticker": "4063.T"}', 'PVC, Silicon Wafer'),
+    ('NEWS_STOCK_4188', 'JP', 'MICRO', 'V', 'Mitsubishi Chem Intel', 'yfinance', 'Hourly', '{"ticker": "4188.T"}', 'Chemical, LS, Materials'),
+    ('NEWS_STOCK_7203', 'JP', 'MICRO', 'V', 'Toyota Intel', 'yfinance', 'Hourly', '{"ticker": "7203.T"}', 'Hybrid, EV, Toyota'),
+    ('NEWS_STOCK_7267', 'JP', 'MICRO', 'V', 'Honda Intel', 'yfinance', 'Hourly', '{"ticker": "7267.T"}', 'Auto, Honda, Motorcycle'),
+)
+
+
 def seed_catalog(cursor):
     """Seed the data_catalog and sync_watermarks tables with initial data."""
     # Check if data already exists
@@ -267,126 +459,112 @@ def seed_catalog(cursor):
 
     logger.info("Seeding data_catalog and sync_watermarks with initial data...")
 
-    seed_data = [
-        # 1. 宏观全景 (Macro Panorama) - US
-        ('METRIC_US_NET_LIQUIDITY', 'US', 'MACRO', 'J', 'US Net Liquidity', 'FRED', 'Monthly', '{"series": ["WALCL", "WTREGEN", "RRPONTSYD"]}', 'Fed, Liquidity, Balance Sheet'),
-        ('METRIC_US_ISM_PMI', 'US', 'MACRO', 'J', 'ISM Manufacturing PMI', 'FRED', 'Monthly', '{"series": "IPMAN"}', 'Industrial Production, Manufacturing, Economy'),
-        ('METRIC_US_CORE_PCE', 'US', 'MACRO', 'J', 'Core PCE (YoY)', 'FRED', 'Monthly', '{"series": "PCEPILFE"}', 'PCE, Inflation, Fed'),
-        ('METRIC_US_10Y_YIELD', 'US', 'MACRO', 'V', 'US 10Y Treasury Yield', 'FRED', 'Monthly', '{"series": "DGS10"}', 'Yield, Treasury, Bonds'),
-        ('METRIC_US_VIX', 'US', 'MACRO', 'V', 'VIX Index', 'yfinance', 'Daily', '{"ticker": "^VIX"}', 'VIX, Volatility, Fear'),
-
-        # 2. 宏观全景 (Macro Panorama) - JP
-        ('METRIC_JP_BOJ_ASSETS', 'JP', 'MACRO', 'J', 'BOJ Total Assets', 'FRED', 'Monthly', '{"series": "JPNASSETS"}', 'BOJ, Assets, QE'),
-        ('METRIC_JP_TANKAN', 'JP', 'MACRO', 'J', 'Tankan Mfg Index', 'FRED', 'Quarterly', '{"series": "JPNBS6000S"}', 'Tankan, Japan, Production'),
-        ('METRIC_JP_CORE_CPI', 'JP', 'MACRO', 'J', 'JP Core CPI (YoY)', 'FRED', 'Monthly', '{"series": "CPGRLE01JPM657N"}', 'CPI, Inflation, Japan'),
-        ('METRIC_JP_GDP_GROWTH', 'JP', 'MACRO', 'J', 'JP GDP Growth (QoQ)', 'FRED', 'Quarterly', '{"series": "JPNRGDPQDSNAQ"}', 'GDP, Growth, Japan'),
-        ('METRIC_JP_NIKKEI_VI', 'JP', 'MACRO', 'V', 'Nikkei Volatility Index', 'yfinance', 'Daily', '{"ticker": "^JNIV"}', 'Nikkei, Volatility, Japan'),
-
-        # 3. 核心资产与选筹矩阵 (Micro Assets)
-        ('INDEX_US_GSPC', 'US', 'MICRO', 'J', 'S&P 500 Index', 'yfinance', 'Daily', '{"ticker": "^GSPC"}', 'S&P 500, US Market Benchmark'),
-        ('INDEX_JP_N225', 'JP', 'MICRO', 'J', 'Nikkei 225 Index', 'yfinance', 'Daily', '{"ticker": "^N225"}', 'Nikkei 225, JP Market Benchmark'),
-
-        # 4. 商品和外汇 (Commodities & FX)
-        ('ASSET_GOLD_USD', 'Global', 'MICRO', 'J', 'Gold Spot (USD)', 'yfinance', 'Daily', '{"ticker": "GC=F"}', 'Gold, Safe Haven, Metals'),
-        ('ASSET_SILVER_USD', 'Global', 'MICRO', 'J', 'Silver Spot (USD)', 'yfinance', 'Daily', '{"ticker": "SI=F"}', 'Silver, Industrial Metals'),
-        ('ASSET_COPPER_USD', 'Global', 'MICRO', 'J', 'Copper High Grade', 'yfinance', 'Daily', '{"ticker": "HG=F"}', 'Copper, Dr. Copper, Economy'),
-        ('ASSET_PLATINUM_USD', 'Global', 'MICRO', 'J', 'Platinum Spot', 'yfinance', 'Daily', '{"ticker": "PL=F"}', 'Platinum, Precious Metal'),
-        ('ASSET_PALLADIUM_USD', 'Global', 'MICRO', 'J', 'Palladium Spot', 'yfinance', 'Daily', '{"ticker": "PA=F"}', 'Palladium, Auto Catalyst'),
-        ('ASSET_USDJPY', 'Global', 'MICRO', 'J', 'USD/JPY (Main Anchor)', 'yfinance', 'Daily', '{"ticker": "USDJPY=X"}', 'USD/JPY, Yen, Carry Trade'),
-        ('ASSET_EURUSD', 'Global', 'MICRO', 'J', 'EUR/USD', 'yfinance', 'Daily', '{"ticker": "EURUSD=X"}', 'EUR/USD, Euro, Dollar'),
-        ('ASSET_GBPUSD', 'Global', 'MICRO', 'J', 'GBP/USD', 'yfinance', 'Daily', '{"ticker": "GBPUSD=X"}', 'Pound, Sterling, Dollar'),
-        ('ASSET_AUDJPY', 'Global', 'MICRO', 'J', 'AUD/JPY (Risk Proxy)', 'yfinance', 'Daily', '{"ticker": "AUDJPY=X"}', 'AUD/JPY, Risk, Commodity'),
-        ('ASSET_NZDJPY', 'Global', 'MICRO', 'J', 'NZD/JPY (Carry Trade)', 'yfinance', 'Daily', '{"ticker": "NZDJPY=X"}', 'NZD/JPY, Carry, Kiwi'),
-        ('ASSET_USDCNY', 'Global', 'MICRO', 'J', 'USD/CNY (CNH)', 'yfinance', 'Daily', '{"ticker": "CNY=X"}', 'USD/CNY, Yuan, China'),
-
-        # 5. 个股 (Stocks)
-        ('STOCK_PRICE_NVDA', 'US', 'MICRO', 'J', 'NVIDIA (Price)', 'yfinance', 'Daily', '{"ticker": "NVDA"}', 'NVIDIA, AI, Semiconductor'),
-        ('STOCK_PRICE_MSFT', 'US', 'MICRO', 'J', 'Microsoft (Price)', 'yfinance', 'Daily', '{"ticker": "MSFT"}', 'Microsoft, Software, Cloud'),
-        ('STOCK_PRICE_TSLA', 'US', 'MICRO', 'J', 'Tesla Inc (Price)', 'yfinance', 'Daily', '{"ticker": "TSLA"}', 'Tesla, EV, Autonomous'),
-        ('STOCK_PRICE_8035', 'JP', 'MICRO', 'J', 'Tokyo Electron', 'yfinance', 'Daily', '{"ticker": "8035.T"}', 'TEL, Semi Equipment, Japan'),
-        ('STOCK_PRICE_4063', 'JP', 'MICRO', 'J', 'Shin-Etsu Chemical', 'yfinance', 'Daily', '{"ticker": "4063.T"}', 'Shin-Etsu, Chemical, Japan'),
-        ('STOCK_PRICE_4188', 'JP', 'MICRO', 'J', 'Mitsubishi Chemical', 'yfinance', 'Daily', '{"ticker": "4188.T"}', 'Mitsubishi, Materials, Japan'),
-        ('STOCK_PRICE_7203', 'JP', 'MICRO', 'J', 'Toyota Motor', 'yfinance', 'Daily', '{"ticker": "7203.T"}', 'Toyota, Automotive, Japan'),
-        ('STOCK_PRICE_7267', 'JP', 'MICRO', 'J', 'Honda Motor', 'yfinance', 'Daily', '{"ticker": "7267.T"}', 'Honda, Automotive, Japan'),
-
-        # 6. 情报流种子 (Validation News)
-        ('NEWS_MACRO_US_MARKETS', 'US', 'MACRO', 'V', 'US Markets News', 'RSS', 'Hourly', '{"url": "https://finance.yahoo.com/rss/markets"}', 'Fed, Powell, Yields, S&P 500'),
-        ('NEWS_MACRO_US_ECON', 'US', 'MACRO', 'V', 'US Economy News', 'RSS', 'Hourly', '{"url": "https://finance.yahoo.com/rss/economy"}', 'GDP, Inflation, PCE, Jobs'),
-        ('NEWS_MACRO_US_TECH', 'US', 'MACRO', 'V', 'US Tech Industry', 'RSS', 'Hourly', '{"url": "https://finance.yahoo.com/rss/category-tech"}', 'AI, Big Tech, Chips'),
-        ('NEWS_MACRO_US_POLICY', 'US', 'MACRO', 'V', 'US Policy/Politics', 'RSS', 'Hourly', '{"url": "https://finance.yahoo.com/rss/politics"}', 'Congress, Tax, Regulations'),
-        ('NEWS_MACRO_JP_MARKETS', 'JP', 'MACRO', 'V', 'JP Markets News', 'RSS', 'Hourly', '{"url": "https://finance.yahoo.com/rss/business"}', 'Nikkei 225, JGB, Yen, BOJ, Ueda'),
-
-        # YFINANCE ASSET NEWS
-        ('NEWS_ASSET_GOLD', 'Global', 'MICRO', 'V', 'Gold Intel', 'yfinance', 'Hourly', '{"ticker": "GC=F"}', 'Gold, Inflation Hedge, Safe Haven'),
-        ('NEWS_ASSET_COPPER', 'Global', 'MICRO', 'V', 'Copper Intel', 'yfinance', 'Hourly', '{"ticker": "HG=F"}', 'Dr. Copper, Economic Growth'),
-        ('NEWS_ASSET_USDJPY', 'Global', 'MICRO', 'V', 'USD/JPY Intel', 'yfinance', 'Hourly', '{"ticker": "USDJPY=X"}', 'Yen, Carry Trade, Intervention'),
-        ('NEWS_ASSET_AUDJPY', 'Global', 'MICRO', 'V', 'AUD/JPY Intel', 'yfinance', 'Hourly', '{"ticker": "AUDJPY=X"}', 'Risk-on, Commodity Currency'),
-        ('NEWS_STOCK_NVDA', 'US', 'MICRO', 'V', 'NVIDIA Intel', 'yfinance', 'Hourly', '{"ticker": "NVDA"}', 'GPU, Blackwell, AI'),
-        ('NEWS_STOCK_MSFT', 'US', 'MICRO', 'V', 'Microsoft Intel', 'yfinance', 'Hourly', '{"ticker": "MSFT"}', 'Azure, Copilot, Cloud'),
-        ('NEWS_STOCK_TSLA', 'US', 'MICRO', 'V', 'Tesla Intel', 'yfinance', 'Hourly', '{"ticker": "TSLA"}', 'EV, FSD, Elon Musk'),
-        ('NEWS_STOCK_8035', 'JP', 'MICRO', 'V', 'Tokyo Electron Intel', 'yfinance', 'Hourly', '{"ticker": "8035.T"}', 'Semi, SPE, Tokyo Electron'),
-        ('NEWS_STOCK_4063', 'JP', 'MICRO', 'V', 'Shin-Etsu Intel', 'yfinance', 'Hourly', '{"ticker": "4063.T"}', 'PVC, Silicon Wafer'),
-        ('NEWS_STOCK_4188', 'JP', 'MICRO', 'V', 'Mitsubishi Chem Intel', 'yfinance', 'Hourly', '{"ticker": "4188.T"}', 'Chemical, LS, Materials'),
-        ('NEWS_STOCK_7203', 'JP', 'MICRO', 'V', 'Toyota Intel', 'yfinance', 'Hourly', '{"ticker": "7203.T"}', 'Hybrid, EV, Toyota'),
-        ('NEWS_STOCK_7267', 'JP', 'MICRO', 'V', 'Honda Intel', 'yfinance', 'Hourly', '{"ticker": "7267.T"}', 'Auto, Honda, Motorcycle'),
-    ]
-
     # Seed data_catalog
-    cursor.executemany('''
+    cursor.connection.executemany('''
     INSERT INTO data_catalog (
         catalog_key, country, scope, role, entity_name, source_api, update_frequency, config_params, search_keywords, is_active
     ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
-    ''', seed_data)
+    ''', _HARDCODED_SEED_DATA)
 
     # Seed sync_watermarks with catalog_keys (watermarks start as NULL)
-    catalog_keys = [(row[0],) for row in seed_data]
-    cursor.executemany('''
-    INSERT INTO sync_watermarks (catalog_key) VALUES (?)
-    ''', catalog_keys)
+    cursor.execute(_SEED_WATERMARKS_SQL)
+
+    logger.info(f"Successfully seeded {len(_HARDCODED_SEED_DATA)} entries into data_catalog and sync_watermarks.")
+
 
-    logger.info(f"Successfully seeded {len(seed_data)} entries into data_catalog and sync_watermarks.")
+def _signature_stamp(signature: str) -> int:
+    """Reduce a datamodel_signature() to a positive 32-bit PRAGMA user_version."""
+    return zlib.crc32(signature.encode('utf-8')) & 0x7FFFFFFF or 1
+
+
+def _catalog_is_current(cursor, signature: Optional[str]) -> bool:
+    """Check whether data_catalog was seeded from this version of the data model doc.
+
+    main() stamps PRAGMA user_version with the document signature after
+    seeding from it, so any edit to the document, such as an added table,
+    makes main() apply it again. A signature of None means the document is
+    missing.
+    """
+    try:
+        count = cursor.execute("SELECT COUNT(*) FROM data_catalog").fetchone()[0]
+    except sqlite3.OperationalError:
+        return False  # Tables not created yet
+    if count == 0:
+        return False
+
+    if signature is None:
+        # Without the document there is nothing new to seed from
+        return True
+    return cursor.execute("PRAGMA user_version").fetchone()[0] == _signature_stamp(signature)
 
 
 def main():
     """Initialize SQLite database and data directory."""
-    data_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'local', 'data')
-    db_path = os.path.join(data_dir, 'heimdall.db')
+    db_path = _DB_PATH
 
     # Create data directory if it doesn't exist
-    if not os.path.exists(data_dir):
-        os.makedirs(data_dir)
-        logger.info(f"Created data directory: {data_dir}")
-    else:
-        logger.info(f"Data directory already exists: {data_dir}")
-
-    # Connect to database (creates it if it doesn't exist)
-    conn = sqlite3.connect(db_path)
+    _DATA_DIR.mkdir(parents=True, exist_ok=True)
+    logger.info(f"Data directory ready: {_DATA_DIR}")
+
+    # Connect to database (creates it if it doesn't exist). Autocommit mode so
+    # the explicit BEGIN/COMMIT below covers all seed statements.
+    conn = sqlite3.connect(db_path, isolation_level=None)
     cursor = conn.cursor()
 
     try:
         # Enable WAL mode for better concurrency
         cursor.execute("PRAGMA journal_mode=WAL;")
+        # Bulk-load settings: init is the only writer, so take the file lock
+        # once, use a 64 MB page cache, skip the fsync per commit and keep
+        # temp structures in memory
+        cursor.execute("PRAGMA locking_mode=EXCLUSIVE;")
+        cursor.execute("PRAGMA cache_size=-65536;")
+        cursor.execute("PRAGMA synchronous=NORMAL;")
+        cursor.execute("PRAGMA temp_store=MEMORY;")
 
-        # Try document parsing first, fallback to hardcoded if needed
-        if not create_tables_from_doc(cursor):
-            logger.warning("Document parsing failed, falling back to hardcoded schema")
-            create_tables(cursor)
-
-        # Try document-based seeding first, fallback to hardcoded
         try:
-            seed_catalog_from_doc(cursor)
-        except Exception as e:
-            logger.warning(f"Document seeding failed: {e}, falling back to hardcoded data")
-            seed_catalog(cursor)
-
-        # Always try to seed from document as well (for new assets)
-        try:
-            seed_catalog_from_doc(cursor)
-        except Exception as e:
-            logger.debug(f"Document update seeding failed: {e}")
-
-        # Commit all changes
-        conn.commit()
+            signature = datamodel_signature()
+        except FileNotFoundError:
+            signature = None
+
+        if _catalog_is_current(cursor, signature):
+            logger.info("Data catalog is up to date with Phase4_DataModel.md. Skipping document parsing.")
+        else:
+            # Parse the document once and share it between table creation and seeding
+            try:
+                parsed_data = _parse_datamodel_for(signature) if signature else parse_datamodel_doc()
+            except Exception as e:
+                logger.error(f"Failed to parse document: {e}")
+                parsed_data = None
+
+            # Try document parsing first, fallback to hardcoded if needed
+            if parsed_data is None or not create_tables_from_doc(cursor, parsed_data):
+                logger.warning("Document parsing failed, falling back to hardcoded schema")
+                create_tables(cursor)
+
+            # Seed inside one transaction, opened after the DDL script since
+            # executescript would commit it
+            cursor.execute("BEGIN")
+
+            # Try document-based seeding first, fallback to hardcoded
+            stamp = 0
+            if parsed_data is None:
+                seed_catalog(cursor)
+            else:
+                try:
+                    seed_catalog_from_doc(cursor, parsed_data)
+                    stamp = _signature_stamp(signature)
+                except Exception as e:
+                    logger.warning(f"Document seeding failed: {e}, falling back to hardcoded data")
+                    seed_catalog(cursor)
+
+            # Record which document version the catalog was seeded from
+            cursor.execute(f"PRAGMA user_version = {stamp}")
+
+            # Commit all changes
+            cursor.execute("COMMIT")
+
+        create_indexes(cursor)
 
         logger.info(f"SQLite database initialized successfully at: {db_path}")
         print("✓ Data directory and SQLite database initialized successfully.")
@@ -396,7 +574,8 @@ def main():
 
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
-        conn.rollback()
+        if conn.in_transaction:
+            cursor.execute("ROLLBACK")
         print(f"✗ Error: {e}")
         exit(1)
 
@@ -2,14 +2,50 @@
 
 """Database migration tool."""
 
+import io
 import json
 import re
 import sqlite3
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
-from local.src.database.init_db import parse_datamodel_doc
+from local.src.database.init_db import create_indexes, datamodel_signature, parse_datamodel_doc
+from local.src.database.schema_checker import (
+    comparable_definition, is_table_constraint, parse_table_definition, read_table_info,
+    schema_fingerprint, schema_from_table_info, split_create_table,
+)
+
+
+# First SQLite releases with ALTER TABLE ... RENAME COLUMN / DROP COLUMN
+_RENAME_COLUMN_VERSION = (3, 25, 0)
+_DROP_COLUMN_VERSION = (3, 35, 0)
+
+# Identifiers in a table constraint, quoted or bare; string literals are
+# matched first so their contents are left alone
+_IDENTIFIER_RE = re.compile(r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|\w+")
+_REFERENCES_RE = re.compile(r'\bREFERENCES\b', re.IGNORECASE)
+
+
+def _q(ident: str) -> str:
+    """Quote an SQLite identifier for interpolation into generated SQL."""
+    return '"' + ident.replace('"', '""') + '"'
+
+
+@lru_cache(maxsize=1)
+def _load_target_schema(doc_signature: str) -> Dict[str, Dict[str, str]]:
+    """Parse the target schema; doc_signature keys the cache to the document version."""
+    doc_data = parse_datamodel_doc()
+
+    # Extract table schemas from DDL
+    target_schema = {}
+    for ddl in doc_data['ddl_statements']:
+        table_name, columns = parse_table_definition(ddl)
+        if table_name:
+            target_schema[table_name] = columns
+
+    return target_schema
 
 
 @dataclass
@@ -20,32 +56,175 @@ class MigrationStep:
     details: Dict[str, Any]
     description: str
 
-    def to_sql(self) -> list:
-        """Convert migration step to SQL statements."""
+    def add_to_plan(self, plan: Dict[str, Any]):
+        """Record this step's change in a table rewrite plan (see _new_table_plan)."""
         if self.operation == 'add_column':
-            col_name = self.details['column']
-            col_def = self.details['definition']
-            return [f"ALTER TABLE {self.table} ADD COLUMN {col_name} {col_def};"]
-
+            plan['add'][self.details['column']] = self.details['definition']
+        elif self.operation == 'drop_column':
+            plan['drop'].add(self.details['column'])
         elif self.operation == 'rename_column':
-            # SQLite doesn't support direct column rename, need to recreate table
-            old_name = self.details['old_name']
-            new_name = self.details['new_name']
-            # This will be handled by the table recreation logic
-            return []
-
+            plan['rename'][self.details['old_name']] = self.details['new_name']
         elif self.operation == 'change_type':
-            col_name = self.details['column']
-            new_type = self.details['new_type']
-            # This will be handled by the table recreation logic
-            return []
-
-        elif self.operation == 'drop_column':
-            col_name = self.details['column']
-            # This will be handled by the table recreation logic
-            return []
-
-        return []
+            plan['change_type'][self.details['column']] = self.details['new_type']
+
+
+def _new_table_plan() -> Dict[str, Any]:
+    """Empty table rewrite plan: {'add': {col: def}, 'drop': {col},
+    'rename': {old: new}, 'change_type': {col: new_def}}."""
+    return {'add': {}, 'drop': set(), 'rename': {}, 'change_type': {}}
+
+
+def _needs_rebuild(plan: Dict[str, Any]) -> bool:
+    """Whether a table rewrite plan holds changes ALTER TABLE ADD can't express."""
+    return bool(plan['drop'] or plan['rename'] or plan['change_type'])
+
+
+def _render_alter_columns(table_name: str, plan: Dict[str, Any]) -> list:
+    """Render a plan without change_type as in-place ALTER TABLE statements."""
+    table = _q(table_name)
+    return [
+        *(f"ALTER TABLE {table} DROP COLUMN {_q(col)};" for col in plan['drop']),
+        *(f"ALTER TABLE {table} RENAME COLUMN {_q(old)} TO {_q(new)};"
+          for old, new in plan['rename'].items()),
+        *(f"ALTER TABLE {table} ADD COLUMN {_q(col)} {col_def};"
+          for col, col_def in plan['add'].items()),
+    ]
+
+
+def _unquote(token: str) -> str:
+    """Name of an identifier token, without its quotes."""
+    if token[:1] == '"':
+        return token[1:-1].replace('""', '"')
+    return token.strip('`[]')
+
+
+def _rewrite_table_constraint(constraint: str, plan: Dict[str, Any]) -> Optional[str]:
+    """Apply a plan's renames to a table constraint.
+
+    Only the constraint's own columns are touched, not the ones a FOREIGN KEY
+    references in another table. Returns None when the constraint covers a
+    dropped column and cannot outlive it.
+    """
+    references = _REFERENCES_RE.search(constraint)
+    split_at = references.start() if references else len(constraint)
+    own, foreign = constraint[:split_at], constraint[split_at:]
+
+    dropped = {name.lower() for name in plan['drop']}
+    renamed = {old.lower(): new for old, new in plan['rename'].items()}
+
+    def rename(match):
+        token = match.group()
+        if token[:1] == "'":
+            return token
+        new_name = renamed.get(_unquote(token).lower())
+        return _q(new_name) if new_name else token
+
+    if any(_unquote(token).lower() in dropped for token in _IDENTIFIER_RE.findall(own)
+           if token[:1] != "'"):
+        return None
+    return _IDENTIFIER_RE.sub(rename, own) + foreign
+
+
+def _rebuilt_definitions(table_sql: str, plan: Dict[str, Any]) -> Tuple[list, str]:
+    """Apply a plan to the column list of a table's CREATE TABLE statement.
+
+    Everything the plan does not change, including table constraints and
+    AUTOINCREMENT, is kept as written.
+
+    Returns:
+        (column and table constraint definitions, text after the column list
+        such as WITHOUT ROWID)
+    """
+    _, segments, suffix = split_create_table(table_sql)
+    dropped = {name.lower() for name in plan['drop']}
+    renamed = {old.lower(): new for old, new in plan['rename'].items()}
+    changed = {name.lower(): col_def for name, col_def in plan['change_type'].items()}
+
+    columns = []
+    constraints = []
+    for segment in segments:
+        segment = segment.strip()
+        if not segment:
+            continue
+
+        if is_table_constraint(segment):
+            constraint = _rewrite_table_constraint(segment, plan)
+            if constraint is not None:
+                constraints.append(constraint)
+            continue
+
+        # Column name, which may be a quoted identifier containing spaces
+        token = _IDENTIFIER_RE.match(segment)
+        token = token.group() if token else segment.split(None, 1)[0]
+        name = _unquote(token)
+        key = name.lower()
+        if key in dropped:
+            continue
+
+        new_name = renamed.get(key, name)
+        col_def = changed.get(key, segment[len(token):].strip())
+        columns.append(f"{_q(new_name)} {col_def}".rstrip())
+
+    # New columns take their defaults during the copy; they go before the
+    # table constraints, as SQLite requires
+    for col_name, col_def in plan['add'].items():
+        columns.append(f"{_q(col_name)} {col_def}")
+
+    return columns + constraints, suffix.strip().rstrip(';').rstrip()
+
+
+def _render_table_rebuild(table_name: str, plan: Dict[str, Any], table_columns: list,
+                          table_sql: Optional[str]) -> str:
+    """Render SQL that rebuilds a table once, applying every planned change.
+
+    The new table starts from the current CREATE TABLE statement, so table
+    constraints, AUTOINCREMENT and WITHOUT ROWID carry over.
+
+    Args:
+        table_name: Table to rebuild
+        plan: Table rewrite plan (see _new_table_plan)
+        table_columns: Current PRAGMA table_info rows for the table
+        table_sql: Current CREATE TABLE statement from sqlite_master
+
+    Returns:
+        SQL fragment ending in a newline
+    """
+    if not table_columns or not table_sql:
+        return f"-- Error: Table {table_name} not found\n"
+
+    # Track where each copied value comes from
+    source_cols = []
+    target_cols = []
+    for cid, name, type_, notnull, dflt_value, pk in table_columns:
+        # Skip dropped columns
+        if name in plan['drop']:
+            continue
+
+        # Handle renamed columns
+        source_cols.append(_q(name))
+        target_cols.append(_q(plan['rename'].get(name, name)))
+
+    definitions, suffix = _rebuilt_definitions(table_sql, plan)
+
+    # Generate recreation SQL
+    quoted_table = _q(table_name)
+    temp_table = _q(f"{table_name}_temp_migration")
+    column_block = ",\n".join(f"    {definition}" for definition in definitions)
+    table_options = f" {suffix}" if suffix else ""
+    target_list = ", ".join(target_cols)
+    source_list = ", ".join(source_cols)
+
+    return (
+        f"-- Recreating table {table_name} for complex migration\n"
+        f"CREATE TABLE {temp_table} (\n{column_block}\n){table_options};\n"
+        "\n"
+        f"INSERT INTO {temp_table} ({target_list}) SELECT {source_list} FROM {quoted_table};\n"
+        "\n"
+        f"DROP TABLE {quoted_table};\n"
+        "\n"
+        f"ALTER TABLE {temp_table} RENAME TO {quoted_table};\n"
+        "\n"
+    )
 
 
 class DatabaseMigrator:
@@ -54,103 +233,96 @@ class DatabaseMigrator:
     def __init__(self, db_path: str):
         self.db_path = db_path
         self.migration_history_table = '_migrations'
+        self.migration_steps_table = '_migration_steps'
+        self.migration_state_table = '_migration_state'
+        self._target_schema: Optional[Dict[str, Dict[str, str]]] = None
+        self._conn: Optional[sqlite3.Connection] = None
+        self._sqlite_version = sqlite3.sqlite_version_info
+        # PRAGMA table_info rows from the last introspection, per table
+        self._raw_schema: Optional[Dict[str, list]] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _cursor(self) -> sqlite3.Cursor:
+        """Return a cursor on the shared connection, opening it on first use."""
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path)
+
+            # WAL is persistent in the database file, so only switch once
+            if conn.execute("PRAGMA journal_mode").fetchone()[0].lower() != 'wal':
+                conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-64000")
+            self._conn = conn
+
+        return self._conn.cursor()
+
+    def close(self):
+        """Close the shared database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
 
     def get_current_schema(self) -> Dict[str, Dict[str, str]]:
         """Get current database schema."""
-        schema = {}
-
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-
-            # Get all tables
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'")
-            tables = [row[0] for row in cursor.fetchall()]
-
-            for table in tables:
-                if table == self.migration_history_table:
-                    continue
-
-                # Get column info
-                cursor.execute(f"PRAGMA table_info({table})")
-                columns = cursor.fetchall()
-
-                schema[table] = {}
-                for col in columns:
-                    cid, name, type_, notnull, dflt_value, pk = col
-                    # Reconstruct column definition
-                    col_def = type_
-                    if pk:
-                        col_def += " PRIMARY KEY"
-                    if notnull:
-                        col_def += " NOT NULL"
-                    if dflt_value is not None:
-                        col_def += f" DEFAULT {dflt_value}"
-
-                    schema[table][name] = col_def
+        self._raw_schema = read_table_info(self._cursor().connection)
+        schema = schema_from_table_info(self._raw_schema)
 
+        schema.pop(self.migration_history_table, None)
+        schema.pop(self.migration_steps_table, None)
+        schema.pop(self.migration_state_table, None)
         return schema
 
     def parse_target_schema(self) -> Dict[str, Dict[str, str]]:
-        """Parse target schema from Phase4_DataModel.md."""
-        doc_data = parse_datamodel_doc()
+        """Parse target schema from Phase4_DataModel.md (once per migrator)."""
+        if self._target_schema is None:
+            self._target_schema = _load_target_schema(datamodel_signature())
+        return self._target_schema
+
+    def is_up_to_date(self) -> bool:
+        """Check, without introspecting tables, whether the last applied migration still holds.
+
+        True when the database schema has not changed since the last recorded
+        migration (PRAGMA schema_version) and that migration targeted the
+        current document schema.
+        """
+        cursor = self._cursor()
+        try:
+            state = cursor.execute(
+                f"SELECT schema_version, target_fingerprint FROM {_q(self.migration_state_table)} WHERE id = 1"
+            ).fetchone()
+        except sqlite3.OperationalError:
+            return False
+        if state is None:
+            return False
 
-        # Extract table schemas from DDL
-        target_schema = {}
-        for ddl in doc_data['ddl_statements']:
-            table_name, columns = self._parse_table_definition(ddl)
-            if table_name:
-                target_schema[table_name] = columns
+        schema_version = cursor.execute("PRAGMA schema_version").fetchone()[0]
+        return state == (schema_version, schema_fingerprint(self.parse_target_schema()))
 
-        return target_schema
+    def plan_migrations(self) -> list:
+        """Calculate the migrations needed to bring the database to the target schema."""
+        if self.is_up_to_date():
+            return []
+        return self.calculate_migrations(self.get_current_schema(), self.parse_target_schema())
 
     def _parse_table_definition(self, ddl_statement: str) -> Tuple[str, Dict[str, str]]:
         """Parse a CREATE TABLE DDL statement."""
-        # Extract table name
-        table_match = re.search(r'CREATE TABLE(?: IF NOT EXISTS)? (\w+)', ddl_statement, re.IGNORECASE)
-        if not table_match:
-            return None, {}
-
-        table_name = table_match.group(1)
-
-        # Extract column definitions
-        columns = {}
-
-        # Split by commas and clean up
-        lines = [line.strip() for line in ddl_statement.split('\n') if line.strip()]
-
-        # Find the column definition section
-        in_columns = False
-        for line in lines:
-            if line.startswith('('):
-                in_columns = True
-                continue
-            elif line.startswith(')'):
-                break
-            elif in_columns:
-                # Parse column definition: column_name TYPE [constraints]
-                # Remove comments and clean up
-                line = re.sub(r'--.*$', '', line).strip()
-                if not line or line.startswith(','):
-                    continue
-
-                # Match column definitions like: column_name TEXT PRIMARY KEY,
-                col_match = re.match(r'(\w+)\s+(.+?)(?:,|$)', line)
-                if col_match:
-                    col_name = col_match.group(1)
-                    col_def = col_match.group(2).strip()
-
-                    # Remove trailing comma and clean up
-                    col_def = re.sub(r',\s*$', '', col_def).strip()
-
-                    columns[col_name] = col_def
-
-        return table_name, columns
+        return parse_table_definition(ddl_statement)
 
     def calculate_migrations(self, current_schema: Dict[str, Dict[str, str]],
                            target_schema: Dict[str, Dict[str, str]]) -> list:
         """Calculate required migrations to go from current to target schema."""
         migrations = []
 
+        # Identical schemas need no walk
+        if current_schema == target_schema:
+            return migrations
+
         # Check each target table
         for table_name, target_columns in target_schema.items():
             if table_name not in current_schema:
@@ -158,30 +330,33 @@ class DatabaseMigrator:
                 continue
 
             current_columns = current_schema[table_name]
-
-            # Find columns to add
-            for col_name, col_def in target_columns.items():
-                if col_name not in current_columns:
-                    migrations.append(MigrationStep(
-                        operation='add_column',
-                        table=table_name,
-                        details={'column': col_name, 'definition': col_def},
-                        description=f"Add column {col_name} to {table_name}"
-                    ))
+            target_keys = target_columns.keys()
+            current_keys = current_columns.keys()
+
+            # Find columns to add (in document order, since ALTER appends)
+            to_add = target_keys - current_keys
+            if to_add:
+                for col_name, col_def in target_columns.items():
+                    if col_name in to_add:
+                        migrations.append(MigrationStep(
+                            operation='add_column',
+                            table=table_name,
+                            details={'column': col_name, 'definition': col_def},
+                            description=f"Add column {col_name} to {table_name}"
+                        ))
 
             # Find columns to remove (less common, but supported)
-            for col_name in current_columns:
-                if col_name not in target_columns:
-                    migrations.append(MigrationStep(
-                        operation='drop_column',
-                        table=table_name,
-                        details={'column': col_name},
-                        description=f"Drop column {col_name} from {table_name}"
-                    ))
+            for col_name in current_keys - target_keys:
+                migrations.append(MigrationStep(
+                    operation='drop_column',
+                    table=table_name,
+                    details={'column': col_name},
+                    description=f"Drop column {col_name} from {table_name}"
+                ))
 
             # Check for type changes (simplified - just compare definitions)
-            for col_name in set(current_columns.keys()) & set(target_columns.keys()):
-                if current_columns[col_name] != target_columns[col_name]:
+            for col_name in target_keys & current_keys:
+                if comparable_definition(current_columns[col_name]) != comparable_definition(target_columns[col_name]):
                     migrations.append(MigrationStep(
                         operation='change_type',
                         table=table_name,
@@ -195,97 +370,86 @@ class DatabaseMigrator:
 
         return migrations
 
+    def _can_alter_in_place(self, table_name: str, plan: Dict[str, Any],
+                            table_columns: list) -> bool:
+        """Whether this SQLite can apply the plan with ALTER TABLE alone."""
+        if plan['change_type'] or not table_columns:
+            return False
+        if plan['rename'] and self._sqlite_version < _RENAME_COLUMN_VERSION:
+            return False
+        if plan['drop']:
+            if self._sqlite_version < _DROP_COLUMN_VERSION:
+                return False
+            # DROP COLUMN refuses key and indexed columns
+            blocked = {row[1] for row in table_columns if row[5]}
+            blocked.update(row[0] for row in self._cursor().execute("""
+                SELECT ii.name FROM pragma_index_list(?) il
+                JOIN pragma_index_info(il.name) ii
+            """, (table_name,)))
+            if plan['drop'] & blocked:
+                return False
+        return True
+
+    def _table_sql(self, table_name: str) -> Optional[str]:
+        """The table's CREATE TABLE statement as stored in sqlite_master."""
+        row = self._cursor().execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table_name,)
+        ).fetchone()
+        return row[0] if row else None
+
     def generate_migration_sql(self, migrations: list) -> str:
         """Generate complete migration SQL script."""
-        sql_lines = [
-            "-- =======================================================",
-            f"-- Heimdall-Asis Database Migration - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            "-- =======================================================",
-            "",
-            "BEGIN TRANSACTION;",
-            "",
-            "-- Migration steps:"
-        ]
-
-        for i, migration in enumerate(migrations, 1):
-            sql_lines.append(f"-- {i}. {migration.description}")
-
-            if migration.operation == 'add_column':
-                # Simple ALTER TABLE for adding columns
-                col_name = migration.details['column']
-                col_def = migration.details['definition']
-                sql_lines.append(f"ALTER TABLE {migration.table} ADD COLUMN {col_name} {col_def};")
+        buf = io.StringIO()
+        buf.write(
+            "-- =======================================================\n"
+            f"-- Heimdall-Asis Database Migration - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            "-- =======================================================\n"
+            "\n"
+            "BEGIN TRANSACTION;\n"
+            "\n"
+        )
+        self._write_migration_steps(buf, migrations)
+        buf.write(
+            "COMMIT;\n"
+            "\n"
+            "-- Migration completed successfully\n"
+            f"-- Total steps: {len(migrations)}"
+        )
 
-            elif migration.operation in ['rename_column', 'change_type', 'drop_column']:
-                # Complex operations require table recreation
-                sql_lines.extend(self._generate_table_recreation_sql(migration.table, migration.operation, migration.details))
+        return buf.getvalue()
 
-            sql_lines.append("")
+    def _write_migration_steps(self, buf: io.StringIO, migrations: list):
+        """Write the statements for every migration step, without transaction control."""
+        buf.write("-- Migration steps:\n")
 
-        sql_lines.extend([
-            "COMMIT;",
-            "",
-            "-- Migration completed successfully",
-            f"-- Total steps: {len(migrations)}"
-        ])
-
-        return "\n".join(sql_lines)
-
-    def _generate_table_recreation_sql(self, table_name: str, operation: str, details: Dict[str, Any]) -> list:
-        """Generate SQL for complex operations that require table recreation."""
-        sql_lines = []
-
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-
-            # Get current table structure
-            cursor.execute(f"PRAGMA table_info({table_name})")
-            columns = cursor.fetchall()
-
-            if not columns:
-                return [f"-- Error: Table {table_name} not found"]
-
-            # Build column list for recreation
-            col_defs = []
-            for col in columns:
-                cid, name, type_, notnull, dflt_value, pk = col
-
-                # Skip dropped columns
-                if operation == 'drop_column' and name == details['column']:
-                    continue
-
-                # Handle renamed columns
-                if operation == 'rename_column' and name == details['old_name']:
-                    name = details['new_name']
-
-                col_def = f"{name} {type_}"
-                if pk:
-                    col_def += " PRIMARY KEY"
-                if notnull:
-                    col_def += " NOT NULL"
-                if dflt_value is not None:
-                    col_def += f" DEFAULT {dflt_value}"
-
-                col_defs.append(col_def)
-
-            # Generate recreation SQL
-            temp_table = f"{table_name}_temp_migration"
-
-            sql_lines.extend([
-                f"-- Recreating table {table_name} for complex migration",
-                f"CREATE TABLE {temp_table} (",
-                ",\n".join(f"    {col_def}" for col_def in col_defs),
-                ");",
-                "",
-                f"INSERT INTO {temp_table} SELECT {', '.join(col.split()[0] for col in col_defs)} FROM {table_name};",
-                "",
-                f"DROP TABLE {table_name};",
-                "",
-                f"ALTER TABLE {temp_table} RENAME TO {table_name};",
-                ""
-            ])
-
-        return sql_lines
+        # Group steps by table so each table is rebuilt at most once
+        steps_by_table: Dict[str, list] = {}
+        for i, migration in enumerate(migrations, 1):
+            steps_by_table.setdefault(migration.table, []).append((i, migration))
+
+        for table_name, steps in steps_by_table.items():
+            plan = _new_table_plan()
+            for i, migration in steps:
+                buf.write(f"-- {i}. {migration.description}\n")
+                migration.add_to_plan(plan)
+
+            if _needs_rebuild(plan):
+                if self._raw_schema is None:
+                    self._raw_schema = read_table_info(self._cursor().connection)
+                table_columns = self._raw_schema.get(table_name, [])
+
+            if _needs_rebuild(plan) and not self._can_alter_in_place(table_name, plan, table_columns):
+                # Remaining complex operations require table recreation;
+                # added columns are folded into the same rebuild
+                buf.write(_render_table_rebuild(table_name, plan, table_columns,
+                                                self._table_sql(table_name)))
+            else:
+                # Metadata-only ALTER TABLE statements
+                for statement in _render_alter_columns(table_name, plan):
+                    buf.write(statement)
+                    buf.write("\n")
+
+            buf.write("\n")
 
     def apply_migrations(self, migrations: list, dry_run: bool = True) -> bool:
         """Apply migrations to the database."""
@@ -299,24 +463,35 @@ class DatabaseMigrator:
             print("🔍 DRY RUN MODE - No changes will be made to database")
             print("Run with --apply to execute migrations")
 
-        # Generate migration script
-        migration_sql = self.generate_migration_sql(migrations)
-
         if dry_run:
             print("\n📝 Migration SQL Preview:")
             print("=" * 50)
-            print(migration_sql)
+            print(self.generate_migration_sql(migrations))
             return True
 
-        # Apply migrations
+        # Apply migrations: schema changes and history tables in one script,
+        # left open so the history rows commit atomically with them
+        buf = io.StringIO()
+        buf.write("BEGIN TRANSACTION;\n")
+        self._write_migration_steps(buf, migrations)
+        buf.write(self._history_tables_sql())
+
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.executescript(migration_sql)
+            cursor = self._cursor()
+            with cursor.connection:
+                cursor.executescript(buf.getvalue())
+
+                # Rebuilt tables lose their indexes; restore them
+                create_indexes(cursor)
 
                 # Record migration in history
                 self._record_migration(migrations, cursor)
-                conn.commit()
+
+            # Rebuilt tables make the cached introspection stale
+            self._raw_schema = None
+
+            # Refresh query planner statistics for rebuilt tables
+            cursor.execute("PRAGMA optimize")
 
             print("✅ Migrations applied successfully")
             return True
@@ -325,26 +500,65 @@ class DatabaseMigrator:
             print(f"❌ Migration failed: {e}")
             return False
 
-    def _record_migration(self, migrations: list, cursor):
-        """Record applied migrations in history table."""
-        cursor.execute(f"""
-        CREATE TABLE IF NOT EXISTS {self.migration_history_table} (
+    def _history_tables_sql(self) -> str:
+        """DDL for the migration history tables."""
+        return f"""
+        CREATE TABLE IF NOT EXISTS {_q(self.migration_history_table)} (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             description TEXT,
             migration_data TEXT
-        )
-        """)
+        );
+        CREATE TABLE IF NOT EXISTS {_q(self.migration_steps_table)} (
+            batch_id INTEGER NOT NULL REFERENCES {_q(self.migration_history_table)}(id),
+            step INTEGER NOT NULL,
+            operation TEXT,
+            table_name TEXT,
+            details TEXT,
+            PRIMARY KEY (batch_id, step)
+        );
+        CREATE TABLE IF NOT EXISTS {_q(self.migration_state_table)} (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            schema_version INTEGER,
+            target_fingerprint TEXT
+        );
+        """
+
+    def _record_migration(self, migrations: list, cursor):
+        """Record applied migrations in the history tables (see _history_tables_sql).
 
+        Runs inside the migration's transaction, one row per batch plus one per step.
+        """
         # Record this migration batch
         migration_data = json.dumps([{
             'operation': m.operation,
             'table': m.table,
             'details': m.details,
             'description': m.description
-        } for m in migrations])
+        } for m in migrations], separators=(',', ':'))
 
         cursor.execute(f"""
-        INSERT INTO {self.migration_history_table} (description, migration_data)
+        INSERT INTO {_q(self.migration_history_table)} (description, migration_data)
         VALUES (?, ?)
         """, (f"Schema migration: {len(migrations)} steps", migration_data))
+        batch_id = cursor.lastrowid
+
+        # Per-step rows for auditing, written in one batch
+        cursor.executemany(f"""
+        INSERT INTO {_q(self.migration_steps_table)} (batch_id, step, operation, table_name, details)
+        VALUES (?, ?, ?, ?, ?)
+        """, (
+            (batch_id, i, m.operation, m.table, json.dumps(m.details, separators=(',', ':')))
+            for i, m in enumerate(migrations, 1)
+        ))
+
+        # Remember which schema this database now matches, so the next run
+        # can skip introspection while nothing has changed
+        if self._target_schema is None:
+            return
+
+        schema_version = cursor.execute("PRAGMA schema_version").fetchone()[0]
+        cursor.execute(f"""
+        INSERT OR REPLACE INTO {_q(self.migration_state_table)} (id, schema_version, target_fingerprint)
+        VALUES (1, ?, ?)
+        """, (schema_version, schema_fingerprint(self._target_schema)))
@@ -3,10 +3,87 @@
 """Schema comparison and validation tool."""
 
 import re
+import json
+import hashlib
 import sqlite3
-from typing import Dict, Tuple
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
 from local.src.database.init_db import parse_datamodel_doc
 
+# DDL parsing patterns, compiled once at import time
+_TABLE_RE = re.compile(r'CREATE TABLE(?: IF NOT EXISTS)? (\w+)', re.IGNORECASE)
+# Tokens that matter when splitting a column list: quoted strings and
+# comments (skipped as a whole) plus parentheses and commas
+_DDL_TOKEN_RE = re.compile(r"'(?:[^']|'')*'|\"[^\"]*\"|--[^\n]*|[(),]")
+
+# Leading keywords of table constraints, which are not columns
+_TABLE_CONSTRAINTS = frozenset({'CONSTRAINT', 'PRIMARY', 'UNIQUE', 'CHECK', 'FOREIGN'})
+
+# Column constraint keywords, which end the declared type
+_COLUMN_CONSTRAINT_RE = re.compile(
+    r'\b(?:CONSTRAINT|PRIMARY|NOT|NULL|UNIQUE|CHECK|DEFAULT|COLLATE|REFERENCES|GENERATED|AS)\b'
+)
+_DEFAULT_RE = re.compile(r"\bDEFAULT ('(?:[^']|'')*'|\([^)]*\)|[^\s,]+)")
+_STRING_LITERAL_RE = re.compile(r"'(?:[^']|'')*'")
+
+
+def _split_column_list(body: str) -> List[str]:
+    """Split a CREATE TABLE body on top-level commas, dropping -- comments."""
+    segments = []
+    pieces = []
+    depth = 0
+    start = 0
+
+    for token in _DDL_TOKEN_RE.finditer(body):
+        text = token.group()
+        if text == '(':
+            depth += 1
+        elif text == ')':
+            depth -= 1
+        elif text == ',':
+            if depth == 0:
+                pieces.append(body[start:token.start()])
+                segments.append(''.join(pieces))
+                pieces = []
+                start = token.end()
+        elif text.startswith('--'):
+            pieces.append(body[start:token.start()])
+            start = token.end()
+
+    pieces.append(body[start:])
+    segments.append(''.join(pieces))
+    return segments
+
+
+def is_table_constraint(segment: str) -> bool:
+    """Whether a column-list segment is a table constraint rather than a column."""
+    words = segment.split(None, 1)
+    return bool(words) and words[0].partition('(')[0].upper() in _TABLE_CONSTRAINTS
+
+
+def split_create_table(ddl_statement: str) -> Optional[Tuple[str, List[str], str]]:
+    """Split a CREATE TABLE statement around its column list.
+
+    Returns:
+        (text up to the opening parenthesis, column list segments, text after
+        the closing parenthesis such as WITHOUT ROWID), or None without a
+        column list
+    """
+    table_match = _TABLE_RE.search(ddl_statement)
+    if not table_match:
+        return None
+
+    open_idx = ddl_statement.find('(', table_match.end())
+    close_idx = ddl_statement.rfind(')')
+    if open_idx == -1 or close_idx < open_idx:
+        return None
+
+    return (
+        ddl_statement[:open_idx],
+        _split_column_list(ddl_statement[open_idx + 1:close_idx]),
+        ddl_statement[close_idx + 1:],
+    )
+
 
 def parse_table_definition(ddl_statement: str) -> Tuple[str, Dict[str, str]]:
     """Parse a CREATE TABLE DDL statement and extract table name and columns.
@@ -18,89 +95,132 @@ def parse_table_definition(ddl_statement: str) -> Tuple[str, Dict[str, str]]:
         Tuple of (table_name, {column_name: column_definition})
     """
     # Extract table name
-    table_match = re.search(r'CREATE TABLE(?: IF NOT EXISTS)? (\w+)', ddl_statement, re.IGNORECASE)
+    table_match = _TABLE_RE.search(ddl_statement)
     if not table_match:
         return None, {}
 
     table_name = table_match.group(1)
 
-    # Extract column definitions
-    columns = {}
-
-    # Split by commas and clean up
-    lines = [line.strip() for line in ddl_statement.split('\n') if line.strip()]
+    # Column list is everything between the outer parentheses
+    parts = split_create_table(ddl_statement)
+    if parts is None:
+        return table_name, {}
 
-    # Find the column definition section
-    in_columns = False
-    for line in lines:
-        if line.startswith('('):
-            in_columns = True
+    columns = {}
+    for segment in parts[1]:
+        # Parse column definition: column_name TYPE [constraints]
+        words = segment.split(None, 1)
+        if not words or is_table_constraint(segment):
             continue
-        elif line.startswith(')'):
-            break
-        elif in_columns:
-            # Parse column definition: column_name TYPE [constraints]
-            # Remove comments and clean up
-            line = re.sub(r'--.*$', '', line).strip()
-            if not line or line.startswith(','):
-                continue
-
-            # Match column definitions like: column_name TEXT PRIMARY KEY,
-            col_match = re.match(r'(\w+)\s+(.+?)(?:,|$)', line)
-            if col_match:
-                col_name = col_match.group(1)
-                col_def = col_match.group(2).strip()
-
-                # Remove trailing comma and clean up
-                col_def = re.sub(r',\s*$', '', col_def).strip()
-
-                columns[col_name] = col_def
+
+        col_name = words[0].strip('"`[]')
+        col_def = ' '.join(words[1].split()) if len(words) > 1 else ''
+        columns[col_name] = col_def
 
     return table_name, columns
 
 
-def get_database_schema(db_path: str) -> Dict[str, Dict[str, str]]:
-    """Get actual database schema from SQLite database.
+def column_definition(type_: str, notnull: int, dflt_value, pk: int) -> str:
+    """Reconstruct a column definition from PRAGMA table_info fields."""
+    col_def = type_
+    if pk:
+        col_def += " PRIMARY KEY"
+    if notnull:
+        col_def += " NOT NULL"
+    if dflt_value is not None:
+        col_def += f" DEFAULT {dflt_value}"
+    return col_def
+
+
+def comparable_definition(col_def: str) -> str:
+    """Reduce a column definition to the parts PRAGMA table_info reports.
+
+    Definitions read back from a database only carry the type, primary key,
+    NOT NULL and default, so AUTOINCREMENT and constraints such as REFERENCES,
+    UNIQUE or CHECK are left out of the comparison. PRAGMA table_info also
+    reports primary-key columns of WITHOUT ROWID tables as NOT NULL while the
+    DDL usually leaves it implied, so a primary key always counts as NOT NULL.
+    """
+    col_def = ' '.join(col_def.split())
+    # Uppercased copy with string literals blanked, so keywords inside
+    # defaults don't match; offsets still line up with col_def
+    bare = _STRING_LITERAL_RE.sub(lambda m: "'" + ' ' * (len(m.group()) - 2) + "'", col_def).upper()
+
+    constraint = _COLUMN_CONSTRAINT_RE.search(bare)
+    type_ = bare[:constraint.start()].strip() if constraint else bare
+
+    default = _DEFAULT_RE.search(bare)
+    if default:
+        default = col_def[default.start(1):default.end(1)]
+        if not default.startswith("'"):
+            default = default.upper()
+
+    pk = 'PRIMARY KEY' in bare
+    return column_definition(type_, pk or 'NOT NULL' in bare, default, pk)
+
+
+def read_table_info(conn: sqlite3.Connection) -> Dict[str, List[tuple]]:
+    """Read every user table's PRAGMA table_info rows with a single query.
 
     Args:
-        db_path: Path to SQLite database
+        conn: Open SQLite connection
 
     Returns:
-        {table_name: {column_name: column_definition}}
+        {table_name: [(cid, name, type, notnull, dflt_value, pk), ...]}
     """
-    schema = {}
+    table_info = defaultdict(list)
+    cursor = conn.execute("""
+        SELECT m.name, p.cid, p.name, p.type, p."notnull", p.dflt_value, p.pk
+        FROM sqlite_master m
+        JOIN pragma_table_info(m.name) p
+        WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite_%'
+    """)
+    for row in cursor:
+        table_info[row[0]].append(row[1:])
 
-    with sqlite3.connect(db_path) as conn:
-        cursor = conn.cursor()
+    return dict(table_info)
+
+
+def schema_from_table_info(table_info: Dict[str, List[tuple]]) -> Dict[str, Dict[str, str]]:
+    """Turn read_table_info rows into {table_name: {column_name: column_definition}}."""
+    return {
+        table_name: {
+            name: column_definition(type_, notnull, dflt_value, pk)
+            for _, name, type_, notnull, dflt_value, pk in rows
+        }
+        for table_name, rows in table_info.items()
+    }
+
+
+def read_schema(conn: sqlite3.Connection) -> Dict[str, Dict[str, str]]:
+    """Read every user table's columns with a single introspection query.
+
+    Args:
+        conn: Open SQLite connection
+
+    Returns:
+        {table_name: {column_name: column_definition}}
+    """
+    return schema_from_table_info(read_table_info(conn))
 
-        # Get all tables
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-        tables = cursor.fetchall()
 
-        for (table_name,) in tables:
-            # Skip system tables
-            if table_name.startswith('sqlite_'):
-                continue
+def schema_fingerprint(schema: Dict[str, Dict[str, str]]) -> str:
+    """Stable digest of a {table_name: {column_name: column_definition}} schema."""
+    payload = json.dumps(schema, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
 
-            # Get column info
-            cursor.execute(f"PRAGMA table_info({table_name})")
-            columns = cursor.fetchall()
 
-            schema[table_name] = {}
-            for col in columns:
-                cid, name, type_, notnull, dflt_value, pk = col
-                # Reconstruct column definition
-                col_def = type_
-                if pk:
-                    col_def += " PRIMARY KEY"
-                if notnull:
-                    col_def += " NOT NULL"
-                if dflt_value is not None:
-                    col_def += f" DEFAULT {dflt_value}"
+def get_database_schema(db_path: str) -> Dict[str, Dict[str, str]]:
+    """Get actual database schema from SQLite database.
 
-                schema[table_name][name] = col_def
+    Args:
+        db_path: Path to SQLite database
 
-    return schema
+    Returns:
+        {table_name: {column_name: column_definition}}
+    """
+    with sqlite3.connect(db_path) as conn:
+        return read_schema(conn)
 
 
 def compare_schemas(doc_schema: Dict[str, Dict[str, str]],
@@ -116,6 +236,10 @@ def compare_schemas(doc_schema: Dict[str, Dict[str, str]],
     """
     suggestions = {}
 
+    # Identical schemas (the common --check case) need no walk
+    if doc_schema == db_schema:
+        return suggestions
+
     for table_name, doc_columns in doc_schema.items():
         if table_name not in db_schema:
             suggestions[table_name] = [f"-- Table '{table_name}' does not exist in database"]
@@ -124,20 +248,23 @@ def compare_schemas(doc_schema: Dict[str, Dict[str, str]],
         db_columns = db_schema[table_name]
         table_suggestions = []
 
-        # Find missing columns
-        for col_name, col_def in doc_columns.items():
-            if col_name not in db_columns:
-                # Generate ALTER TABLE statement
-                alter_sql = f"ALTER TABLE {table_name} ADD COLUMN {col_name} {col_def};"
-                table_suggestions.append(alter_sql)
+        # Find missing columns (in document order, since ALTER appends)
+        missing = doc_columns.keys() - db_columns.keys()
+        if missing:
+            for col_name, col_def in doc_columns.items():
+                if col_name in missing:
+                    # Generate ALTER TABLE statement
+                    alter_sql = f"ALTER TABLE {table_name} ADD COLUMN {col_name} {col_def};"
+                    table_suggestions.append(alter_sql)
 
         # Check for column definition differences (basic check)
-        for col_name in set(doc_columns.keys()) & set(db_columns.keys()):
-            doc_def = doc_columns[col_name].upper()
-            db_def = db_columns[col_name].upper()
+        for col_name in doc_columns.keys() & db_columns.keys():
+            doc_def = doc_columns[col_name]
+            db_def = db_columns[col_name]
 
-            # Simple comparison - could be enhanced for more sophisticated diffing
-            if doc_def != db_def:
+            # Simple comparison - could be enhanced for more sophisticated diffing.
+            # Only normalize the definitions that don't match exactly
+            if doc_def != db_def and comparable_definition(doc_def) != comparable_definition(db_def):
                 table_suggestions.append(
                     f"-- Column '{col_name}' definition differs:"
                 )
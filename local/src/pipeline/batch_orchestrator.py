@@ -8,7 +8,7 @@ import sqlite3
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Any
 
-from local.src.pipeline.ingestion import IngestionEngine, get_active_catalog_tasks, should_update_task
+from local.src.pipeline.ingestion import IngestionEngine, get_active_catalog_tasks, should_update_tasks
 from local.config import AppConfig
 
 
@@ -22,6 +22,10 @@ class BatchOrchestrator:
         self.engine = IngestionEngine()
         self.db_path = AppConfig.DB_PATH
 
+    def close(self):
+        """Close the ingestion engine's database connections."""
+        self.engine.close()
+
     def run_batch(self, 
                   tasks: List[Dict[str, Any]],
                   dry_run: bool = False,
@@ -43,15 +47,16 @@ class BatchOrchestrator:
         failed = 0
         task_details = []
 
-        logger.info(f"Starting batch with {total} tasks (dry_run={dry_run}, force={force})")
+        logger.info("Starting batch with %d tasks (dry_run=%s, force=%s)", total, dry_run, force)
+
+        # Delta check, against one clock reading for the whole batch
+        decisions = should_update_tasks(tasks)
 
-        for i, task in enumerate(tasks, 1):
+        # Slots in task_details for tasks to ingest, filled in as they complete
+        pending = []
+        for i, (task, (should_update, reason)) in enumerate(zip(tasks, decisions), 1):
             catalog_key = task['catalog_key']
             source_api = task['source_api']
-            entity_name = task.get('entity_name', catalog_key)
-
-            # Delta check
-            should_update, reason = should_update_task(task)
 
             if force:
                 # Override delta check
@@ -60,10 +65,10 @@ class BatchOrchestrator:
 
             if should_update:
                 processed += 1
-                logger.info(f"[{i}/{total}] Processing {catalog_key} ({reason})")
+                logger.info("[%d/%d] Processing %s (%s)", i, total, catalog_key, reason)
 
                 if dry_run:
-                    logger.debug(f"[DRY-RUN] Would process: {catalog_key}")
+                    logger.debug("[DRY-RUN] Would process: %s", catalog_key)
                     task_details.append({
                         'catalog_key': catalog_key,
                         'source_api': source_api,
@@ -72,44 +77,12 @@ class BatchOrchestrator:
                     })
                     successful += 1
                 else:
-                    try:
-                        success, data_was_new = self.engine.ingest_data(
-                            catalog_key=catalog_key,
-                            source_api=source_api,
-                            config_params=task['config_params']
-                        )
-
-                        if success:
-                            successful += 1
-                            status_msg = "NEW DATA" if data_was_new else "CACHED"
-                            logger.info(f"[SUCCESS] {catalog_key} ({status_msg})")
-                            task_details.append({
-                                'catalog_key': catalog_key,
-                                'source_api': source_api,
-                                'status': 'SUCCESS',
-                                'data_was_new': data_was_new
-                            })
-                        else:
-                            failed += 1
-                            logger.error(f"[FAILED] {catalog_key}")
-                            task_details.append({
-                                'catalog_key': catalog_key,
-                                'source_api': source_api,
-                                'status': 'FAILED'
-                            })
-
-                    except Exception as e:
-                        failed += 1
-                        logger.error(f"[ERROR] {catalog_key}: {e}", exc_info=True)
-                        task_details.append({
-                            'catalog_key': catalog_key,
-                            'source_api': source_api,
-                            'status': 'ERROR',
-                            'error': str(e)
-                        })
+                    pending.append((len(task_details), task))
+                    task_details.append(None)
             else:
                 skipped += 1
-                logger.debug(f"[{i}/{total}] Skipping {catalog_key} ({reason})")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[%d/%d] Skipping %s (%s)", i, total, catalog_key, reason)
                 task_details.append({
                     'catalog_key': catalog_key,
                     'source_api': source_api,
@@ -117,6 +90,49 @@ class BatchOrchestrator:
                     'reason': reason
                 })
 
+        if pending:
+            slots = {task['catalog_key']: slot for slot, task in pending}
+            pending_tasks = [task for _, task in pending]
+
+            # Hash and cache-check every task to be processed in one query
+            cache_state = self.engine.prefetch_cache_state(pending_tasks)
+
+            # Fetch concurrently; the batch's cache and watermark writes are flushed in bulk
+            with self.engine.batch():
+                results = self.engine.ingest_concurrently(pending_tasks, cache_state)
+                for task, (success, data_was_new), error in results:
+                    catalog_key = task['catalog_key']
+                    source_api = task['source_api']
+
+                    if error is not None:
+                        failed += 1
+                        logger.error("[ERROR] %s: %s", catalog_key, error, exc_info=error)
+                        detail = {
+                            'catalog_key': catalog_key,
+                            'source_api': source_api,
+                            'status': 'ERROR',
+                            'error': str(error)
+                        }
+                    elif success:
+                        successful += 1
+                        status_msg = "NEW DATA" if data_was_new else "CACHED"
+                        logger.info("[SUCCESS] %s (%s)", catalog_key, status_msg)
+                        detail = {
+                            'catalog_key': catalog_key,
+                            'source_api': source_api,
+                            'status': 'SUCCESS',
+                            'data_was_new': data_was_new
+                        }
+                    else:
+                        failed += 1
+                        logger.error("[FAILED] %s", catalog_key)
+                        detail = {
+                            'catalog_key': catalog_key,
+                            'source_api': source_api,
+                            'status': 'FAILED'
+                        }
+                    task_details[slots[catalog_key]] = detail
+
         # Compile statistics
         stats = {
             'total': total,
@@ -130,7 +146,7 @@ class BatchOrchestrator:
             'task_details': task_details
         }
 
-        logger.info(f"Batch completed: {successful} successful, {failed} failed, {skipped} skipped")
+        logger.info("Batch completed: %d successful, %d failed, %d skipped", successful, failed, skipped)
 
         return stats
 
@@ -192,7 +208,7 @@ class BatchOrchestrator:
             marker = "→" if status in ['SUCCESS', 'DRY-RUN'] else "◊"
 
             reason_str = f" ({reason})" if reason else ""
-            print(f"{marker} [{i:3d}/{total}] {status_short:7s} {catalog_key:20s} ({source_api:10s}){reason_str}")
+            lines.append(f"{marker} [{i:3d}/{total}] {status_short:7s} {catalog_key:20s} ({source_api:10s}){reason_str}")
 
         lines.append("="*80)
         return lines
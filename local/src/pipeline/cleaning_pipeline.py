@@ -12,10 +12,15 @@ and outputs standardized records to Silver Layer tables:
 import sys
 import os
 import json
+import pickle
 import sqlite3
+import itertools
 import logging
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any
 from dataclasses import dataclass
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..'))
@@ -35,10 +40,98 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_NEWS_COLUMNS = ('fingerprint', 'catalog_key', 'published_at', 'title', 'url',
+                 'body', 'author', 'source_name')
 
-@dataclass
+# Silver Layer table each source cleans into: (table, columns, upsert key).
+# Time series rows upsert on (catalog_key, date) so revised values update the
+# existing row in place; news rows (no upsert key) are replaced by fingerprint
+SILVER_TABLES = {
+    'FRED': ('timeseries_macro', ('catalog_key', 'date', 'value'),
+             ('catalog_key', 'date')),
+    'yfinance': ('timeseries_micro',
+                 ('catalog_key', 'date', 'val_open', 'val_high', 'val_low',
+                  'val_close', 'val_volume'),
+                 ('catalog_key', 'date')),
+    'RSS': ('news_intel_pool', _NEWS_COLUMNS, None),
+    'NewsAPI': ('news_intel_pool', _NEWS_COLUMNS, None),
+}
+
+
+def _silver_insert_sql(table: str, columns: tuple, upsert_key: Optional[tuple]) -> str:
+    """Build the INSERT statement for a SILVER_TABLES entry."""
+    placeholders = ', '.join('?' * len(columns))
+    if upsert_key is None:
+        return f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+    updates = ', '.join(f"{col} = excluded.{col}" for col in columns if col not in upsert_key)
+    return (
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders}) "
+        f"ON CONFLICT({', '.join(upsert_key)}) DO UPDATE SET {updates}"
+    )
+
+
+# One prepared statement per source, built once
+_SILVER_INSERT_SQL = {
+    source: _silver_insert_sql(*config) for source, config in SILVER_TABLES.items()
+}
+
+_SQL_UPSERT_WM = """
+    INSERT INTO sync_watermarks (catalog_key, last_cleaned_at, last_ingested_at)
+    VALUES (?, ?, ?)
+    ON CONFLICT(catalog_key) DO UPDATE SET
+        last_cleaned_at = excluded.last_cleaned_at,
+        last_ingested_at = excluded.last_ingested_at
+"""
+
+# Cleaned Silver records held in memory before they are spilled to disk
+_SILVER_FLUSH_SIZE = 5000
+
+# Seconds a connection waits on another source's write lock before failing
+_BUSY_TIMEOUT = 30.0
+
+
+class _SilverSpill:
+    """Chunks of cleaned Silver records parked in a temporary file.
+
+    Cleaning RSS and NewsAPI records fetches article bodies over HTTP, so the
+    chunks wait here instead of in an open write transaction; the database
+    write lock is only taken once the source is cleaned, to copy them in.
+    """
+
+    def __init__(self):
+        self._file = None
+        self.chunks = 0
+        self.records = 0
+
+    def append(self, records: List[Dict]):
+        """Write a chunk to the spill file."""
+        if self._file is None:
+            self._file = tempfile.TemporaryFile()
+        pickle.dump(records, self._file, pickle.HIGHEST_PROTOCOL)
+        self.chunks += 1
+        self.records += len(records)
+
+    def __iter__(self):
+        """Yield the spilled chunks in the order they were appended."""
+        if self._file is None:
+            return
+        self._file.seek(0)
+        for _ in range(self.chunks):
+            yield pickle.load(self._file)
+
+    def close(self):
+        """Delete the spill file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+@dataclass(slots=True)
 class CleaningStats:
-    """Track cleaning operation statistics."""
+    """Track cleaning operation statistics.
+
+    Slotted, since the counters are bumped once per Bronze record.
+    """
     source_api: str
     input_records: int = 0
     cleaned_records: int = 0
@@ -71,11 +164,17 @@ class CleaningPipeline:
     def __init__(self, db_path: str = AppConfig.DB_PATH):
         """Initialize pipeline with database connection."""
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path)
-        self.conn.row_factory = sqlite3.Row
-        self.conn.execute("PRAGMA journal_mode=WAL")
-        self.conn.execute("PRAGMA synchronous=NORMAL")
-        
+        # synchronous level for new connections; OFF during a full rebuild
+        self._synchronous = 'NORMAL'
+        # Set by reset_watermark so the next run() re-cleans as a full rebuild
+        self._rebuild_pending = False
+        self.conn = self._connect()
+        # Indexes for the watermark and delta queries (no-op once created).
+        # Imported here: init_db calls logging.basicConfig on import, which
+        # must not pre-empt this module's log format
+        from local.src.database.init_db import create_indexes
+        create_indexes(self.conn)
+
         # Cleaner registry
         self.cleaners = {
             'FRED': FredCleaner,
@@ -84,8 +183,23 @@ class CleaningPipeline:
             'NewsAPI': NewsAPICleaner,
         }
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection configured for bulk cleaning."""
+        conn = sqlite3.connect(self.db_path, timeout=_BUSY_TIMEOUT)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA synchronous={self._synchronous}")
+        # Bulk-clean settings: 64 MB page cache, temp structures in memory,
+        # memory-mapped reads and fewer WAL checkpoints mid-batch
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA wal_autocheckpoint=10000")
+        return conn
+
     def run(self, source_api: Optional[str] = None, 
-            dry_run: bool = False, limit: Optional[int] = None) -> Dict[str, CleaningStats]:
+            dry_run: bool = False, limit: Optional[int] = None,
+            full_rebuild: bool = False) -> Dict[str, CleaningStats]:
         """
         Run cleaning pipeline on Bronze Layer data.
         
@@ -93,25 +207,126 @@ class CleaningPipeline:
             source_api: Filter by specific source ('FRED', 'yfinance', 'RSS') or None for all
             dry_run: If True, don't insert into Silver Layer (only show what would be done)
             limit: Maximum number of records to process per source
+            full_rebuild: Re-cleaning from reset watermarks, which a crash can
+                simply repeat; commits skip fsync (synchronous=OFF). Implied
+                by the first run() after reset_watermark
             
         Returns:
             Dictionary of cleaning stats by source API
         """
-        logger.info(f"Starting cleaning pipeline (dry_run={dry_run})")
+        full_rebuild = (full_rebuild or self._rebuild_pending) and not dry_run
+        logger.info(f"Starting cleaning pipeline (dry_run={dry_run}, full_rebuild={full_rebuild})")
+        
+        # journal_mode stays WAL: leaving it needs exclusive access to the
+        # database, and rollback must keep working for per-source atomicity
+        if full_rebuild:
+            self._set_synchronous('OFF')
+        try:
+            stats = self._run_sources(source_api, dry_run, limit)
+        finally:
+            if full_rebuild:
+                self._set_synchronous('NORMAL')
+        
+        if full_rebuild:
+            self._rebuild_pending = False
         
+        self._print_summary(stats)
+        return stats
+    
+    def _set_synchronous(self, level: str):
+        """Apply a synchronous level to the pipeline's and future connections."""
+        self._synchronous = level
+        self.conn.execute(f"PRAGMA synchronous={level}")
+    
+    def _run_sources(self, source_api: Optional[str], dry_run: bool,
+                     limit: Optional[int]) -> Dict[str, CleaningStats]:
+        """Clean each selected source, in parallel when there are several."""
         stats = {}
         sources = [source_api] if source_api else list(self.cleaners.keys())
-        
-        for source in sources:
-            if source in self.cleaners:
+        sources = [source for source in sources if source in self.cleaners]
+        watermark_info = self._load_watermark_info(sources)
+        
+        if len(sources) > 1:
+            # RSS and NewsAPI both replace news_intel_pool rows by fingerprint,
+            # so sources sharing a Silver table run in order on one worker and
+            # the surviving row stays deterministic. Each group gets its own
+            # thread and connection; WAL lets them read concurrently while
+            # their commits take turns on the write lock
+            groups: Dict[str, List[str]] = {}
+            for source in sources:
+                groups.setdefault(SILVER_TABLES[source][0], []).append(source)
+            
+            results = {}
+            with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+                futures = [
+                    executor.submit(self._process_sources_isolated, group, dry_run,
+                                    limit, watermark_info)
+                    for group in groups.values()
+                ]
+                for future in futures:
+                    results.update(future.result())
+            stats = {source: results[source] for source in sources}
+        else:
+            for source in sources:
                 cleaner_class = self.cleaners[source]
-                stats[source] = self._process_source(cleaner_class, source, dry_run, limit)
+                stats[source] = self._process_source(cleaner_class, source, dry_run, limit,
+                                                     watermark_info=watermark_info[source])
         
-        self._print_summary(stats)
         return stats
     
+    def _load_watermark_info(self, sources: List[str],
+                             conn: Optional[sqlite3.Connection] = None) -> Dict[str, tuple]:
+        """
+        Read the cleaning watermark state of several sources in one query.
+        
+        Returns:
+            {source_api: (total_catalogs, cleaned_count, oldest_time, first_inserted_at)},
+            the same row _process_source would otherwise query per source
+        """
+        # Sources without Bronze data match the per-source query's empty aggregate
+        info = {source: (0, 0, None, None) for source in sources}
+        if not sources:
+            return info
+        
+        placeholders = ','.join('?' * len(sources))
+        conn = conn or self.conn
+        cursor = conn.execute(f"""
+            SELECT 
+                ric.source_api,
+                COUNT(*) as total_catalogs,
+                COUNT(sw.last_cleaned_at) as cleaned_count,
+                MIN(COALESCE(sw.last_cleaned_at, '1970-01-01')) as oldest_time,
+                MIN(ric.first_inserted_at) as first_inserted_at
+            FROM (
+                SELECT source_api, catalog_key, MIN(inserted_at) as first_inserted_at
+                FROM raw_ingestion_cache
+                WHERE source_api IN ({placeholders})
+                GROUP BY source_api, catalog_key
+            ) ric
+            LEFT JOIN sync_watermarks sw USING (catalog_key)
+            GROUP BY ric.source_api
+        """, sources)
+        for row in cursor:
+            info[row[0]] = tuple(row[1:])
+        
+        return info
+    
+    def _process_sources_isolated(self, sources: List[str], dry_run: bool,
+                                  limit: Optional[int],
+                                  watermark_info: Dict[str, tuple]) -> Dict[str, CleaningStats]:
+        """Run _process_source for each source, in order, on one dedicated connection."""
+        with closing(self._connect()) as conn:
+            return {
+                source: self._process_source(self.cleaners[source], source,
+                                             dry_run, limit, conn=conn,
+                                             watermark_info=watermark_info[source])
+                for source in sources
+            }
+    
     def _process_source(self, cleaner_class, source_api: str, 
-                       dry_run: bool, limit: Optional[int]) -> CleaningStats:
+                       dry_run: bool, limit: Optional[int],
+                       conn: Optional[sqlite3.Connection] = None,
+                       watermark_info: Optional[tuple] = None) -> CleaningStats:
         """
         Process records for a specific source API with differential cleaning.
         
@@ -121,27 +336,28 @@ class CleaningPipeline:
         3. Transform: Apply appropriate cleaner to each record
         4. Upsert: Insert cleaned records to Silver Layer (atomic transaction)
         5. Update watermark: Update sync_watermarks with new last_cleaned_at
+        
+        Large deltas are spilled to a temporary file in chunks of
+        _SILVER_FLUSH_SIZE records and written in one transaction that commits
+        with the watermark update, once every record is cleaned.
+        
+        watermark_info, when given, is this source's row from
+        _load_watermark_info and replaces the step 1 query.
         """
         start_time = datetime.now(timezone.utc)
         stats = CleaningStats(source_api=source_api)
+        conn = conn or self.conn
+        # The delta is streamed on its own connection, so the write at the
+        # end never shares a connection with an open read statement
+        read_conn = self._connect()
+        spill = _SilverSpill()
         
         try:
             # Step 1: Get current watermark
             # If ANY catalog_key has NULL last_cleaned_at, we need to clean from the beginning of Bronze data
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                SELECT 
-                    COUNT(*) as total_catalogs,
-                    COUNT(CASE WHEN sw.last_cleaned_at IS NOT NULL THEN 1 END) as cleaned_count,
-                    MIN(COALESCE(sw.last_cleaned_at, '1970-01-01')) as oldest_time
-                FROM (
-                    SELECT DISTINCT catalog_key FROM raw_ingestion_cache
-                    WHERE source_api = ?
-                )
-                LEFT JOIN sync_watermarks sw USING (catalog_key)
-            """, (source_api,))
-            
-            watermark_row = cursor.fetchone()
+            watermark_row = watermark_info
+            if watermark_row is None:
+                watermark_row = self._load_watermark_info([source_api], conn)[source_api]
             total_catalogs = watermark_row[0]
             cleaned_count = watermark_row[1]
             
@@ -149,11 +365,7 @@ class CleaningPipeline:
             # Otherwise use the minimum cleaned time
             if cleaned_count < total_catalogs:
                 # Some catalogs never been cleaned - start from Bronze data's beginning
-                cursor.execute("""
-                    SELECT MIN(inserted_at) FROM raw_ingestion_cache WHERE source_api = ?
-                """, (source_api,))
-                result = cursor.fetchone()
-                last_cleaned_at = result[0] if result[0] else None
+                last_cleaned_at = watermark_row[3] if watermark_row[3] else None
             else:
                 # All catalogs have been cleaned - use minimum watermark time
                 last_cleaned_at = watermark_row[2] if watermark_row[2] != '1970-01-01' else None
@@ -163,17 +375,16 @@ class CleaningPipeline:
             # 1. Newer than the earliest cleaned timestamp (for already-processed catalogs)
             # 2. ALL records from catalogs that have NEVER been cleaned (last_cleaned_at IS NULL)
             query = """
-                SELECT request_hash, catalog_key, source_api, raw_payload, inserted_at
-                FROM raw_ingestion_cache
-                WHERE source_api = ?
+                SELECT ric.request_hash, ric.catalog_key, ric.source_api,
+                       ric.raw_payload, ric.inserted_at
+                FROM raw_ingestion_cache ric
+                LEFT JOIN sync_watermarks sw USING (catalog_key)
+                WHERE ric.source_api = ?
                   AND (
-                    -- Either this catalog has never been cleaned
-                    catalog_key IN (
-                        SELECT catalog_key FROM sync_watermarks 
-                        WHERE last_cleaned_at IS NULL
-                    )
+                    -- Either this catalog has never been cleaned (no watermark yet)
+                    sw.last_cleaned_at IS NULL
                     -- Or the data is newer than the oldest cleaned timestamp
-                    OR inserted_at > ?
+                    OR ric.inserted_at > ?
                   )
             """
             params = [source_api]
@@ -182,28 +393,35 @@ class CleaningPipeline:
             else:
                 params.append('1970-01-01')  # Safe default for NULL case
             
-            query += " ORDER BY inserted_at ASC"
+            query += " ORDER BY ric.inserted_at ASC"
             
             if limit:
                 query += " LIMIT ?"
                 params.append(limit)
             
-            cursor.execute(query, params)
-            records = cursor.fetchall()
-            stats.input_records = len(records)
+            # Stream the rows rather than materializing every raw_payload at once;
+            # the first row is read up front to detect an empty delta
+            cursor = read_conn.execute(query, params)
+            first_record = cursor.fetchone()
             
-            if not records:
+            if first_record is None:
                 logger.info(f"No new {source_api} records to clean (last_cleaned_at: {last_cleaned_at})")
                 stats.skipped_records = 0
                 return stats
             
-            logger.info(f"Processing {stats.input_records} new {source_api} records (delta from {last_cleaned_at})")
+            logger.info(f"Processing new {source_api} records (delta from {last_cleaned_at})")
             
             # Step 3: Transform records through cleaner
             silver_records = []
             max_inserted_at = last_cleaned_at
-            
-            for record in records:
+            # One cleaner per catalog_key (NewsAPI's builds a web scraper),
+            # reused across that key's records without reordering them
+            cleaners = {}
+            # Counted in locals and copied onto stats after the loop
+            input_records = cleaned_records = failed_records = skipped_records = 0
+            
+            for record in itertools.chain((first_record,), cursor):
+                input_records += 1
                 try:
                     raw_payload = json.loads(record['raw_payload'])
                     
@@ -212,8 +430,10 @@ class CleaningPipeline:
                         if max_inserted_at is None or record['inserted_at'] > max_inserted_at:
                             max_inserted_at = record['inserted_at']
                     
-                    # Instantiate cleaner for this catalog_key
-                    cleaner = cleaner_class(record['catalog_key'])
+                    # Get (or instantiate) the cleaner for this catalog_key
+                    cleaner = cleaners.get(record['catalog_key'])
+                    if cleaner is None:
+                        cleaner = cleaners[record['catalog_key']] = cleaner_class(record['catalog_key'])
                     
                     # Process based on source (enable body extraction for RSS and NewsAPI)
                     if source_api in ['RSS', 'NewsAPI']:
@@ -222,32 +442,51 @@ class CleaningPipeline:
                         cleaned = cleaner.process(raw_payload)
                     
                     if cleaned:
-                        stats.cleaned_records += 1
+                        cleaned_records += 1
                         silver_records.extend(cleaned)
                     else:
-                        stats.skipped_records += 1
+                        skipped_records += 1
                         
                 except json.JSONDecodeError as e:
-                    logger.warning(f"Invalid JSON in {record.get('catalog_key', '?')}: {e}")
-                    stats.failed_records += 1
+                    logger.warning(f"Invalid JSON in {record['catalog_key']}: {e}")
+                    failed_records += 1
                 except Exception as e:
-                    logger.warning(f"Error cleaning {record.get('catalog_key', '?')}: {e}")
-                    stats.failed_records += 1
+                    logger.warning(f"Error cleaning {record['catalog_key']}: {e}")
+                    failed_records += 1
+                
+                # Bound memory on large deltas; the database is not touched
+                # until cleaning is done
+                if len(silver_records) >= _SILVER_FLUSH_SIZE:
+                    if dry_run:
+                        spill.records += len(silver_records)
+                    else:
+                        spill.append(silver_records)
+                    silver_records = []
+            
+            stats.input_records = input_records
+            stats.cleaned_records = cleaned_records
+            stats.failed_records = failed_records
+            stats.skipped_records = skipped_records
             
             # Step 4 & 5: Insert to Silver Layer + update watermark (atomic transaction)
-            if not dry_run and silver_records:
+            total_silver = spill.records + len(silver_records)
+            if not dry_run and total_silver:
                 self._atomic_insert_and_update_watermark(
-                    source_api, silver_records, max_inserted_at
+                    source_api, silver_records, max_inserted_at, conn=conn,
+                    spilled_chunks=spill
                 )
-                logger.info(f"Inserted {len(silver_records)} records to Silver Layer")
+                logger.info(f"Inserted {total_silver} records to Silver Layer")
                 logger.info(f"Updated watermark: last_cleaned_at={max_inserted_at}")
             elif dry_run:
-                logger.info(f"[DRY RUN] Would insert {len(silver_records)} records to Silver Layer")
+                logger.info(f"[DRY RUN] Would insert {total_silver} records to Silver Layer")
                 logger.info(f"[DRY RUN] Would update watermark to {max_inserted_at}")
             
         except Exception as e:
             logger.error(f"Error processing {source_api}: {e}")
             raise
+        finally:
+            spill.close()
+            read_conn.close()
         
         elapsed = (datetime.now(timezone.utc) - start_time).total_seconds()
         stats.duration_seconds = elapsed
@@ -258,59 +497,10 @@ class CleaningPipeline:
     
     def _insert_silver_records(self, source_api: str, records: List[Dict]) -> int:
         """Insert cleaned records to appropriate Silver Layer table."""
-        cursor = self.conn.cursor()
         inserted = 0
         
         try:
-            if source_api == 'FRED':
-                # timeseries_macro
-                for record in records:
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO timeseries_macro 
-                        (catalog_key, date, value)
-                        VALUES (?, ?, ?)
-                    """, (
-                        record.get('catalog_key'),
-                        record.get('date'),
-                        record.get('value'),
-                    ))
-                    inserted += 1
-            
-            elif source_api == 'yfinance':
-                # timeseries_micro
-                for record in records:
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO timeseries_micro
-                        (catalog_key, date, val_open, val_high, val_low, val_close, val_volume)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        record.get('catalog_key'),
-                        record.get('date'),
-                        record.get('val_open'),
-                        record.get('val_high'),
-                        record.get('val_low'),
-                        record.get('val_close'),
-                        record.get('val_volume'),
-                    ))
-                    inserted += 1
-            
-            elif source_api == 'RSS':
-                # news_intel_pool
-                for record in records:
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO news_intel_pool
-                        (fingerprint, catalog_key, published_at, title, url, body)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    """, (
-                        record.get('fingerprint'),
-                        record.get('catalog_key'),
-                        record.get('published_at'),
-                        record.get('title'),
-                        record.get('url'),
-                        record.get('body'),
-                    ))
-                    inserted += 1
-            
+            inserted = self._bulk_insert(source_api, records, self.conn.cursor())
             self.conn.commit()
             
         except Exception as e:
@@ -321,7 +511,9 @@ class CleaningPipeline:
     
     def _atomic_insert_and_update_watermark(self, source_api: str, 
                                             silver_records: List[Dict], 
-                                            new_watermark: str):
+                                            new_watermark: str,
+                                            conn: Optional[sqlite3.Connection] = None,
+                                            spilled_chunks: Iterable[List[Dict]] = ()):
         """
         Atomically insert Silver Layer records and update watermark.
         
@@ -332,110 +524,74 @@ class CleaningPipeline:
         
         This approach updates each affected catalog_key directly rather than
         using a system-level watermark, keeping watermarks aligned with actual data.
+        
+        spilled_chunks holds records cleaned earlier (see _SilverSpill);
+        they are written first, in the same transaction.
         """
-        cursor = self.conn.cursor()
+        conn = conn or self.conn
+        cursor = conn.cursor()
         
         try:
-            # Begin transaction
-            self.conn.execute("BEGIN TRANSACTION")
+            # Begin transaction, taking the write lock up front so sources
+            # cleaned in parallel wait on each other instead of failing
+            conn.execute("BEGIN IMMEDIATE")
             
-            # Collect unique catalog_keys being inserted
-            catalog_keys = set()
-            
-            # Step 1: Insert records
+            # Step 1: Insert the records, one executemany per chunk, and
+            # collect the unique catalog_keys being inserted
             inserted = 0
-            if source_api == 'FRED':
-                for record in silver_records:
-                    catalog_keys.add(record.get('catalog_key'))
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO timeseries_macro 
-                        (catalog_key, date, value)
-                        VALUES (?, ?, ?)
-                    """, (
-                        record.get('catalog_key'),
-                        record.get('date'),
-                        record.get('value'),
-                    ))
-                    inserted += 1
-            
-            elif source_api == 'yfinance':
-                for record in silver_records:
-                    catalog_keys.add(record.get('catalog_key'))
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO timeseries_micro
-                        (catalog_key, date, val_open, val_high, val_low, val_close, val_volume)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        record.get('catalog_key'),
-                        record.get('date'),
-                        record.get('val_open'),
-                        record.get('val_high'),
-                        record.get('val_low'),
-                        record.get('val_close'),
-                        record.get('val_volume'),
-                    ))
-                    inserted += 1
-            
-            elif source_api == 'RSS':
-                for record in silver_records:
-                    catalog_keys.add(record.get('catalog_key'))
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO news_intel_pool
-                        (fingerprint, catalog_key, published_at, title, url, body, author, source_name)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        record.get('fingerprint'),
-                        record.get('catalog_key'),
-                        record.get('published_at'),
-                        record.get('title'),
-                        record.get('url'),
-                        record.get('body'),
-                        record.get('author'),
-                        record.get('source_name'),
-                    ))
-                    inserted += 1
-            
-            elif source_api == 'NewsAPI':
-                for record in silver_records:
-                    catalog_keys.add(record.get('catalog_key'))
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO news_intel_pool
-                        (fingerprint, catalog_key, published_at, title, url, body, author, source_name)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        record.get('fingerprint'),
-                        record.get('catalog_key'),
-                        record.get('published_at'),
-                        record.get('title'),
-                        record.get('url'),
-                        record.get('body'),
-                        record.get('author'),
-                        record.get('source_name'),
-                    ))
-                    inserted += 1
-            
-            # Step 2: Update watermarks for all affected catalog_keys
-            for catalog_key in catalog_keys:
-                cursor.execute("""
-                    INSERT OR IGNORE INTO sync_watermarks (catalog_key)
-                    VALUES (?)
-                """, (catalog_key,))
-                
-                cursor.execute("""
-                    UPDATE sync_watermarks
-                    SET last_cleaned_at = ?, last_ingested_at = ?
-                    WHERE catalog_key = ?
-                """, (new_watermark, new_watermark, catalog_key))
+            catalog_keys = set()
+            for chunk in itertools.chain(spilled_chunks, (silver_records,)):
+                catalog_keys.update(record.get('catalog_key') for record in chunk)
+                inserted += self._flush_silver_records(source_api, chunk, conn)
+            
+            # Step 2: Upsert watermarks for all affected catalog_keys
+            cursor.executemany(
+                _SQL_UPSERT_WM,
+                [(catalog_key, new_watermark, new_watermark) for catalog_key in catalog_keys]
+            )
             
             # Step 3: Commit transaction
-            self.conn.commit()
+            conn.commit()
             logger.info(f"Atomic commit: {inserted} records inserted + {len(catalog_keys)} watermarks updated")
             
         except Exception as e:
             logger.error(f"Error in atomic insert: {e}, rolling back...")
-            self.conn.rollback()
+            conn.rollback()
             raise
     
+    def _flush_silver_records(self, source_api: str, records: List[Dict],
+                              conn: sqlite3.Connection) -> int:
+        """
+        Write a chunk of cleaned records into the open transaction on conn.
+        
+        The chunk runs inside a savepoint and is not committed; a later
+        failure still rolls back every chunk of the source.
+        
+        Returns:
+            Number of records written
+        """
+        cursor = conn.cursor()
+        cursor.execute("SAVEPOINT silver_chunk")
+        inserted = self._bulk_insert(source_api, records, cursor)
+        cursor.execute("RELEASE silver_chunk")
+        return inserted
+    
+    def _bulk_insert(self, source_api: str, records: List[Dict],
+                     cursor: sqlite3.Cursor) -> int:
+        """
+        Insert records into the source's SILVER_TABLES table with one executemany.
+        
+        Returns:
+            Number of records written (0 for a source without a Silver table)
+        """
+        if source_api not in SILVER_TABLES:
+            return 0
+        
+        columns = SILVER_TABLES[source_api][1]
+        rows = [tuple(map(record.get, columns)) for record in records]
+        cursor.executemany(_SILVER_INSERT_SQL[source_api], rows)
+        return len(rows)
+    
     def _print_summary(self, stats: Dict[str, CleaningStats]):
         """Print cleaning pipeline summary."""
         print("\n" + "=" * 100)
@@ -495,22 +651,37 @@ class CleaningPipeline:
             logger.info(f"\nVerifying {source} cleaning consistency...")
             source_results = {}
             
-            # Phase 1: Data Completeness
-            cursor.execute("""
-                SELECT COUNT(*) as bronze_count FROM raw_ingestion_cache
-                WHERE source_api = ?
-            """, (source,))
-            bronze_count = cursor.fetchone()['bronze_count']
-            
-            # Get expected silver count
-            if source == 'FRED':
-                cursor.execute("SELECT COUNT(*) as silver_count FROM timeseries_macro")
-            elif source == 'yfinance':
-                cursor.execute("SELECT COUNT(*) as silver_count FROM timeseries_micro")
-            elif source == 'RSS':
-                cursor.execute("SELECT COUNT(*) as silver_count FROM news_intel_pool")
+            # All three phases read from one query: Bronze count and max
+            # inserted_at, Silver count and distinct keys, and the watermark
+            table = SILVER_TABLES[source][0]
+            is_news = table == 'news_intel_pool'
+            unique_column = 'fingerprint' if is_news else 'date'
+            cursor.execute(f"""
+                WITH bronze AS (
+                    SELECT COUNT(*) as bronze_count, MAX(inserted_at) as max_inserted
+                    FROM raw_ingestion_cache
+                    WHERE source_api = ?
+                ),
+                silver AS (
+                    SELECT COUNT(*) as silver_count, COUNT(DISTINCT {unique_column}) as unique_count
+                    FROM {table}
+                )
+                SELECT 
+                    bronze.bronze_count,
+                    bronze.max_inserted,
+                    silver.silver_count,
+                    silver.unique_count,
+                    (
+                        SELECT last_cleaned_at FROM sync_watermarks
+                        WHERE catalog_key = ?
+                    ) as watermark_time
+                FROM bronze, silver
+            """, (source, f"SYSTEM_CLEANING_{source}"))
+            row = cursor.fetchone()
             
-            silver_count = cursor.fetchone()['silver_count']
+            # Phase 1: Data Completeness
+            bronze_count = row['bronze_count']
+            silver_count = row['silver_count']
             source_results['phase_1_completeness'] = {
                 'bronze_records': bronze_count,
                 'silver_records': silver_count,
@@ -519,15 +690,10 @@ class CleaningPipeline:
             logger.info(f"  Phase 1 [Completeness]: Bronze={bronze_count}, Silver={silver_count}")
             
             # Phase 2: Deduplication
-            if source == 'RSS':
+            total_records = silver_count
+            if is_news:
                 # Check fingerprint uniqueness
-                cursor.execute("""
-                    SELECT COUNT(*) as total, COUNT(DISTINCT fingerprint) as unique_fps
-                    FROM news_intel_pool
-                """)
-                row = cursor.fetchone()
-                total_records = row['total']
-                unique_fps = row['unique_fps']
+                unique_fps = row['unique_count']
                 dedup_rate = (unique_fps / total_records * 100) if total_records > 0 else 0
                 source_results['phase_2_deduplication'] = {
                     'total_records': total_records,
@@ -538,14 +704,7 @@ class CleaningPipeline:
                 logger.info(f"  Phase 2 [Deduplication]: {unique_fps}/{total_records} unique fingerprints ({dedup_rate:.1f}%)")
             else:
                 # Check date uniqueness for timeseries
-                table = 'timeseries_macro' if source == 'FRED' else 'timeseries_micro'
-                cursor.execute(f"""
-                    SELECT COUNT(*) as total, COUNT(DISTINCT date) as unique_dates
-                    FROM {table}
-                """)
-                row = cursor.fetchone()
-                total_records = row['total']
-                unique_dates = row['unique_dates']
+                unique_dates = row['unique_count']
                 source_results['phase_2_deduplication'] = {
                     'total_records': total_records,
                     'unique_dates': unique_dates,
@@ -554,18 +713,8 @@ class CleaningPipeline:
                 logger.info(f"  Phase 2 [Deduplication]: {unique_dates}/{total_records} unique dates")
             
             # Phase 3: Watermark Alignment
-            cursor.execute("""
-                SELECT last_cleaned_at FROM sync_watermarks
-                WHERE catalog_key = ?
-            """, (f"SYSTEM_CLEANING_{source}",))
-            watermark_row = cursor.fetchone()
-            watermark_time = watermark_row['last_cleaned_at'] if watermark_row else None
-            
-            cursor.execute("""
-                SELECT MAX(inserted_at) as max_inserted FROM raw_ingestion_cache
-                WHERE source_api = ?
-            """, (source,))
-            max_inserted = cursor.fetchone()['max_inserted']
+            watermark_time = row['watermark_time']
+            max_inserted = row['max_inserted']
             
             alignment_ok = watermark_time == max_inserted if max_inserted else watermark_time is None
             source_results['phase_3_watermark_alignment'] = {
@@ -633,6 +782,7 @@ class CleaningPipeline:
                 """, catalog_keys)
                 
                 self.conn.commit()
+                self._rebuild_pending = True
                 logger.info(f"Reset watermark for {source_api} ({len(catalog_keys)} catalog_keys)")
             else:
                 logger.info(f"No catalog_keys found for source: {source_api}")
@@ -646,6 +796,7 @@ class CleaningPipeline:
                 )
             """)
             self.conn.commit()
+            self._rebuild_pending = True
             logger.info("Reset all cleaning watermarks")
     
     def close(self):
@@ -2,9 +2,13 @@
 
 """Incremental ingestion engine with structured logging and watermark management."""
 
+import asyncio
 import logging
 import json
-from typing import Dict, Any, Optional, List, Tuple
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple, Iterable, Iterator
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -14,10 +18,16 @@ from local.config import AppConfig
 
 logger = logging.getLogger(__name__)
 
+# Assets fetched at once by the batch entry points; the work is HTTP-bound
+DEFAULT_CONCURRENCY = 10
+
 
 class IncrementalIngestionEngine:
     """Engine for incremental data ingestion with structured logging."""
 
+    # Accepted role spellings mapped to the data_catalog role codes
+    _ROLE_MAP = {'JUDGMENT': 'J', 'VALIDATION': 'V', 'J': 'J', 'V': 'V'}
+
     def __init__(self, db_core: Optional[DatabaseCore] = None):
         """Initialize incremental ingestion engine.
 
@@ -29,17 +39,24 @@ class IncrementalIngestionEngine:
         self.run_start_time: Optional[datetime] = None
         self.run_end_time: Optional[datetime] = None
 
-    def ingest_by_asset_key(self, catalog_key: str, dry_run: bool = False) -> Dict[str, Any]:
+    def ingest_by_asset_key(self, catalog_key: str, dry_run: bool = False,
+                            catalog_entry: Optional[Any] = None,
+                            watermarks: Optional[Dict[str, datetime]] = None) -> Dict[str, Any]:
         """Ingest a single asset using incremental logic.
 
         Args:
             catalog_key: Asset catalog key
             dry_run: If True, test connectivity only
+            catalog_entry: The asset's data_catalog row, if already loaded
+            watermarks: Last ingested timestamps prefetched for the batch;
+                keys missing were never ingested
 
         Returns:
             Ingestion result with metadata
         """
         asset_start = datetime.now(timezone.utc)
+        # Durations use the monotonic clock; asset_start only stamps the result
+        started = time.perf_counter()
 
         result = {
             'catalog_key': catalog_key,
@@ -55,45 +72,55 @@ class IncrementalIngestionEngine:
 
         try:
             # Get catalog and watermark info
-            catalog_entry = self.db_core.catalog.get_by_key(catalog_key)
+            if catalog_entry is None:
+                catalog_entry = self.db_core.catalog.get_by_key(catalog_key)
             if not catalog_entry:
                 result['status'] = 'failed'
                 result['error'] = 'Catalog key not found'
-                logger.error(f"[{catalog_key}] Catalog entry not found")
+                logger.error("[%s] Catalog entry not found", catalog_key)
                 return result
 
             # Get last ingested timestamp for incremental fetching
-            last_ingested = self.db_core.watermarks.get_last_ingested(catalog_key)
+            if watermarks is None:
+                watermarks = {catalog_key: self.db_core.watermarks.get_last_ingested(catalog_key)}
+            last_ingested = watermarks.get(catalog_key)
             result['last_ingested_at'] = last_ingested.isoformat() if last_ingested else None
 
             # Ingest using AdapterManager
-            ingest_result = self.adapter_manager.ingest_asset(catalog_key, dry_run=dry_run)
-
-            # Merge results
-            result.update(ingest_result)
-            result['status'] = ingest_result['status']
-
-            if ingest_result['status'] == 'success':
-                logger.info(f"[{catalog_key}] Successfully ingested (incremental)")
-            elif ingest_result['status'] == 'skipped':
-                logger.debug(f"[{catalog_key}] Skipped (idempotent)")
-            elif ingest_result['status'] == 'dry_run_passed':
-                logger.info(f"[{catalog_key}] Dry-run passed")
+            ingest_result = self.adapter_manager.ingest_asset(
+                catalog_key, dry_run=dry_run, catalog_entry=catalog_entry, watermarks=watermarks
+            )
+
+            # Merge results into the adapter's dict: inside a batch() its
+            # status stays 'pending' until AdapterManager.flush() settles it
+            for key, value in result.items():
+                ingest_result.setdefault(key, value)
+            result = ingest_result
+            status = result['status']
+
+            if status == 'success':
+                logger.info("[%s] Successfully ingested (incremental)", catalog_key)
+            elif status == 'skipped':
+                logger.debug("[%s] Skipped (idempotent)", catalog_key)
+            elif status == 'dry_run_passed':
+                logger.info("[%s] Dry-run passed", catalog_key)
+            elif status == 'pending':
+                logger.debug("[%s] Buffered until the batch flushes", catalog_key)
             else:
-                logger.warning(f"[{catalog_key}] {ingest_result['status']}")
+                logger.warning("[%s] %s", catalog_key, status)
 
         except Exception as e:
             result['status'] = 'failed'
             result['error'] = str(e)
-            logger.error(f"[{catalog_key}] Ingestion failed: {e}", exc_info=True)
+            logger.error("[%s] Ingestion failed: %s", catalog_key, e, exc_info=True)
 
         finally:
-            asset_end = datetime.now(timezone.utc)
-            result['duration_seconds'] = (asset_end - asset_start).total_seconds()
+            result['duration_seconds'] = time.perf_counter() - started
 
         return result
 
-    def ingest_by_scope(self, scope: str, role: Optional[str] = None, dry_run: bool = False, limit: Optional[int] = None) -> Dict[str, Any]:
+    def ingest_by_scope(self, scope: str, role: Optional[str] = None, dry_run: bool = False, limit: Optional[int] = None,
+                        concurrency: int = DEFAULT_CONCURRENCY, keep_results: bool = True) -> Dict[str, Any]:
         """Ingest assets filtered by scope and/or role.
 
         Args:
@@ -101,44 +128,32 @@ class IncrementalIngestionEngine:
             role: Optional role filter ('JUDGMENT' or 'VALIDATION')
             dry_run: If True, test connectivity only
             limit: Maximum number of assets to process
+            concurrency: Maximum number of assets ingested at once
+            keep_results: If False, only aggregate statistics and return
+                results=None instead of holding every per-asset result
 
         Returns:
             Batch ingestion summary
         """
         batch_start = datetime.now(timezone.utc)
+        started = time.perf_counter()
 
         # Get active assets matching filters
-        active_entries = self.db_core.catalog.get_active()
-        catalog_keys = [
-            entry[0] for entry in active_entries
-            if entry  # Ensure not empty
-        ]
-
-        # Filter by scope and role using database
-        filtered_keys = []
-        for key in catalog_keys:
-            entry = self.db_core.catalog.get_by_key(key)
-            if entry and entry['scope'] == scope:
-                if role is None or entry['role'] == role:
-                    filtered_keys.append(key)
+        active_entries = self.db_core.catalog.get_active_filtered(scope=scope, role=role, limit=limit)
 
-        if limit:
-            filtered_keys = filtered_keys[:limit]
-
-        logger.info(f"Ingesting {len(filtered_keys)} assets with scope={scope}, role={role}")
+        logger.info("Ingesting %d assets with scope=%s, role=%s", len(active_entries), scope, role)
 
         # Ingest each asset
-        results = []
-        for catalog_key in filtered_keys:
-            result = self.ingest_by_asset_key(catalog_key, dry_run=dry_run)
-            results.append(result)
+        results = self._ingest_many(active_entries, dry_run, concurrency)
+        if keep_results:
+            results = list(results)
 
-        batch_end = datetime.now(timezone.utc)
-        duration = (batch_end - batch_start).total_seconds()
-
-        # Aggregate statistics
+        # Aggregate statistics (drains the stream when results are not kept)
         stats = self._calculate_statistics(results)
 
+        batch_end = datetime.now(timezone.utc)
+        duration = time.perf_counter() - started
+
         summary = {
             'batch_start': batch_start.isoformat(),
             'batch_end': batch_end.isoformat(),
@@ -148,54 +163,47 @@ class IncrementalIngestionEngine:
                 'role': role,
                 'dry_run': dry_run
             },
-            'results': results,
+            'results': results if keep_results else None,
             'statistics': stats
         }
 
-        logger.info(f"Batch complete: {stats['successful']}/{stats['total']} successful in {duration:.2f}s")
+        logger.info("Batch complete: %d/%d successful in %.2fs", stats['successful'], stats['total'], duration)
         return summary
 
-    def ingest_by_role(self, role: str, dry_run: bool = False, limit: Optional[int] = None) -> Dict[str, Any]:
+    def ingest_by_role(self, role: str, dry_run: bool = False, limit: Optional[int] = None,
+                       concurrency: int = DEFAULT_CONCURRENCY, keep_results: bool = True) -> Dict[str, Any]:
         """Ingest assets by role (JUDGMENT or VALIDATION).
 
         Args:
             role: Asset role ('JUDGMENT', 'VALIDATION', 'J', or 'V')
             dry_run: If True, test connectivity only
             limit: Maximum number of assets to process
+            concurrency: Maximum number of assets ingested at once
+            keep_results: If False, only aggregate statistics and return
+                results=None instead of holding every per-asset result
 
         Returns:
             Batch ingestion summary
         """
         # Normalize role to short form
-        role_map = {'JUDGMENT': 'J', 'VALIDATION': 'V', 'J': 'J', 'V': 'V'}
-        normalized_role = role_map.get(role, role)
+        normalized_role = self._ROLE_MAP.get(role, role)
 
         batch_start = datetime.now(timezone.utc)
+        started = time.perf_counter()
 
         # Get assets with specified role
-        active_entries = self.db_core.catalog.get_active()
-        filtered_keys = []
-
-        for entry in active_entries:
-            catalog_key = entry[0]
-            entry_data = self.db_core.catalog.get_by_key(catalog_key)
-            if entry_data and entry_data['role'] == normalized_role:
-                filtered_keys.append(catalog_key)
+        active_entries = self.db_core.catalog.get_active_filtered(role=normalized_role, limit=limit)
 
-        if limit:
-            filtered_keys = filtered_keys[:limit]
+        logger.info("Ingesting %d assets with role=%s", len(active_entries), normalized_role)
 
-        logger.info(f"Ingesting {len(filtered_keys)} assets with role={normalized_role}")
+        results = self._ingest_many(active_entries, dry_run, concurrency)
+        if keep_results:
+            results = list(results)
 
-        results = []
-        for catalog_key in filtered_keys:
-            result = self.ingest_by_asset_key(catalog_key, dry_run=dry_run)
-            results.append(result)
+        stats = self._calculate_statistics(results)
 
         batch_end = datetime.now(timezone.utc)
-        duration = (batch_end - batch_start).total_seconds()
-
-        stats = self._calculate_statistics(results)
+        duration = time.perf_counter() - started
 
         summary = {
             'batch_start': batch_start.isoformat(),
@@ -203,73 +211,145 @@ class IncrementalIngestionEngine:
             'duration_seconds': duration,
             'role': role,
             'dry_run': dry_run,
-            'results': results,
+            'results': results if keep_results else None,
             'statistics': stats
         }
 
-        logger.info(f"Role-based batch complete: {stats['successful']}/{stats['total']} successful")
+        logger.info("Role-based batch complete: %d/%d successful", stats['successful'], stats['total'])
         return summary
 
-    def ingest_all_active(self, dry_run: bool = False, limit: Optional[int] = None) -> Dict[str, Any]:
+    def ingest_all_active(self, dry_run: bool = False, limit: Optional[int] = None,
+                          concurrency: int = DEFAULT_CONCURRENCY, keep_results: bool = True) -> Dict[str, Any]:
         """Ingest all active assets.
 
         Args:
             dry_run: If True, test connectivity only
             limit: Maximum number of assets to process
+            concurrency: Maximum number of assets ingested at once
+            keep_results: If False, only aggregate statistics and return
+                results=None instead of holding every per-asset result
 
         Returns:
             Batch ingestion summary
         """
         batch_start = datetime.now(timezone.utc)
+        started = time.perf_counter()
 
-        active_entries = self.db_core.catalog.get_active()
-        catalog_keys = [entry[0] for entry in active_entries]
+        active_entries = self.db_core.catalog.get_active_filtered(limit=limit)
 
-        if limit:
-            catalog_keys = catalog_keys[:limit]
+        logger.info("Starting incremental ingestion for %d assets", len(active_entries))
 
-        logger.info(f"Starting incremental ingestion for {len(catalog_keys)} assets")
+        results = self._ingest_many(active_entries, dry_run, concurrency)
+        if keep_results:
+            results = list(results)
 
-        results = []
-        for catalog_key in catalog_keys:
-            result = self.ingest_by_asset_key(catalog_key, dry_run=dry_run)
-            results.append(result)
+        stats = self._calculate_statistics(results)
 
         batch_end = datetime.now(timezone.utc)
-        duration = (batch_end - batch_start).total_seconds()
-
-        stats = self._calculate_statistics(results)
+        duration = time.perf_counter() - started
 
         summary = {
             'batch_start': batch_start.isoformat(),
             'batch_end': batch_end.isoformat(),
             'duration_seconds': duration,
             'dry_run': dry_run,
-            'results': results,
+            'results': results if keep_results else None,
             'statistics': stats
         }
 
-        logger.info(f"Full ingestion complete: {stats['successful']}/{stats['total']} successful in {duration:.2f}s")
+        logger.info("Full ingestion complete: %d/%d successful in %.2fs", stats['successful'], stats['total'], duration)
         self.run_start_time = batch_start
         self.run_end_time = batch_end
 
         return summary
 
-    def _calculate_statistics(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    async def ingest_all_active_async(self, dry_run: bool = False, limit: Optional[int] = None,
+                                      concurrency: int = DEFAULT_CONCURRENCY,
+                                      keep_results: bool = True) -> Dict[str, Any]:
+        """Ingest all active assets without blocking the caller's event loop.
+
+        The batch runs on a worker thread with the same concurrent fetches as
+        ingest_all_active, so callers already inside asyncio can await it.
+
+        Args:
+            dry_run: If True, test connectivity only
+            limit: Maximum number of assets to process
+            concurrency: Maximum number of assets ingested at once
+            keep_results: If False, only aggregate statistics and return
+                results=None instead of holding every per-asset result
+
+        Returns:
+            Batch ingestion summary
+        """
+        return await asyncio.to_thread(
+            self.ingest_all_active, dry_run=dry_run, limit=limit,
+            concurrency=concurrency, keep_results=keep_results
+        )
+
+    def _ingest_many(self, catalog_entries: List[Any], dry_run: bool,
+                     max_workers: int = DEFAULT_CONCURRENCY) -> Iterator[Dict[str, Any]]:
+        """Ingest assets concurrently, yielding their results in catalog_entries order.
+
+        Each worker thread gets its own SQLite connection from the DatabaseSession;
+        AdapterManager serializes the writes, so only the fetches overlap, and
+        buffers them so the batch commits in a few transactions instead of
+        several per asset.
+
+        Args:
+            catalog_entries: data_catalog rows of the assets to ingest, passed
+                through so no asset re-reads its catalog row; their watermarks
+                are likewise loaded once up front
+            dry_run: If True, test connectivity only
+            max_workers: Maximum number of assets ingested at once
+
+        Yields:
+            Per-asset ingestion results, each once its buffered write has
+            committed or failed
+        """
+        watermarks = self.db_core.watermarks.get_last_ingested_many(
+            [entry['catalog_key'] for entry in catalog_entries]
+        )
+
+        def ingest(entry):
+            return self.ingest_by_asset_key(entry['catalog_key'], dry_run=dry_run,
+                                            catalog_entry=entry, watermarks=watermarks)
+
+        # Results still 'pending' wait here until a flush settles them
+        unsettled = deque()
+        with self.adapter_manager.batch():
+            if max_workers <= 1 or len(catalog_entries) <= 1:
+                for entry in catalog_entries:
+                    unsettled.append(ingest(entry))
+                    while unsettled and unsettled[0]['status'] != 'pending':
+                        yield unsettled.popleft()
+            else:
+                with ThreadPoolExecutor(max_workers=min(max_workers, len(catalog_entries))) as executor:
+                    for result in executor.map(ingest, catalog_entries):
+                        unsettled.append(result)
+                        while unsettled and unsettled[0]['status'] != 'pending':
+                            yield unsettled.popleft()
+        yield from unsettled
+
+    def _calculate_statistics(self, results: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
         """Calculate aggregate statistics from results.
 
         Args:
-            results: List of ingestion results
+            results: Ingestion results; consumed once, so a stream works too
 
         Returns:
             Statistics dictionary
         """
-        total = len(results)
-        successful = sum(1 for r in results if r['status'] == 'success' or r['status'] == 'dry_run_passed')
-        failed = sum(1 for r in results if r['status'] == 'failed')
-        skipped = sum(1 for r in results if r['status'] == 'skipped' or r['status'] == 'dry_run_failed')
-
-        total_duration = sum(r.get('duration_seconds', 0) for r in results)
+        # Tally statuses and durations in one pass
+        status_counts = Counter()
+        total_duration = 0
+        for r in results:
+            status_counts[r['status']] += 1
+            total_duration += r.get('duration_seconds', 0)
+
+        total = sum(status_counts.values())
+        successful = status_counts['success'] + status_counts['dry_run_passed']
+        failed = status_counts['failed']
+        skipped = status_counts['skipped'] + status_counts['dry_run_failed']
 
         return {
             'total': total,
@@ -314,12 +394,12 @@ class IncrementalIngestionEngine:
         logger.info("=" * 80)
 
         if 'batch_start' in summary:
-            logger.info(f"Batch Duration: {summary['duration_seconds']:.2f} seconds")
+            logger.info("Batch Duration: %.2f seconds", summary['duration_seconds'])
 
         stats = summary.get('statistics', {})
-        logger.info(f"Total Processed: {stats.get('total', 0)}")
-        logger.info(f"Successful: {stats.get('successful', 0)}")
-        logger.info(f"Failed: {stats.get('failed', 0)}")
-        logger.info(f"Skipped: {stats.get('skipped', 0)}")
-        logger.info(f"Success Rate: {stats.get('success_rate', 0):.1f}%")
+        logger.info("Total Processed: %s", stats.get('total', 0))
+        logger.info("Successful: %s", stats.get('successful', 0))
+        logger.info("Failed: %s", stats.get('failed', 0))
+        logger.info("Skipped: %s", stats.get('skipped', 0))
+        logger.info("Success Rate: %.1f%%", stats.get('success_rate', 0))
         logger.info("=" * 80)
@@ -8,8 +8,12 @@ import logging
 import os
 import sqlite3
 import sys
-from datetime import datetime
-from typing import Dict, Any, List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 
 # Add project root to path for imports
 project_root = os.path.join(os.path.dirname(__file__), '..', '..', '..')
@@ -19,157 +23,290 @@ if project_root not in sys.path:
 from local.config import AppConfig
 from local.src.adapters.base import IngestionContext
 from local.src.adapters.adapter_factory import create_adapter
-from local.src.database.db_operations import get_catalog_info, get_catalog_role, get_last_ingested_at, update_sync_watermarks_ingested
+from local.src.database.database_core import MAX_SQL_PARAMS, SQLiteConnectionPool, parse_utc_timestamp
 
 logger = logging.getLogger(__name__)
 
+UTC = timezone.utc
+
+# Buffered cache rows per flush inside IngestionEngine.batch()
+_BATCH_FLUSH_EVERY = 100
+# Concurrent fetches in ingest_concurrently(), overall and per source_api
+_MAX_FETCH_WORKERS = 16
+_MAX_FETCHES_PER_SOURCE = 4
+
+_INSERT_CACHE_SQL = """
+    INSERT OR IGNORE INTO raw_ingestion_cache (request_hash, catalog_key, source_api, raw_payload)
+    VALUES (?, ?, ?, ?)
+"""
+_UPDATE_WATERMARK_SQL = """
+    UPDATE sync_watermarks
+    SET last_ingested_at = ?
+    WHERE catalog_key = ?
+"""
+
+
+def _time_suffixes(now: Optional[datetime] = None) -> Dict[str, str]:
+    """Request-hash time window for each update frequency, from one (local) clock reading."""
+    if now is None:
+        now = datetime.now()
+    return {
+        'HOURLY': now.strftime('%Y-%m-%d-%H'),
+        'DAILY': now.strftime('%Y-%m-%d'),
+        'MONTHLY': now.strftime('%Y-%m'),
+    }
+
+
+@dataclass
+class TaskBundle:
+    """Per-task catalog state needed before ingesting."""
+    frequency: Optional[str]
+    role: str
+    last_ingested_at: Optional[datetime]
+
+    @classmethod
+    def from_task(cls, task: Dict[str, Any]) -> 'TaskBundle':
+        """Build from a get_active_catalog_tasks() entry, whose watermark is already parsed."""
+        return cls(
+            frequency=task['update_frequency'],
+            role=task.get('role') or "JUDGMENT",
+            last_ingested_at=task['last_ingested_at']
+        )
+
 
 class IngestionEngine:
     """Engine for ingesting data from various sources with caching."""
 
     def __init__(self):
         self.db_path = AppConfig.DB_PATH
+        # Sized so every fetch worker can hold a connection
+        self._pool = SQLiteConnectionPool(self.db_path, max_size=_MAX_FETCH_WORKERS)
+        # Writes buffered while a batch() is open, flushed in bulk;
+        # guarded by _pending_lock since fetch workers append concurrently
+        self._batching = False
+        self._pending_lock = threading.RLock()
+        self._pending_cache_rows: List[tuple] = []
+        self._pending_watermark_updates: List[tuple] = []
+        # Per-source_api semaphores bounding concurrent fetches
+        self._source_slots: Dict[str, threading.BoundedSemaphore] = {}
+
+    def close(self):
+        """Close the pooled database connections."""
+        self._pool.close()
+
+    @contextmanager
+    def batch(self):
+        """Buffer cache and watermark writes and flush them with executemany.
+
+        ingest_concurrently flushes every _BATCH_FLUSH_EVERY buffered cache rows
+        and reports each task once its rows have committed. Rows still buffered
+        when the block exits are flushed then, and a failed flush raises; if an
+        exception escapes the block, rows not yet flushed are discarded.
+        """
+        self._batching = True
+        try:
+            yield self
+            _, error = self.flush()
+            if error is not None:
+                raise error
+        finally:
+            with self._pending_lock:
+                self._batching = False
+                self._pending_cache_rows.clear()
+                self._pending_watermark_updates.clear()
+
+    def flush(self) -> Tuple[List[str], Optional[Exception]]:
+        """Write buffered cache rows and watermark updates in one transaction.
+
+        Called from the thread consuming the batch, never from a fetch worker.
+        The buffers are emptied whether or not the transaction commits, so rows
+        rolled back here are not stored by a later flush.
+
+        Returns:
+            (catalog_keys, error): the keys of the flushed cache rows, and the
+            exception that rolled the transaction back, or None if it committed
+        """
+        with self._pending_lock:
+            cache_rows, self._pending_cache_rows = self._pending_cache_rows, []
+            watermark_updates, self._pending_watermark_updates = self._pending_watermark_updates, []
 
-    def _get_request_hash(self, catalog_key: str, params: Dict[str, Any], frequency: str) -> str:
-        """Generate hash for request deduplication with time window [ID-061]."""
-        now = datetime.now()
+        catalog_keys = [row[1] for row in cache_rows]
+        if not cache_rows and not watermark_updates:
+            return catalog_keys, None
+
+        try:
+            with self._pool.acquire() as conn:
+                conn.executemany(_INSERT_CACHE_SQL, cache_rows)
+                conn.executemany(_UPDATE_WATERMARK_SQL, watermark_updates)
+                conn.commit()
+        except Exception as e:
+            logger.error("Batch flush of %d cache rows failed: %s", len(cache_rows), e, exc_info=True)
+            return catalog_keys, e
+        return catalog_keys, None
 
-        # Add time suffix based on frequency
-        if frequency == 'HOURLY':
-            time_suffix = now.strftime('%Y-%m-%d-%H')
-        elif frequency == 'DAILY':
-            time_suffix = now.strftime('%Y-%m-%d')
-        elif frequency == 'MONTHLY':
-            time_suffix = now.strftime('%Y-%m')
-        else:
-            time_suffix = now.strftime('%Y-%m-%d')  # Default to daily
+    def _get_request_hash(self, catalog_key: str, params: Dict[str, Any], frequency: str,
+                          suffix_map: Optional[Dict[str, str]] = None) -> str:
+        """Generate hash for request deduplication with time window [ID-061].
+
+        Pass a _time_suffixes() map to share one clock reading across a batch.
+        """
+        if suffix_map is None:
+            suffix_map = _time_suffixes()
+
+        # Add time suffix based on frequency, defaulting to daily
+        time_suffix = suffix_map.get(frequency, suffix_map['DAILY'])
 
         hash_input = f"{catalog_key}:{json.dumps(params, sort_keys=True)}:{time_suffix}"
         return hashlib.sha256(hash_input.encode()).hexdigest()
 
     def _is_cached(self, request_hash: str) -> bool:
         """Check if request is already cached."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
+        with self._pool.acquire() as conn:
+            cursor = conn.execute(
                 "SELECT 1 FROM raw_ingestion_cache WHERE request_hash = ?",
                 (request_hash,)
             )
             return cursor.fetchone() is not None
 
+    def _get_cached_hashes(self, request_hashes: List[str]) -> set:
+        """Return the subset of request_hashes already in raw_ingestion_cache."""
+        cached = set()
+        with self._pool.acquire() as conn:
+            # Chunk to stay under SQLite's bound-parameter limit
+            for start in range(0, len(request_hashes), MAX_SQL_PARAMS):
+                chunk = request_hashes[start:start + MAX_SQL_PARAMS]
+                placeholders = ','.join('?' * len(chunk))
+                cursor = conn.execute(
+                    f"SELECT request_hash FROM raw_ingestion_cache WHERE request_hash IN ({placeholders})",
+                    chunk
+                )
+                cached.update(row[0] for row in cursor)
+        return cached
+
+    def prefetch_cache_state(self, tasks: List[Dict[str, Any]]) -> Dict[str, tuple[str, bool]]:
+        """Hash every task's request and check them against the cache in one pass.
+
+        Tasks never ingested before (no last_ingested_at) can't have a cache hit,
+        so they are left out of the lookup.
+
+        Returns:
+            {catalog_key: (request_hash, is_cached)}, for passing on to ingest_data
+        """
+        # Every task in the batch shares one set of time windows
+        suffix_map = _time_suffixes()
+        request_hashes = {
+            task['catalog_key']: self._get_request_hash(
+                task['catalog_key'], task['config_params'], task['update_frequency'] or 'DAILY', suffix_map
+            )
+            for task in tasks
+        }
+        cached = self._get_cached_hashes([
+            request_hashes[task['catalog_key']] for task in tasks if task['last_ingested_at'] is not None
+        ])
+        return {key: (request_hash, request_hash in cached) for key, request_hash in request_hashes.items()}
+
     def _cache_response(self, request_hash: str, catalog_key: str,
                         source_api: str, raw_payload: str):
         """Cache the raw response."""
-        from local.src.database.db_operations import insert_raw_ingestion_cache
-        insert_raw_ingestion_cache(request_hash, catalog_key, source_api, raw_payload)
-
-    def _get_catalog_info(self, catalog_key: str) -> tuple:
-        """Get frequency for the catalog entry (last_bronze_ts now in sync_watermarks)."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT update_frequency FROM data_catalog
-                WHERE catalog_key = ?
-            """, (catalog_key,))
-            result = cursor.fetchone()
-            # Return frequency, and last_bronze_ts will be retrieved separately from sync_watermarks
-            return (result[0] if result else None, None)
-
-    def _get_catalog_role(self, catalog_key: str) -> str:
-        """Get the role (JUDGMENT/VALIDATION) for the catalog entry."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT role FROM data_catalog
-                WHERE catalog_key = ?
-            """, (catalog_key,))
-            result = cursor.fetchone()
-            return result[0] if result else "JUDGMENT"  # Default to JUDGMENT
-
-    def _get_last_ingested_at(self, catalog_key: str) -> Optional[datetime]:
-        """Get the last ingested timestamp from sync_watermarks."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT last_ingested_at FROM sync_watermarks
-                WHERE catalog_key = ?
+        row = (request_hash, catalog_key, source_api, raw_payload)
+        with self._pending_lock:
+            if self._batching:
+                self._pending_cache_rows.append(row)
+                return
+
+        with self._pool.acquire() as conn:
+            conn.execute(_INSERT_CACHE_SQL, row)
+            conn.commit()
+
+    def _get_task_bundle(self, catalog_key: str) -> TaskBundle:
+        """Get frequency, role and last ingested timestamp with one query."""
+        with self._pool.acquire() as conn:
+            cursor = conn.execute("""
+                SELECT dc.update_frequency, dc.role, sw.last_ingested_at
+                FROM data_catalog dc
+                LEFT JOIN sync_watermarks sw ON dc.catalog_key = sw.catalog_key
+                WHERE dc.catalog_key = ?
             """, (catalog_key,))
             result = cursor.fetchone()
 
-            if result and result[0]:
-                # Parse ISO datetime string to datetime object (UTC)
-                try:
-                    from datetime import timezone
-                    dt = datetime.fromisoformat(result[0])
-                    # If the parsed datetime doesn't have timezone info, assume UTC
-                    if dt.tzinfo is None:
-                        dt = dt.replace(tzinfo=timezone.utc)
-                    return dt
-                except ValueError:
-                    return None
-            return None
+        if result is None:
+            return TaskBundle(frequency=None, role="JUDGMENT", last_ingested_at=None)
+
+        frequency, role, last_ingested_at = result
+        return TaskBundle(
+            frequency=frequency,
+            role=role or "JUDGMENT",  # Default to JUDGMENT
+            last_ingested_at=parse_utc_timestamp(last_ingested_at)
+        )
 
     def _update_catalog_status(self, catalog_key: str, status: str,
                                error_msg: Optional[str] = None):
         """Update catalog entry status."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
         # Status tracking is now handled by sync_watermarks updates and logging
         if status == 'FAILED' and error_msg:
-            logger.error(f"[{catalog_key}] Ingestion failed: {error_msg}")
+            logger.error("[%s] Ingestion failed: %s", catalog_key, error_msg)
         elif status == 'SUCCESS':
-            logger.debug(f"[{catalog_key}] Ingestion successful")
+            logger.debug("[%s] Ingestion successful", catalog_key)
 
     def _update_sync_watermarks(self, catalog_key: str):
         """Update sync_watermarks with current timestamp for last_ingested_at."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            # Use local time for consistency with logs, format: YYYY-MM-DD HH:MM:SS
-            now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            cursor.execute("""
-                UPDATE sync_watermarks
-                SET last_ingested_at = ?
-                WHERE catalog_key = ?
-            """, (now, catalog_key))
+        # Use local time for consistency with logs, format: YYYY-MM-DD HH:MM:SS
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        with self._pending_lock:
+            if self._batching:
+                self._pending_watermark_updates.append((now, catalog_key))
+                return
+
+        with self._pool.acquire() as conn:
+            conn.execute(_UPDATE_WATERMARK_SQL, (now, catalog_key))
             conn.commit()
 
     def ingest_data(self, catalog_key: str, source_api: str,
-                    config_params: Dict[str, Any]) -> tuple[bool, bool]:
+                    config_params: Dict[str, Any],
+                    request_hash: Optional[str] = None,
+                    is_cached: Optional[bool] = None,
+                    bundle: Optional[TaskBundle] = None) -> tuple[bool, bool]:
         """
         Ingest data for a catalog entry.
+        request_hash/is_cached may come from prefetch_cache_state, and bundle from
+        TaskBundle.from_task, to skip the per-task lookups.
         Returns (success, data_was_new) where data_was_new indicates if new data was written.
         """
         try:
-            # Get frequency and last_bronze_ts
-            frequency, _ = get_catalog_info(catalog_key)
+            # Get frequency, role and last ingested timestamp in one round trip
+            if bundle is None:
+                bundle = self._get_task_bundle(catalog_key)
+            frequency = bundle.frequency
+            last_ingested_at = bundle.last_ingested_at
 
             # Determine fetch mode
-            last_ingested_at = get_last_ingested_at(catalog_key)
             if last_ingested_at is None:
                 fetch_mode = "首次全量采集"
             else:
                 fetch_mode = "日常差分补齐"
 
-            logger.info(f"[{catalog_key}] {fetch_mode} - 开始处理")
+            logger.info("[%s] %s - 开始处理", catalog_key, fetch_mode)
 
             # Generate request hash
-            request_hash = self._get_request_hash(catalog_key, config_params, frequency or 'DAILY')
-
-            # Check cache - if already cached, no need to fetch
-            if self._is_cached(request_hash):
-                logger.debug(f"[{catalog_key}] 数据已缓存 (hash: {request_hash[:8]}...)")
-                logger.debug(f"[{catalog_key}] Ingestion successful")
+            if request_hash is None:
+                request_hash = self._get_request_hash(catalog_key, config_params, frequency or 'DAILY')
+
+            # Check cache - if already cached, no need to fetch. A first ingest
+            # has nothing cached to find, so skip the lookup
+            if is_cached is None:
+                is_cached = last_ingested_at is not None and self._is_cached(request_hash)
+            if is_cached:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[%s] 数据已缓存 (hash: %s...)", catalog_key, request_hash[:8])
+                    logger.debug("[%s] Ingestion successful", catalog_key)
                 return True, False  # Success but no new data
 
-            # Get role for context
-            role = get_catalog_role(catalog_key)
-
             # Create ingestion context
             context = IngestionContext(
                 catalog_key=catalog_key,
                 source_api=source_api,
                 config_params=config_params,
-                role=role,
+                role=bundle.role,
                 last_ingested_at=last_ingested_at,
                 frequency=frequency
             )
@@ -178,92 +315,178 @@ class IngestionEngine:
             try:
                 adapter = create_adapter(source_api)
             except ValueError as e:
-                logger.warning(f"[{catalog_key}] 不支持的来源: {e}")
+                logger.warning("[%s] 不支持的来源: %s", catalog_key, e)
                 raw_data = '{"error": "unsupported source"}'
-                from local.src.database.db_operations import insert_raw_ingestion_cache
-                insert_raw_ingestion_cache(request_hash, catalog_key, source_api, raw_data)
+                self._cache_response(request_hash, catalog_key, source_api, raw_data)
                 self._update_catalog_status(catalog_key, 'SUCCESS')
                 return True, True
 
             # Fetch raw data using new adapter interface
             raw_data = adapter.fetch_raw_data(context)
 
-            # Cache the response (new data)
-            self._cache_response(request_hash, catalog_key, source_api, raw_data)
+            # Cache the response (new data) and update sync_watermarks only
+            # when new data is written; in a batch() both land in one flush
+            with self._pending_lock:
+                self._cache_response(request_hash, catalog_key, source_api, raw_data)
+                self._update_sync_watermarks(catalog_key)
             self._update_catalog_status(catalog_key, 'SUCCESS')
 
-            # Update sync_watermarks only when new data is written
-            self._update_sync_watermarks(catalog_key)
-
-            logger.info(f"[{catalog_key}] {fetch_mode} - 新数据缓存成功 (hash: {request_hash[:8]}...)")
+            logger.info("[%s] %s - 新数据缓存成功 (hash: %s...)", catalog_key, fetch_mode, request_hash[:8])
             return True, True  # Success with new data
 
         except Exception as e:
-            logger.error(f"[{catalog_key}] 采集失败: {e}", exc_info=True)
+            logger.error("[%s] 采集失败: %s", catalog_key, e, exc_info=True)
             self._update_catalog_status(catalog_key, 'FAILED', str(e))
             return False, False
 
+    def _source_slot(self, source_api: str) -> threading.BoundedSemaphore:
+        """Semaphore capping concurrent fetches against one source_api."""
+        with self._pending_lock:
+            slot = self._source_slots.get(source_api)
+            if slot is None:
+                slot = self._source_slots[source_api] = threading.BoundedSemaphore(_MAX_FETCHES_PER_SOURCE)
+            return slot
+
+    def _ingest_task(self, task: Dict[str, Any], cache_entry: tuple) -> tuple[bool, bool]:
+        """Run ingest_data for one task while holding its source_api's slot."""
+        request_hash, is_cached = cache_entry
+        with self._source_slot(task['source_api']):
+            return self.ingest_data(
+                task['catalog_key'], task['source_api'], task['config_params'],
+                request_hash=request_hash, is_cached=is_cached,
+                bundle=TaskBundle.from_task(task)
+            )
+
+    def ingest_concurrently(self, tasks: List[Dict[str, Any]],
+                            cache_state: Optional[Dict[str, tuple]] = None,
+                            max_workers: int = _MAX_FETCH_WORKERS
+                            ) -> Iterator[Tuple[Dict[str, Any], tuple, Optional[Exception]]]:
+        """Ingest tasks on a thread pool so their network fetches overlap.
+
+        Fetches against the same source_api are capped at _MAX_FETCHES_PER_SOURCE
+        to respect per-API rate limits. Open a batch() around the call to have
+        the writes flushed in bulk.
+
+        Args:
+            tasks: Catalog task dictionaries to ingest
+            cache_state: Output of prefetch_cache_state() for these tasks
+            max_workers: Thread pool size
+
+        Yields:
+            (task, (success, data_was_new), error) as each task completes; error
+            is the exception ingest_data raised, or None. Inside a batch(), a
+            task that wrote new data is yielded once the flush holding its rows
+            has committed, or with (False, False) and the error if it failed.
+        """
+        cache_state = cache_state or {}
+        # Tasks whose rows are buffered, by catalog_key, until a flush settles them
+        awaiting: Dict[str, Tuple[Dict[str, Any], tuple]] = {}
+        # Flush outcomes for rows flushed before their task's result was taken
+        settled: Dict[str, Optional[Exception]] = {}
+
+        def flush():
+            catalog_keys, error = self.flush()
+            for catalog_key in catalog_keys:
+                if catalog_key not in awaiting:
+                    settled[catalog_key] = error
+                    continue
+                task, outcome = awaiting.pop(catalog_key)
+                yield (task, outcome, None) if error is None else (task, (False, False), error)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._ingest_task, task, cache_state.get(task['catalog_key'], (None, None))): task
+                for task in tasks
+            }
+            for future in as_completed(futures):
+                task = futures[future]
+                catalog_key = task['catalog_key']
+                try:
+                    outcome = future.result()
+                except Exception as e:
+                    yield task, (False, False), e
+                    continue
+
+                if not self._batching or outcome != (True, True):
+                    # Nothing buffered: failed, a cache hit, or already written
+                    yield task, outcome, None
+                elif catalog_key in settled:
+                    error = settled.pop(catalog_key)
+                    yield (task, outcome, None) if error is None else (task, (False, False), error)
+                else:
+                    awaiting[catalog_key] = (task, outcome)
+                    if len(self._pending_cache_rows) >= _BATCH_FLUSH_EVERY:
+                        yield from flush()
+
+            yield from flush()
+
+
+_ACTIVE_CATALOG_SQL = """
+    SELECT catalog_key, source_api, config_params, update_frequency, role, entity_name, search_keywords
+    FROM data_catalog
+    WHERE is_active = 1
+    ORDER BY source_api, catalog_key
+"""
+# Column order matches the covering index idx_sw_ck
+_WATERMARKS_SQL = "SELECT catalog_key, last_ingested_at FROM sync_watermarks"
+
+
+def _parse_catalog_rows(catalog_rows) -> List[Dict[str, Any]]:
+    """Parse active data_catalog rows into task dictionaries, without watermarks."""
+    tasks = []
+    for catalog_key, source_api, config_params_json, update_frequency, role, entity_name, search_keywords in catalog_rows:
+        try:
+            config_params = json.loads(config_params_json) if config_params_json else {}
+        except json.JSONDecodeError as e:
+            logger.error("Invalid config_params for %s: %s", catalog_key, e)
+            continue
+
+        # If search_keywords is provided, add it to config_params for NewsAPI adapter
+        if search_keywords and 'keywords' not in config_params:
+            # Parse keywords from search_keywords (comma-separated or OR-separated)
+            keywords = [k.strip() for k in search_keywords.split(',')]
+            config_params['keywords'] = keywords
+
+        tasks.append({
+            'catalog_key': catalog_key,
+            'source_api': source_api,
+            'config_params': config_params,
+            'update_frequency': update_frequency,
+            'last_ingested_at': None,
+            'role': role,
+            'entity_name': entity_name
+        })
+
+    return tasks
+
 
 def get_active_catalog_tasks() -> List[Dict[str, Any]]:
     """Query data_catalog for all active tasks with sync watermarks (is_active=1)."""
     db_path = AppConfig.DB_PATH
-    tasks = []
 
-    with sqlite3.connect(db_path) as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT dc.catalog_key, dc.source_api, dc.config_params, dc.update_frequency,
-                   sw.last_ingested_at, dc.role, dc.entity_name, dc.search_keywords
-            FROM data_catalog dc
-            LEFT JOIN sync_watermarks sw ON dc.catalog_key = sw.catalog_key
-            WHERE dc.is_active = 1
-            ORDER BY dc.source_api, dc.catalog_key
-        """)
-
-        for row in cursor.fetchall():
-            catalog_key, source_api, config_params_json, update_frequency, last_ingested_at, role, entity_name, search_keywords = row
-            try:
-                config_params = json.loads(config_params_json) if config_params_json else {}
-                
-                # If search_keywords is provided, add it to config_params for NewsAPI adapter
-                if search_keywords and 'keywords' not in config_params:
-                    # Parse keywords from search_keywords (comma-separated or OR-separated)
-                    keywords = [k.strip() for k in search_keywords.split(',')]
-                    config_params['keywords'] = keywords
-
-                # Parse last_ingested_at (stored as UTC)
-                last_ingested_dt = None
-                if last_ingested_at:
-                    try:
-                        from datetime import timezone
-                        dt = datetime.fromisoformat(last_ingested_at)
-                        # Ensure it's treated as UTC
-                        if dt.tzinfo is None:
-                            last_ingested_dt = dt.replace(tzinfo=timezone.utc)
-                        else:
-                            last_ingested_dt = dt
-                    except ValueError:
-                        logger.warning(f"Invalid last_ingested_at for {catalog_key}: {last_ingested_at}")
-
-                tasks.append({
-                    'catalog_key': catalog_key,
-                    'source_api': source_api,
-                    'config_params': config_params,
-                    'update_frequency': update_frequency,
-                    'last_ingested_at': last_ingested_dt,
-                    'role': role,
-                    'entity_name': entity_name
-                })
-            except json.JSONDecodeError as e:
-                logger.error(f"Invalid config_params for {catalog_key}: {e}")
-                continue
+    with closing(sqlite3.connect(db_path)) as conn:
+        catalog_rows = conn.execute(_ACTIVE_CATALOG_SQL).fetchall()
+        watermarks = dict(conn.execute(_WATERMARKS_SQL))
+
+    tasks = _parse_catalog_rows(catalog_rows)
+    for task in tasks:
+        catalog_key = task['catalog_key']
+
+        # Parse last_ingested_at (stored as UTC)
+        last_ingested_at = watermarks.get(catalog_key)
+        last_ingested_dt = parse_utc_timestamp(last_ingested_at)
+        if last_ingested_at and last_ingested_dt is None:
+            logger.warning("Invalid last_ingested_at for %s: %s", catalog_key, last_ingested_at)
+
+        task['last_ingested_at'] = last_ingested_dt
 
     return tasks
 
 
-def should_update_task(task: Dict[str, Any]) -> tuple[bool, str]:
+def should_update_task(task: Dict[str, Any], now: Optional[datetime] = None) -> tuple[bool, str]:
     """
     Determine if a task should be updated based on delta check.
+    `now` (UTC) defaults to the current time; pass it in to share one clock across a batch.
     Returns (should_update, reason)
     """
     catalog_key = task['catalog_key']
@@ -272,8 +495,8 @@ def should_update_task(task: Dict[str, Any]) -> tuple[bool, str]:
     last_ingested_at = task['last_ingested_at']
 
     # Use UTC time for consistency
-    from datetime import timezone
-    now = datetime.now(timezone.utc)
+    if now is None:
+        now = datetime.now(UTC)
 
     # For RSS feeds, always attempt update (rely on hash deduplication)
     if source_api == 'RSS':
@@ -285,20 +508,21 @@ def should_update_task(task: Dict[str, Any]) -> tuple[bool, str]:
 
     # Calculate time since last ingestion
     time_since_last = now - last_ingested_at
+    elapsed_seconds = time_since_last.total_seconds()
 
     # Check frequency requirements
     if update_frequency == 'HOURLY':
-        should_update = time_since_last.total_seconds() >= 3600  # 1 hour
-        reason = f"距离上次采集 {time_since_last.total_seconds()/3600:.1f} 小时"
+        should_update = elapsed_seconds >= 3600  # 1 hour
+        reason = f"距离上次采集 {elapsed_seconds/3600:.1f} 小时"
     elif update_frequency == 'DAILY':
-        should_update = time_since_last.total_seconds() >= 86400  # 24 hours
+        should_update = elapsed_seconds >= 86400  # 24 hours
         reason = f"距离上次采集 {time_since_last.days} 天"
     elif update_frequency == 'MONTHLY':
         should_update = last_ingested_at.month != now.month or last_ingested_at.year != now.year
-        reason = f"距离上次采集 {(now - last_ingested_at).days} 天"
+        reason = f"距离上次采集 {time_since_last.days} 天"
     else:
         # Default to daily
-        should_update = time_since_last.total_seconds() >= 86400
+        should_update = elapsed_seconds >= 86400
         reason = f"默认每日检查，距离上次采集 {time_since_last.days} 天"
 
     if not should_update:
@@ -307,84 +531,100 @@ def should_update_task(task: Dict[str, Any]) -> tuple[bool, str]:
     return should_update, reason
 
 
+def should_update_tasks(tasks: List[Dict[str, Any]]) -> List[tuple[bool, str]]:
+    """Run the delta check for a whole batch against a single UTC clock reading."""
+    now = datetime.now(UTC)
+    return [should_update_task(task, now) for task in tasks]
+
+
 def main():
     """Main ingestion pipeline execution with differential sync."""
     start_time = datetime.now()
     logger.info("Starting batch ingestion pipeline with differential sync")
 
     engine = IngestionEngine()
-    tasks = get_active_catalog_tasks()
-
-    if not tasks:
-        logger.warning("No active tasks found in data_catalog")
-        print("执行摘要: 无活跃任务")
-        return
-
-    total_tasks = len(tasks)
-    processed_tasks = 0
-    skipped_tasks = 0
-    successful_tasks = 0
-    failed_tasks = 0
-    errors = []
-
-    logger.info(f"Found {total_tasks} active tasks to evaluate")
-
-    for i, task in enumerate(tasks, 1):
-        catalog_key = task['catalog_key']
-        source_api = task['source_api']
-        entity_name = task.get('entity_name', catalog_key)
-
-        # Delta check: determine if this task needs updating
-        should_update, reason = should_update_task(task)
-
-        if not should_update:
-            skipped_tasks += 1
-            logger.info(f"[{i}/{total_tasks}] {catalog_key} ({entity_name}) - SKIPPED: {reason}")
-            continue
-
-        processed_tasks += 1
-        logger.info(f"[{i}/{total_tasks}] Processing {catalog_key} ({entity_name}) - {reason}")
-
-        try:
-            # Execute ingestion
-            success, data_was_new = engine.ingest_data(catalog_key, source_api, task['config_params'])
-            if success:
-                successful_tasks += 1
-                status_msg = "SUCCESS (新数据)" if data_was_new else "SUCCESS (缓存命中)"
-                logger.info(f"[{processed_tasks}/{total_tasks}] {catalog_key} - {status_msg}")
-            else:
-                failed_tasks += 1
-                errors.append(f"{catalog_key}: Ingestion failed")
-                logger.error(f"[{processed_tasks}/{total_tasks}] {catalog_key} - FAILED")
+    try:
+        tasks = get_active_catalog_tasks()
+
+        if not tasks:
+            logger.warning("No active tasks found in data_catalog")
+            print("执行摘要: 无活跃任务")
+            return
+
+        total_tasks = len(tasks)
+        processed_tasks = 0
+        skipped_tasks = 0
+        successful_tasks = 0
+        failed_tasks = 0
+        errors = []
+
+        logger.info("Found %d active tasks to evaluate", total_tasks)
+
+        # Delta check: determine which tasks need updating
+        decisions = should_update_tasks(tasks)
+
+        pending = []
+        for i, (task, (should_update, reason)) in enumerate(zip(tasks, decisions), 1):
+            catalog_key = task['catalog_key']
+            entity_name = task.get('entity_name', catalog_key)
+
+            if not should_update:
+                skipped_tasks += 1
+                logger.info("[%d/%d] %s (%s) - SKIPPED: %s", i, total_tasks, catalog_key, entity_name, reason)
+                continue
 
-        except Exception as e:
-            failed_tasks += 1
-            error_msg = f"{catalog_key}: {str(e)}"
-            errors.append(error_msg)
-            logger.error(f"[{processed_tasks}/{total_tasks}] {catalog_key} - ERROR: {e}", exc_info=True)
-
-    end_time = datetime.now()
-    duration = end_time - start_time
-
-    # Print execution summary
-    print("执行摘要 (批处理差分同步):")
-    print(f"- 总任务数: {total_tasks}")
-    print(f"- 跳过任务: {skipped_tasks}")
-    print(f"- 处理任务: {processed_tasks}")
-    print(f"- 成功任务: {successful_tasks}")
-    print(f"- 失败任务: {failed_tasks}")
-    print(f"- 执行时长: {duration}")
-    print(f"- 开始时间: {start_time.isoformat()}")
-    print(f"- 结束时间: {end_time.isoformat()}")
-
-    if errors:
-        print("\n错误详情:")
-        for error in errors[:5]:  # Show first 5 errors
-            print(f"- {error}")
-        if len(errors) > 5:
-            print(f"... 还有 {len(errors) - 5} 个错误")
-
-    logger.info(f"Batch ingestion pipeline completed: {successful_tasks}/{processed_tasks} successful, {skipped_tasks} skipped")
+            processed_tasks += 1
+            logger.info("[%d/%d] Processing %s (%s) - %s", i, total_tasks, catalog_key, entity_name, reason)
+            pending.append(task)
+
+        # Hash and cache-check every task to be processed in one query
+        cache_state = engine.prefetch_cache_state(pending)
+
+        # Fetch concurrently; the run's cache and watermark writes are flushed in bulk
+        with engine.batch():
+            results = engine.ingest_concurrently(pending, cache_state)
+            for completed, (task, (success, data_was_new), error) in enumerate(results, 1):
+                catalog_key = task['catalog_key']
+
+                if error is not None:
+                    failed_tasks += 1
+                    error_msg = f"{catalog_key}: {str(error)}"
+                    errors.append(error_msg)
+                    logger.error("[%d/%d] %s - ERROR: %s", completed, processed_tasks, catalog_key, error, exc_info=error)
+                elif success:
+                    successful_tasks += 1
+                    status_msg = "SUCCESS (新数据)" if data_was_new else "SUCCESS (缓存命中)"
+                    logger.info("[%d/%d] %s - %s", completed, processed_tasks, catalog_key, status_msg)
+                else:
+                    failed_tasks += 1
+                    errors.append(f"{catalog_key}: Ingestion failed")
+                    logger.error("[%d/%d] %s - FAILED", completed, processed_tasks, catalog_key)
+
+        end_time = datetime.now()
+        duration = end_time - start_time
+
+        # Print execution summary
+        print("执行摘要 (批处理差分同步):")
+        print(f"- 总任务数: {total_tasks}")
+        print(f"- 跳过任务: {skipped_tasks}")
+        print(f"- 处理任务: {processed_tasks}")
+        print(f"- 成功任务: {successful_tasks}")
+        print(f"- 失败任务: {failed_tasks}")
+        print(f"- 执行时长: {duration}")
+        print(f"- 开始时间: {start_time.isoformat()}")
+        print(f"- 结束时间: {end_time.isoformat()}")
+
+        if errors:
+            print("\n错误详情:")
+            for error in errors[:5]:  # Show first 5 errors
+                print(f"- {error}")
+            if len(errors) > 5:
+                print(f"... 还有 {len(errors) - 5} 个错误")
+
+        logger.info("Batch ingestion pipeline completed: %d/%d successful, %d skipped",
+                    successful_tasks, processed_tasks, skipped_tasks)
+    finally:
+        engine.close()
 
 
 if __name__ == "__main__":
@@ -9,8 +9,10 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 import json
+import shutil
 import tempfile
 import sqlite3
+import threading
 from datetime import datetime
 
 from local.src.adapters.adapter_manager import AdapterManager
@@ -18,87 +20,96 @@ from local.src.database import DatabaseCore
 from local.config import AppConfig
 
 
+@pytest.fixture(scope='session')
+def template_db():
+    """Build the test schema and seed data once, for temp_db to copy."""
+    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+        db_path = f.name
+
+    # Initialize database
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    # Create all required tables
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS data_catalog (
+        catalog_key TEXT PRIMARY KEY,
+        country TEXT NOT NULL,
+        scope TEXT NOT NULL,
+        role TEXT NOT NULL,
+        entity_name TEXT NOT NULL,
+        source_api TEXT NOT NULL,
+        update_frequency TEXT NOT NULL,
+        config_params JSON DEFAULT '{}',
+        search_keywords TEXT,
+        is_active INTEGER DEFAULT 1,
+        priority INTEGER DEFAULT 5
+    )
+    ''')
+
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS sync_watermarks (
+        catalog_key TEXT PRIMARY KEY,
+        last_ingested_at TIMESTAMP,
+        last_cleaned_at TIMESTAMP,
+        last_synced_at TIMESTAMP,
+        last_meta_synced_at TIMESTAMP,
+        checksum TEXT,
+        FOREIGN KEY(catalog_key) REFERENCES data_catalog(catalog_key)
+    )
+    ''')
+
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS raw_ingestion_cache (
+        request_hash TEXT PRIMARY KEY,
+        catalog_key TEXT NOT NULL,
+        source_api TEXT NOT NULL,
+        raw_payload TEXT NOT NULL,
+        inserted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''')
+
+    # Insert test data
+    catalog_rows = [
+        ('TEST_METRIC_FRED', 'US', 'MACRO', 'JUDGMENT', 'Test Metric',
+         'FRED', 'Monthly', '{"series": "WALCL"}', 'test,metric', 1, 5),
+        ('TEST_STOCK_YF', 'US', 'MICRO', 'JUDGMENT', 'Test Stock',
+         'yfinance', 'Daily', '{"ticker": "AAPL"}', 'test,stock', 0, 5),
+    ]
+    cursor.executemany(
+        'INSERT INTO data_catalog VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+        catalog_rows
+    )
+
+    watermark_rows = [
+        ('TEST_METRIC_FRED', None, None, None, None, None),
+        ('TEST_STOCK_YF', None, None, None, None, None),
+    ]
+    cursor.executemany(
+        'INSERT INTO sync_watermarks VALUES (?, ?, ?, ?, ?, ?)',
+        watermark_rows
+    )
+
+    conn.commit()
+    conn.close()
+
+    yield db_path
+
+    # Cleanup
+    os.unlink(db_path)
+
+
 class TestAdapterManager:
     """Test AdapterManager with database integration."""
 
     @pytest.fixture
-    def temp_db(self):
+    def temp_db(self, template_db):
         """Create temporary test database."""
         with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
             db_path = f.name
 
-        # Initialize database
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
-        # Create all required tables
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS data_catalog (
-            catalog_key TEXT PRIMARY KEY,
-            country TEXT NOT NULL,
-            scope TEXT NOT NULL,
-            role TEXT NOT NULL,
-            entity_name TEXT NOT NULL,
-            source_api TEXT NOT NULL,
-            update_frequency TEXT NOT NULL,
-            config_params JSON DEFAULT '{}',
-            search_keywords TEXT,
-            is_active INTEGER DEFAULT 1,
-            priority INTEGER DEFAULT 5
-        )
-        ''')
-
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS sync_watermarks (
-            catalog_key TEXT PRIMARY KEY,
-            last_ingested_at TIMESTAMP,
-            last_cleaned_at TIMESTAMP,
-            last_synced_at TIMESTAMP,
-            last_meta_synced_at TIMESTAMP,
-            checksum TEXT,
-            FOREIGN KEY(catalog_key) REFERENCES data_catalog(catalog_key)
-        )
-        ''')
-
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS raw_ingestion_cache (
-            request_hash TEXT PRIMARY KEY,
-            catalog_key TEXT NOT NULL,
-            source_api TEXT NOT NULL,
-            raw_payload TEXT NOT NULL,
-            inserted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        ''')
-
-        # Insert test data
-        cursor.execute('''
-        INSERT INTO data_catalog VALUES (
-            'TEST_METRIC_FRED', 'US', 'MACRO', 'JUDGMENT', 'Test Metric',
-            'FRED', 'Monthly', '{"series": "WALCL"}', 'test,metric', 1, 5
-        )
-        ''')
-
-        cursor.execute('''
-        INSERT INTO data_catalog VALUES (
-            'TEST_STOCK_YF', 'US', 'MICRO', 'JUDGMENT', 'Test Stock',
-            'yfinance', 'Daily', '{"ticker": "AAPL"}', 'test,stock', 0, 5
-        )
-        ''')
-
-        cursor.execute('''
-        INSERT INTO sync_watermarks VALUES (
-            'TEST_METRIC_FRED', NULL, NULL, NULL, NULL, NULL
-        )
-        ''')
-
-        cursor.execute('''
-        INSERT INTO sync_watermarks VALUES (
-            'TEST_STOCK_YF', NULL, NULL, NULL, NULL, NULL
-        )
-        ''')
-
-        conn.commit()
-        conn.close()
+        # Each test gets a fresh copy of the seeded template
+        shutil.copyfile(template_db, db_path)
 
         yield db_path
 
@@ -230,6 +241,89 @@ class TestAdapterManager:
         assert 'statistics' in summary
         assert summary['statistics']['total_processed'] > 0
 
+    @patch('local.src.adapters.adapter_manager.create_adapter')
+    def test_batch_defers_writes_until_exit(self, mock_create_adapter, temp_db):
+        """Test batch() buffers Bronze writes and commits them on exit."""
+        mock_adapter = MagicMock()
+        mock_adapter.validate_config.return_value = True
+        mock_adapter.fetch_raw_data.return_value = '{"data": "test"}'
+        mock_adapter.get_request_hash.return_value = 'hash_batched'
+        mock_create_adapter.return_value = mock_adapter
+
+        db_core = DatabaseCore(temp_db)
+        manager = AdapterManager(db_core)
+
+        with manager.batch():
+            result = manager.ingest_asset('TEST_METRIC_FRED')
+            assert result['status'] == 'pending'
+            assert result['stored'] is False
+            assert not db_core.raw_ingestion.exists('hash_batched')
+
+            # Same request within the batch is still an idempotent skip
+            assert manager.ingest_asset('TEST_METRIC_FRED')['status'] == 'skipped'
+
+        # Reported as stored only once the flush has committed
+        assert result['status'] == 'success'
+        assert result['stored'] is True
+        assert db_core.raw_ingestion.exists('hash_batched')
+        assert manager.ingestion_stats['successful'] == 1
+
+    @patch('local.src.adapters.adapter_manager.create_adapter')
+    def test_batch_flush_failure_fails_buffered_results(self, mock_create_adapter, temp_db):
+        """Test a failed flush marks every buffered result failed instead of dropping it."""
+        mock_adapter = MagicMock()
+        mock_adapter.validate_config.return_value = True
+        mock_adapter.fetch_raw_data.return_value = '{"data": "test"}'
+        mock_adapter.get_request_hash.return_value = 'hash_flush_failed'
+        mock_create_adapter.return_value = mock_adapter
+
+        db_core = DatabaseCore(temp_db)
+        manager = AdapterManager(db_core)
+
+        with patch.object(db_core.raw_ingestion, 'insert_or_ignore', side_effect=sqlite3.OperationalError('disk I/O error')):
+            with manager.batch():
+                result = manager.ingest_asset('TEST_METRIC_FRED')
+
+        assert result['status'] == 'failed'
+        assert result['stored'] is False
+        assert 'disk I/O error' in result['error']
+        assert not db_core.raw_ingestion.exists('hash_flush_failed')
+        assert manager.ingestion_stats['failed'] == 1
+        assert manager.ingestion_stats['successful'] == 0
+
+    @patch('local.src.adapters.adapter_manager.create_adapter')
+    def test_adapter_reused_across_assets(self, mock_create_adapter, temp_db):
+        """Test one adapter instance is created per source_api."""
+        mock_adapter = MagicMock()
+        mock_adapter.validate_config.return_value = True
+        mock_adapter.fetch_raw_data.return_value = '{"data": "test"}'
+        mock_adapter.get_request_hash.side_effect = lambda ctx: f'hash_{ctx.catalog_key}'
+        mock_create_adapter.return_value = mock_adapter
+
+        db_core = DatabaseCore(temp_db)
+        manager = AdapterManager(db_core)
+
+        manager.ingest_asset('TEST_METRIC_FRED', dry_run=True)
+        manager.ingest_asset('TEST_METRIC_FRED')
+
+        mock_create_adapter.assert_called_once_with('FRED')
+        assert mock_adapter.fetch_raw_data.call_count == 1
+
+    @patch('local.src.adapters.adapter_manager.create_adapter')
+    def test_adapter_not_shared_between_threads(self, mock_create_adapter, temp_db):
+        """Test each thread gets its own adapter, so HTTP sessions aren't shared."""
+        mock_create_adapter.side_effect = lambda source_api: MagicMock()
+
+        manager = AdapterManager(DatabaseCore(temp_db))
+        adapters = []
+        worker = threading.Thread(target=lambda: adapters.append(manager._get_adapter('FRED')))
+        worker.start()
+        worker.join()
+
+        assert manager._get_adapter('FRED') is manager._get_adapter('FRED')
+        assert manager._get_adapter('FRED') is not adapters[0]
+        assert mock_create_adapter.call_count == 2
+
     def test_get_statistics(self, temp_db):
         """Test statistics retrieval."""
         db_core = DatabaseCore(temp_db)
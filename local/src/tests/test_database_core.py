@@ -12,7 +12,7 @@ import sqlite3
 import json
 from datetime import datetime, timezone
 
-from local.src.database import DatabaseCore
+from local.src.database import DatabaseCore, SQLiteConnectionPool
 
 
 class TestDatabaseCore:
@@ -150,6 +150,26 @@ class TestDatabaseCore:
         assert any(e[0] == 'TEST_METRIC' for e in entries)
         db_core.close()
 
+    def test_catalog_operations_get_active_filtered(self, temp_db):
+        """Test filtering active catalog entries by scope and role."""
+        db_core = DatabaseCore(temp_db)
+        db_core.catalog.insert_or_update('TEST_STOCK', {
+            'country': 'US', 'scope': 'MICRO', 'role': 'VALIDATION',
+            'entity_name': 'Test Stock', 'source_api': 'yfinance',
+            'update_frequency': 'Daily', 'config_params': '{}'
+        })
+
+        assert [e['catalog_key'] for e in db_core.catalog.get_active_filtered()] == ['TEST_METRIC', 'TEST_STOCK']
+        assert [e['catalog_key'] for e in db_core.catalog.get_active_filtered(scope='MACRO')] == ['TEST_METRIC']
+        assert [e['catalog_key'] for e in db_core.catalog.get_active_filtered(role='VALIDATION')] == ['TEST_STOCK']
+        assert db_core.catalog.get_active_filtered(scope='MACRO', role='VALIDATION') == []
+        assert [e['catalog_key'] for e in db_core.catalog.get_active_filtered(limit=1)] == ['TEST_METRIC']
+
+        # Inactive entries are excluded
+        db_core.catalog.set_active('TEST_STOCK', False)
+        assert db_core.catalog.get_active_filtered(scope='MICRO') == []
+        db_core.close()
+
     def test_catalog_operations_set_active(self, temp_db):
         """Test setting active status."""
         db_core = DatabaseCore(temp_db)
@@ -213,6 +233,21 @@ class TestDatabaseCore:
         assert isinstance(last_ingested, datetime)
         db_core.close()
 
+    def test_watermark_operations_get_last_ingested_many(self, temp_db, monkeypatch):
+        """Test loading last ingested timestamps for many keys at once."""
+        # Force one key per query so the chunking is exercised
+        monkeypatch.setattr('local.src.database.database_core.MAX_SQL_PARAMS', 1)
+        db_core = DatabaseCore(temp_db)
+
+        db_core.watermarks.ensure_entry('TEST_METRIC')
+        assert db_core.watermarks.get_last_ingested_many(['TEST_METRIC', 'MISSING']) == {}
+
+        db_core.watermarks.update_ingested('TEST_METRIC')
+        last_ingested = db_core.watermarks.get_last_ingested_many(['TEST_METRIC', 'MISSING'])
+        assert last_ingested == {'TEST_METRIC': db_core.watermarks.get_last_ingested('TEST_METRIC')}
+        assert db_core.watermarks.get_last_ingested_many([]) == {}
+        db_core.close()
+
     def test_raw_ingestion_operations_insert_or_ignore(self, temp_db):
         """Test inserting raw ingestion data."""
         db_core = DatabaseCore(temp_db)
@@ -362,3 +397,51 @@ class TestDatabaseCore:
             assert entry is not None
         finally:
             db_core.close()
+
+    def test_nested_transaction_rolls_back_together(self, temp_db):
+        """Test operations inside an outer transaction commit or roll back with it."""
+        db_core = DatabaseCore(temp_db)
+
+        try:
+            with pytest.raises(RuntimeError):
+                with db_core.session.transaction():
+                    db_core.watermarks.ensure_entry('NESTED_METRIC')
+                    raise RuntimeError("abort batch")
+
+            assert db_core.watermarks.get('NESTED_METRIC') is None
+
+            with db_core.session.transaction():
+                db_core.watermarks.ensure_entry('NESTED_METRIC')
+            assert db_core.watermarks.get('NESTED_METRIC') is not None
+        finally:
+            db_core.close()
+
+    def test_connection_pool_reuses_connections(self, temp_db):
+        """Test pooled connections are handed back out instead of reopened."""
+        pool = SQLiteConnectionPool(temp_db)
+
+        with pool.acquire() as conn:
+            first = conn
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+
+        with pool.acquire() as conn:
+            assert conn is first
+
+        pool.close()
+
+    def test_connection_pool_rolls_back_on_error(self, temp_db):
+        """Test uncommitted work is discarded when the borrower raises."""
+        pool = SQLiteConnectionPool(temp_db)
+
+        with pytest.raises(RuntimeError):
+            with pool.acquire() as conn:
+                conn.execute("UPDATE data_catalog SET is_active = 0 WHERE catalog_key = 'TEST_METRIC'")
+                raise RuntimeError("boom")
+
+        with pool.acquire() as conn:
+            is_active = conn.execute(
+                "SELECT is_active FROM data_catalog WHERE catalog_key = 'TEST_METRIC'"
+            ).fetchone()[0]
+        assert is_active == 1
+
+        pool.close()
@@ -0,0 +1,102 @@
+# filepath: local/src/tests/test_init_db.py
+
+"""Unit tests for database initialization."""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import pytest
+import sqlite3
+from unittest.mock import patch
+
+from local.src.database import init_db
+
+
+_DOC_TEMPLATE = """## 3. 物理 Schema 定义
+
+```sql
+CREATE TABLE data_catalog (
+    catalog_key TEXT PRIMARY KEY,
+    country TEXT,
+    scope TEXT,
+    role TEXT,
+    entity_name TEXT,
+    source_api TEXT,
+    update_frequency TEXT,
+    config_params TEXT,
+    search_keywords TEXT,
+    is_active INTEGER DEFAULT 1
+);
+
+CREATE TABLE sync_watermarks (
+    catalog_key TEXT PRIMARY KEY,
+    last_ingested_at DATETIME,
+    last_cleaned_at DATETIME
+);
+{extra}
+```
+
+## 5. 全量资产定义矩阵
+
+| Catalog Key | Country | Scope | Role | Entity | Source | Frequency | Config | Keywords |
+|---|---|---|---|---|---|---|---|---|
+| METRIC_US_GDP | US | MACRO | J | US GDP | FRED | Quarterly | {{"series": "GDP"}} | GDP, Growth |
+"""
+
+
+class TestCatalogIsCurrent:
+    """Test init_db re-applies the data model document only when it changes."""
+
+    @pytest.fixture
+    def data_model(self, tmp_path, monkeypatch):
+        """Point init_db at a temporary data directory and data model document."""
+        doc_path = tmp_path / 'Phase4_DataModel.md'
+        doc_path.write_text(_DOC_TEMPLATE.format(extra=''), encoding='utf-8')
+
+        monkeypatch.setenv('HEIMDALL_NO_CACHE', '1')
+        monkeypatch.setattr(init_db, '_DOC_PATH', doc_path)
+        monkeypatch.setattr(init_db, '_DATA_DIR', tmp_path)
+        monkeypatch.setattr(init_db, '_DB_PATH', tmp_path / 'heimdall.db')
+        init_db._parse_datamodel_for.cache_clear()
+        yield doc_path
+        init_db._parse_datamodel_for.cache_clear()
+
+    def _tables(self):
+        conn = sqlite3.connect(init_db._DB_PATH)
+        try:
+            return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        finally:
+            conn.close()
+
+    def test_unchanged_document_is_not_parsed_again(self, data_model):
+        """Test a second run skips the document when its signature is stamped in the database."""
+        init_db.main()
+
+        with patch.object(init_db, '_parse_datamodel_file') as mock_parse:
+            init_db.main()
+        mock_parse.assert_not_called()
+
+    def test_table_added_to_document_is_created(self, data_model):
+        """Test a table added to the document is created even if the database file looks newer."""
+        init_db.main()
+        db_mtime = init_db._DB_PATH.stat().st_mtime_ns
+
+        data_model.write_text(_DOC_TEMPLATE.format(extra='''
+CREATE TABLE news_tags (
+    fingerprint TEXT PRIMARY KEY,
+    tag TEXT NOT NULL
+);'''), encoding='utf-8')
+        # An mtime older than the database, as after a checkout or a WAL write
+        os.utime(data_model, ns=(db_mtime - 10**9, db_mtime - 10**9))
+
+        init_db.main()
+
+        assert 'news_tags' in self._tables()
+        conn = sqlite3.connect(init_db._DB_PATH)
+        try:
+            assert conn.execute("PRAGMA user_version").fetchone()[0] == \
+                init_db._signature_stamp(init_db.datamodel_signature())
+            assert conn.execute("SELECT COUNT(*) FROM data_catalog").fetchone()[0] == 1
+        finally:
+            conn.close()
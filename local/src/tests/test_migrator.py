@@ -0,0 +1,144 @@
+# filepath: local/src/tests/test_migrator.py
+
+"""Unit tests for the database migrator."""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import pytest
+import sqlite3
+from unittest.mock import patch
+
+from local.src.database import init_db, migrator
+from local.src.database.migrator import DatabaseMigrator, MigrationStep
+
+
+def _hardcoded_ddl():
+    """CREATE TABLE statements of init_db's hardcoded schema."""
+    conn = sqlite3.connect(':memory:')
+    init_db.create_tables(conn.cursor())
+    statements = [row[0] + ';' for row in conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+    )]
+    conn.close()
+    return statements
+
+
+class TestInitThenMigrate:
+    """Test a freshly initialized database needs no migration."""
+
+    @pytest.fixture
+    def data_model(self, tmp_path, monkeypatch):
+        """Point init_db at a temporary data directory and data model document."""
+        doc_path = tmp_path / 'Phase4_DataModel.md'
+        doc_path.write_text(
+            "## 3. 物理 Schema 定义\n\n```sql\n" + "\n\n".join(_hardcoded_ddl()) + "\n```\n",
+            encoding='utf-8'
+        )
+
+        monkeypatch.setenv('HEIMDALL_NO_CACHE', '1')
+        monkeypatch.setattr(init_db, '_DOC_PATH', doc_path)
+        monkeypatch.setattr(init_db, '_DATA_DIR', tmp_path)
+        monkeypatch.setattr(init_db, '_DB_PATH', tmp_path / 'heimdall.db')
+        init_db._parse_datamodel_for.cache_clear()
+        migrator._load_target_schema.cache_clear()
+        yield doc_path
+        init_db._parse_datamodel_for.cache_clear()
+        migrator._load_target_schema.cache_clear()
+
+    @pytest.mark.parametrize('from_document', [True, False])
+    def test_fresh_database_has_empty_plan(self, data_model, monkeypatch, from_document):
+        """Test init_db's schema, from the document or the hardcoded fallback, matches the target."""
+        if not from_document:
+            monkeypatch.setattr(init_db, '_DOC_PATH', data_model.with_name('missing.md'))
+        init_db.main()
+        monkeypatch.setattr(init_db, '_DOC_PATH', data_model)
+
+        with DatabaseMigrator(str(init_db._DB_PATH)) as db_migrator:
+            assert db_migrator.plan_migrations() == []
+
+    def test_applied_migration_skips_introspection(self, data_model):
+        """Test the next plan reuses the recorded state instead of reading the schema."""
+        init_db.main()
+        data_model.write_text(data_model.read_text(encoding='utf-8').replace(
+            'last_ingested_at TIMESTAMP', 'last_ingested_at TIMESTAMP, retries INTEGER DEFAULT 0', 1
+        ), encoding='utf-8')
+
+        with DatabaseMigrator(str(init_db._DB_PATH)) as db_migrator:
+            migrations = db_migrator.plan_migrations()
+            assert [m.operation for m in migrations] == ['add_column']
+            assert db_migrator.apply_migrations(migrations, dry_run=False)
+
+        with DatabaseMigrator(str(init_db._DB_PATH)) as db_migrator:
+            with patch.object(db_migrator, 'get_current_schema') as mock_schema:
+                assert db_migrator.plan_migrations() == []
+            mock_schema.assert_not_called()
+
+
+class TestTableRebuild:
+    """Test table rebuilds keep what PRAGMA table_info doesn't describe."""
+
+    @pytest.fixture
+    def temp_db(self, tmp_path):
+        """Database with a UNIQUE/AUTOINCREMENT table and a WITHOUT ROWID table."""
+        db_path = str(tmp_path / 'rebuild.db')
+        conn = sqlite3.connect(db_path)
+        conn.executescript('''
+        CREATE TABLE timeseries_macro (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            catalog_key TEXT NOT NULL,
+            date DATE NOT NULL,
+            value REAL,
+            UNIQUE(catalog_key, date)
+        );
+        CREATE TABLE news_tags (
+            fingerprint TEXT PRIMARY KEY,
+            tag TEXT NOT NULL, -- keyword, (lowercase)
+            weight REAL,
+            UNIQUE(fingerprint, tag),
+            FOREIGN KEY(fingerprint) REFERENCES news_intel_pool(fingerprint)
+        ) WITHOUT ROWID;
+        INSERT INTO timeseries_macro (catalog_key, date, value) VALUES ('K', '2024-01-01', 1.0);
+        INSERT INTO news_tags VALUES ('fp', 'fed', 0.5);
+        ''')
+        conn.commit()
+        conn.close()
+        return db_path
+
+    def test_rebuild_keeps_table_constraints(self, temp_db):
+        """Test a rebuild keeps UNIQUE, AUTOINCREMENT, FOREIGN KEY and WITHOUT ROWID."""
+        migrations = [
+            MigrationStep('change_type', 'timeseries_macro',
+                          {'column': 'value', 'old_type': 'REAL', 'new_type': 'NUMERIC'},
+                          'Change type of value in timeseries_macro'),
+            MigrationStep('change_type', 'news_tags',
+                          {'column': 'weight', 'old_type': 'REAL', 'new_type': 'NUMERIC'},
+                          'Change type of weight in news_tags'),
+            MigrationStep('rename_column', 'news_tags',
+                          {'old_name': 'tag', 'new_name': 'label'},
+                          'Rename tag to label in news_tags'),
+        ]
+
+        with DatabaseMigrator(temp_db) as db_migrator:
+            assert db_migrator.apply_migrations(migrations, dry_run=False)
+
+        conn = sqlite3.connect(temp_db)
+        tables = dict(conn.execute("SELECT name, sql FROM sqlite_master WHERE type = 'table'"))
+        assert 'AUTOINCREMENT' in tables['timeseries_macro']
+        assert tables['news_tags'].rstrip().endswith('WITHOUT ROWID')
+        assert 'REFERENCES news_intel_pool(fingerprint)' in tables['news_tags']
+        assert conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'timeseries_macro'").fetchone() == (1,)
+
+        # The cleaning pipeline's upsert needs the UNIQUE constraint
+        conn.execute('''
+            INSERT INTO timeseries_macro (catalog_key, date, value) VALUES ('K', '2024-01-01', 2.0)
+            ON CONFLICT(catalog_key, date) DO UPDATE SET value = excluded.value
+        ''')
+        assert conn.execute("SELECT id, value FROM timeseries_macro").fetchall() == [(1, 2)]
+
+        # The renamed column stays covered by its UNIQUE constraint
+        assert conn.execute("SELECT fingerprint, label, weight FROM news_tags").fetchall() == [('fp', 'fed', 0.5)]
+        with pytest.raises(sqlite3.IntegrityError):
+            conn.execute("INSERT INTO news_tags VALUES ('fp', 'fed', 1.0)")
+        conn.close()
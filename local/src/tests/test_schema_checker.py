@@ -0,0 +1,119 @@
+# filepath: local/src/tests/test_schema_checker.py
+
+"""Unit tests for schema_checker DDL parsing."""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import sqlite3
+
+from local.src.database.schema_checker import compare_schemas, parse_table_definition, read_schema
+
+
+class TestParseTableDefinition:
+    """Test parse_table_definition on the DDL shapes the data model uses."""
+
+    def test_multiline_ddl_with_comments(self):
+        """Test column extraction from formatted DDL with trailing comments."""
+        table_name, columns = parse_table_definition('''
+        CREATE TABLE IF NOT EXISTS sync_watermarks (
+            catalog_key TEXT PRIMARY KEY, -- FK to data_catalog, (unique)
+            last_ingested_at TIMESTAMP,
+            checksum TEXT
+        )
+        ''')
+
+        assert table_name == 'sync_watermarks'
+        assert columns == {
+            'catalog_key': 'TEXT PRIMARY KEY',
+            'last_ingested_at': 'TIMESTAMP',
+            'checksum': 'TEXT',
+        }
+
+    def test_single_line_normalized_ddl(self):
+        """Test DDL as produced by parse_datamodel_doc (whitespace collapsed)."""
+        table_name, columns = parse_table_definition(
+            "CREATE TABLE IF NOT EXISTS data_catalog ( catalog_key TEXT PRIMARY KEY, "
+            "config_params JSON DEFAULT '{}', is_active INTEGER DEFAULT 1 ) WITHOUT ROWID;"
+        )
+
+        assert table_name == 'data_catalog'
+        assert columns == {
+            'catalog_key': 'TEXT PRIMARY KEY',
+            'config_params': "JSON DEFAULT '{}'",
+            'is_active': 'INTEGER DEFAULT 1',
+        }
+
+    def test_nested_commas_and_table_constraints(self):
+        """Test commas inside parentheses/strings don't split and constraints are skipped."""
+        _, columns = parse_table_definition('''
+        CREATE TABLE timeseries_micro (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            price DECIMAL(10,2), label TEXT DEFAULT 'a,b',
+            UNIQUE(catalog_key, date),
+            FOREIGN KEY(catalog_key) REFERENCES data_catalog(catalog_key)
+        )
+        ''')
+
+        assert columns == {
+            'id': 'INTEGER PRIMARY KEY AUTOINCREMENT',
+            'price': 'DECIMAL(10,2)',
+            'label': "TEXT DEFAULT 'a,b'",
+        }
+
+    def test_not_a_create_table(self):
+        """Test non-DDL input returns no table."""
+        assert parse_table_definition("SELECT 1") == (None, {})
+
+
+class TestCompareSchemas:
+    """Test compare_schemas suggestions."""
+
+    def test_definitions_compare_case_insensitively(self):
+        """Test definitions differing only in case are not reported."""
+        doc_schema = {'data_catalog': {'catalog_key': 'TEXT PRIMARY KEY', 'is_active': 'integer default 1'}}
+        db_schema = {'data_catalog': {'catalog_key': 'TEXT PRIMARY KEY', 'is_active': 'INTEGER DEFAULT 1'}}
+
+        assert compare_schemas(doc_schema, db_schema) == {}
+
+    def test_without_rowid_primary_key_matches_document(self):
+        """Test the implied NOT NULL PRAGMA reports on WITHOUT ROWID keys is not a difference."""
+        ddl = "CREATE TABLE sync_watermarks ( catalog_key TEXT PRIMARY KEY, checksum TEXT ) WITHOUT ROWID;"
+        conn = sqlite3.connect(':memory:')
+        conn.execute(ddl)
+
+        table_name, doc_columns = parse_table_definition(ddl)
+        db_schema = read_schema(conn)
+        assert db_schema[table_name]['catalog_key'] == 'TEXT PRIMARY KEY NOT NULL'
+        assert compare_schemas({table_name: doc_columns}, db_schema) == {}
+        conn.close()
+
+    def test_constraints_pragma_cannot_report_are_ignored(self):
+        """Test AUTOINCREMENT and column constraints don't count as definition changes."""
+        doc_schema = {'timeseries_macro': {
+            'id': 'INTEGER PRIMARY KEY AUTOINCREMENT',
+            'catalog_key': 'TEXT NOT NULL REFERENCES data_catalog(catalog_key)',
+            'note': "TEXT DEFAULT 'not null'",
+        }}
+        db_schema = {'timeseries_macro': {
+            'id': 'INTEGER PRIMARY KEY',
+            'catalog_key': 'TEXT NOT NULL',
+            'note': "TEXT DEFAULT 'not null'",
+        }}
+
+        assert compare_schemas(doc_schema, db_schema) == {}
+
+    def test_missing_column_and_changed_definition(self):
+        """Test missing columns get ALTERs in document order and differences are flagged."""
+        doc_schema = {'sync_watermarks': {'catalog_key': 'TEXT', 'checksum': 'TEXT', 'status': 'TEXT', 'etag': 'TEXT'}}
+        db_schema = {'sync_watermarks': {'catalog_key': 'INTEGER'}}
+
+        assert compare_schemas(doc_schema, db_schema) == {'sync_watermarks': [
+            "ALTER TABLE sync_watermarks ADD COLUMN checksum TEXT;",
+            "ALTER TABLE sync_watermarks ADD COLUMN status TEXT;",
+            "ALTER TABLE sync_watermarks ADD COLUMN etag TEXT;",
+            "-- Column 'catalog_key' definition differs:",
+            "--   Document: TEXT",
+            "--   Database: INTEGER",
+        ]}
@@ -40,18 +40,14 @@ def main():
     migrator = DatabaseMigrator(args.db_path)
 
     try:
-        # Get schemas
-        print("📖 Reading current database schema...")
-        current_schema = migrator.get_current_schema()
-        print(f"   Found {len(current_schema)} tables")
-
         print("🎯 Reading target schema from Phase4_DataModel.md...")
         target_schema = migrator.parse_target_schema()
         print(f"   Found {len(target_schema)} tables in document")
 
-        # Calculate migrations
+        # Calculate migrations; the database schema is only read if it may
+        # have changed since the last applied migration
         print("⚖️  Calculating required migrations...")
-        migrations = migrator.calculate_migrations(current_schema, target_schema)
+        migrations = migrator.plan_migrations()
 
         if not migrations:
             print("✅ Schemas are already synchronized")
@@ -86,6 +82,9 @@ def main():
         import traceback
         traceback.print_exc()
 
+    finally:
+        migrator.close()
+
 
 if __name__ == "__main__":
     main()
\ No newline at end of file